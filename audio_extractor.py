@@ -2,44 +2,131 @@
 Audio extraction module for .mov files.
 .mov 파일에서 오디오를 추출하는 모듈입니다.
 """
+import asyncio
+import functools
+import logging
+import shutil
 import subprocess
 import os
+import queue
+import tempfile
+import threading
 from pathlib import Path
-from typing import List, Optional
+from typing import Callable, Iterator, List, Optional, Tuple, Union
 from tqdm import tqdm
 
+logger = logging.getLogger(__name__)
+
+
+@functools.lru_cache(maxsize=1)
+def _ensure_ffmpeg() -> str:
+    """ffmpeg가 PATH에 있는지 확인 (프로세스당 한 번만 검사)"""
+    ffmpeg_path = shutil.which("ffmpeg")
+    if ffmpeg_path is None:
+        raise RuntimeError(
+            "ffmpeg가 설치되어 있지 않습니다. "
+            "macOS: brew install ffmpeg\n"
+            "Ubuntu: sudo apt-get install ffmpeg\n"
+            "Windows: https://ffmpeg.org/download.html"
+        )
+    return ffmpeg_path
+
+
+@functools.lru_cache(maxsize=1)
+def _ensure_ffprobe() -> str:
+    """ffprobe가 PATH에 있는지 확인 (extract_stream의 파일별 길이 조회에 필요, 프로세스당 한 번만 검사)"""
+    ffprobe_path = shutil.which("ffprobe")
+    if ffprobe_path is None:
+        raise RuntimeError(
+            "ffprobe가 설치되어 있지 않습니다 (보통 ffmpeg와 함께 설치됩니다). "
+            "macOS: brew install ffmpeg\n"
+            "Ubuntu: sudo apt-get install ffmpeg\n"
+            "Windows: https://ffmpeg.org/download.html"
+        )
+    return ffprobe_path
+
+
+def split_cpu_sets() -> Optional[Tuple[set, set]]:
+    """
+    사용 가능한 CPU를 ffmpeg용과 Whisper용 두 집합으로 나눕니다.
+    추출과 전사가 겹칠 때 서로의 캐시를 밀어내지 않도록 하기 위함입니다.
+    
+    Returns:
+        (ffmpeg용 CPU 집합, Whisper용 CPU 집합). Linux가 아니거나 코어가 1개면 None
+    """
+    if not hasattr(os, "sched_getaffinity"):
+        return None
+    cpus = sorted(os.sched_getaffinity(0))
+    if len(cpus) < 2:
+        return None
+    half = len(cpus) // 2
+    return set(cpus[:half]), set(cpus[half:])
+
+
+def set_cpu_affinity(pid: int, cpus: Optional[set]):
+    """
+    프로세스를 지정한 CPU 집합에 고정합니다 (Linux 전용, 그 외에는 무시).
+    
+    Args:
+        pid: 프로세스 ID (0이면 현재 프로세스)
+        cpus: CPU 번호 집합 (None이면 무시)
+    """
+    if not cpus or not hasattr(os, "sched_setaffinity"):
+        return
+    try:
+        os.sched_setaffinity(pid, cpus)
+    except OSError as e:
+        # 이미 종료된 짧은 ffmpeg 프로세스 등
+        logger.debug(f"CPU affinity 설정 실패 (pid={pid}): {e}")
+
+
+def affinity_preexec(cpus: Optional[set]) -> Optional[Callable[[], None]]:
+    """
+    자식 프로세스가 exec 하기 전에 CPU 집합을 고정하는 preexec_fn을 만듭니다 (Linux 전용).
+    Popen 이후 pid로 고정하면 그 사이 ffmpeg가 만든 디코더/필터 스레드는 예전 마스크를 유지하므로,
+    exec 전에 고정해 이후 생기는 모든 스레드가 마스크를 물려받게 합니다.
+    
+    Args:
+        cpus: CPU 번호 집합 (None이면 고정 안 함)
+        
+    Returns:
+        Popen(preexec_fn=...)에 넘길 함수 (고정하지 않으면 None)
+    """
+    if not cpus or not hasattr(os, "sched_setaffinity"):
+        return None
+    cpus = frozenset(cpus)
+    return lambda: os.sched_setaffinity(0, cpus)
+
 
 class AudioExtractor:
     """오디오 추출 클래스"""
     
-    def __init__(self, audio_format: str = "wav", sample_rate: int = 16000):
+    def __init__(
+        self,
+        audio_format: str = "wav",
+        sample_rate: int = 16000,
+        cpu_affinity: Optional[set] = None
+    ):
         """
         AudioExtractor 초기화
         
         Args:
             audio_format: 출력 오디오 형식 ("mp3" 또는 "wav")
             sample_rate: 오디오 샘플레이트 (Hz)
+            cpu_affinity: ffmpeg 프로세스를 고정할 CPU 집합 (None이면 고정 안 함, Linux 전용)
         """
         self.audio_format = audio_format.lower()
         self.sample_rate = sample_rate
-        self._check_ffmpeg()
-    
-    def _check_ffmpeg(self):
-        """ffmpeg가 설치되어 있는지 확인"""
-        try:
-            subprocess.run(
-                ["ffmpeg", "-version"],
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                check=True
-            )
-        except (subprocess.CalledProcessError, FileNotFoundError):
-            raise RuntimeError(
-                "ffmpeg가 설치되어 있지 않습니다. "
-                "macOS: brew install ffmpeg\n"
-                "Ubuntu: sudo apt-get install ffmpeg\n"
-                "Windows: https://ffmpeg.org/download.html"
-            )
+        self.cpu_affinity = cpu_affinity
+        
+        # 형식별 코덱/확장자는 파일마다 분기하지 않도록 한 번만 결정
+        if self.audio_format == "mp3":
+            self._codec, self._suffix = "libmp3lame", ".mp3"
+        elif self.audio_format == "wav":
+            self._codec, self._suffix = "pcm_s16le", ".wav"
+        else:
+            raise ValueError(f"지원하지 않는 오디오 형식: {self.audio_format}")
+        _ensure_ffmpeg()
     
     def find_mov_files(self, input_folder: Path) -> List[Path]:
         """
@@ -54,83 +141,419 @@ class AudioExtractor:
         if not input_folder.exists():
             raise FileNotFoundError(f"입력 폴더를 찾을 수 없습니다: {input_folder}")
         
-        mov_files = list(input_folder.glob("*.mov"))
-        mov_files.extend(input_folder.glob("*.MOV"))
+        # 한 번의 디렉토리 순회로 .mov/.MOV 모두 찾기
+        with os.scandir(input_folder) as entries:
+            mov_files = [
+                Path(entry.path) for entry in entries
+                if entry.name.lower().endswith(".mov") and entry.is_file()
+            ]
         
         if not mov_files:
             print(f"경고: {input_folder}에서 .mov 파일을 찾을 수 없습니다.")
         
         return mov_files
     
+    def _build_command(
+        self,
+        video_path: Path,
+        output_folder: Optional[Path],
+        output_filename: Optional[str],
+        threads: Optional[int],
+        output_mode: str
+    ):
+        """
+        ffmpeg 명령어와 출력 경로를 구성합니다.
+        
+        Returns:
+            (ffmpeg 명령어 리스트, 출력 파일 경로 또는 None(pipe 모드))
+        """
+        if output_mode == "pipe":
+            # 디스크와 WAV 헤더 없이 stdout으로 raw PCM 출력
+            codec = "pcm_s16le"
+            output_args = ["-f", "s16le", "pipe:1"]
+            output_path = None
+        elif output_mode == "file":
+            # 출력 폴더 생성
+            output_folder.mkdir(parents=True, exist_ok=True)
+            
+            # 출력 파일명 생성
+            if output_filename is None:
+                output_path = output_folder / (video_path.stem + self._suffix)
+            else:
+                output_path = (output_folder / output_filename).with_suffix(self._suffix)
+            codec = self._codec
+            output_args = ["-y", str(output_path)]  # 파일 덮어쓰기 허용
+        else:
+            raise ValueError(f"지원하지 않는 출력 모드: {output_mode}")
+        
+        cmd = [
+            "ffmpeg",
+            "-nostats", "-loglevel", "error",  # 오류만 출력하여 stderr 버퍼를 작게 유지
+            "-i", str(video_path),
+        ]
+        if threads is not None:
+            cmd.extend(["-threads", str(threads)])
+        cmd.extend([
+            "-vn",  # 비디오 스트림 제거
+            "-acodec", codec,
+            "-ar", str(self.sample_rate),  # 샘플레이트
+            "-ac", "1",  # 모노 채널
+        ])
+        cmd.extend(output_args)
+        return cmd, output_path
+    
+    def _run_ffmpeg(self, cmd: List[str], capture_stdout: bool = False) -> bytes:
+        """
+        ffmpeg를 실행합니다 (cpu_affinity가 있으면 exec 전에 해당 CPU에 고정).
+        
+        Args:
+            cmd: ffmpeg 명령어 리스트
+            capture_stdout: True이면 stdout을 읽어서 반환
+            
+        Returns:
+            stdout 바이트 (capture_stdout=False이면 빈 바이트)
+        """
+        process = subprocess.Popen(
+            cmd,
+            stdout=subprocess.PIPE if capture_stdout else subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            preexec_fn=affinity_preexec(self.cpu_affinity)
+        )
+        stdout, stderr = process.communicate()
+        if process.returncode != 0:
+            raise subprocess.CalledProcessError(
+                process.returncode, cmd, output=stdout, stderr=stderr
+            )
+        return stdout or b""
+    
     def extract_audio(
+        self,
+        video_path: Path,
+        output_folder: Optional[Path] = None,
+        output_filename: Optional[str] = None,
+        threads: Optional[int] = 0,
+        output_mode: str = "file"
+    ) -> Union[Path, bytes]:
+        """
+        비디오 파일에서 오디오를 추출합니다.
+        
+        Args:
+            video_path: 비디오 파일 경로
+            output_folder: 오디오 파일 저장 폴더 (output_mode="pipe"이면 사용 안 함)
+            output_filename: 출력 파일명 (None이면 자동 생성)
+            threads: ffmpeg 스레드 수 (0이면 코어 수에 맞춰 자동, None이면 ffmpeg 기본값)
+            output_mode: "file"이면 파일로 저장, "pipe"이면 헤더 없는 s16le PCM 바이트를 반환
+            
+        Returns:
+            추출된 오디오 파일 경로 ("pipe"이면 raw PCM 바이트)
+        """
+        cmd, output_path = self._build_command(
+            video_path, output_folder, output_filename, threads, output_mode
+        )
+        
+        try:
+            if output_path is None:
+                logger.info(f"오디오 디코딩 중 (메모리): {video_path.name}")
+            else:
+                logger.info(f"오디오 추출 중: {video_path.name} -> {output_path.name}")
+            stdout = self._run_ffmpeg(cmd, capture_stdout=output_path is None)
+            if output_path is None:
+                return stdout
+            logger.info(f"완료: {output_path}")
+            return output_path
+        except subprocess.CalledProcessError as e:
+            error_msg = e.stderr.decode() if e.stderr else str(e)
+            raise RuntimeError(
+                f"오디오 추출 실패 ({video_path.name}): {error_msg}"
+            )
+    
+    async def extract_audio_async(
         self,
         video_path: Path,
         output_folder: Path,
-        output_filename: Optional[str] = None
+        threads: Optional[int] = 1
     ) -> Path:
         """
-        비디오 파일에서 오디오를 추출합니다.
+        extract_audio의 비동기 버전. 스레드를 막지 않고 ffmpeg 종료를 기다립니다.
         
         Args:
             video_path: 비디오 파일 경로
             output_folder: 오디오 파일 저장 폴더
-            output_filename: 출력 파일명 (None이면 자동 생성)
+            threads: ffmpeg 스레드 수
             
         Returns:
             추출된 오디오 파일 경로
         """
-        # 출력 폴더 생성
+        cmd, output_path = self._build_command(
+            video_path, output_folder, None, threads, "file"
+        )
+        process = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdout=asyncio.subprocess.DEVNULL,
+            stderr=asyncio.subprocess.PIPE,
+            preexec_fn=affinity_preexec(self.cpu_affinity)
+        )
+        _, stderr = await process.communicate()
+        if process.returncode != 0:
+            error_msg = stderr.decode() if stderr else f"return code {process.returncode}"
+            raise RuntimeError(
+                f"오디오 추출 실패 ({video_path.name}): {error_msg}"
+            )
+        return output_path
+    
+    def extract_batch(
+        self,
+        video_paths: List[Path],
+        output_folder: Path,
+        threads: Optional[int] = 0
+    ) -> List[Path]:
+        """
+        여러 비디오 파일의 오디오를 하나의 ffmpeg 프로세스로 추출합니다.
+        입력마다 -map으로 대응되는 출력 파일을 지정하여 프로세스 생성 비용을 한 번만 지불합니다.
+        배치 실행이 실패하면 파일별로 다시 추출합니다.
+        
+        Args:
+            video_paths: 비디오 파일 경로 리스트
+            output_folder: 오디오 파일 저장 폴더
+            threads: ffmpeg 스레드 수
+            
+        Returns:
+            추출된 오디오 파일 경로 리스트
+        """
+        if len(video_paths) == 1:
+            return [self.extract_audio(video_paths[0], output_folder, threads=threads)]
+        
         output_folder.mkdir(parents=True, exist_ok=True)
         
-        # 출력 파일명 생성
-        if output_filename is None:
-            output_filename = video_path.stem + f".{self.audio_format}"
+        cmd = ["ffmpeg", "-nostats", "-loglevel", "error"]
+        for video_path in video_paths:
+            cmd.extend(["-i", str(video_path)])
         
-        output_path = output_folder / output_filename
+        output_paths = []
+        for idx, video_path in enumerate(video_paths):
+            output_path = output_folder / (video_path.stem + self._suffix)
+            # -threads는 출력별 옵션이므로 출력마다 지정해야 모든 출력에 적용됨
+            if threads is not None:
+                cmd.extend(["-threads", str(threads)])
+            cmd.extend([
+                "-map", f"{idx}:a:0",
+                "-vn",  # 비디오 스트림 제거
+                "-acodec", self._codec,
+                "-ar", str(self.sample_rate),  # 샘플레이트
+                "-ac", "1",  # 모노 채널
+                "-y",  # 파일 덮어쓰기 허용
+                str(output_path)
+            ])
+            output_paths.append(output_path)
         
-        # ffmpeg 명령어 구성
-        if self.audio_format == "mp3":
-            codec = "libmp3lame"
-            output_path = output_path.with_suffix(".mp3")
-        elif self.audio_format == "wav":
-            codec = "pcm_s16le"
-            output_path = output_path.with_suffix(".wav")
-        else:
-            raise ValueError(f"지원하지 않는 오디오 형식: {self.audio_format}")
+        try:
+            print(f"오디오 일괄 추출 중: {len(video_paths)}개 파일")
+            self._run_ffmpeg(cmd)
+            return output_paths
+        except subprocess.CalledProcessError:
+            # 한 파일이라도 실패하면 전체 명령이 실패하므로 파일별로 재시도
+            print("일괄 추출 실패, 파일별로 다시 추출합니다.")
+            extracted = []
+            for video_path in video_paths:
+                try:
+                    extracted.append(self.extract_audio(video_path, output_folder, threads=threads))
+                except Exception as e:
+                    tqdm.write(f"오류 발생 ({video_path.name}): {e}")
+            return extracted
+    
+    def extract_audio_to_buffer(self, video_path: Path):
+        """
+        비디오 파일의 오디오를 디스크에 쓰지 않고 메모리로 바로 디코딩합니다.
+        ffmpeg의 raw PCM(s16le) 출력을 stdout 파이프로 받아 Whisper 입력 형식으로 변환합니다.
+        
+        Args:
+            video_path: 비디오 파일 경로
+            
+        Returns:
+            float32 모노 오디오 배열 (-1.0 ~ 1.0, sample_rate Hz)
+        """
+        data = self.extract_audio(video_path, output_mode="pipe")
+        return self.pcm_to_array(data)
+    
+    @staticmethod
+    def pcm_to_array(data: bytes):
+        """
+        s16le raw PCM 바이트를 Whisper 입력용 float32 배열로 변환합니다.
+        
+        Args:
+            data: s16le 모노 PCM 바이트
+            
+        Returns:
+            float32 오디오 배열 (-1.0 ~ 1.0)
+        """
+        import numpy as np
         
-        # ffmpeg 명령어 실행
+        return np.frombuffer(data, np.int16).astype(np.float32) / 32768.0
+    
+    def _probe_duration(self, video_path: Path) -> float:
+        """
+        ffprobe로 미디어 파일 길이(초)를 조회합니다.
+        
+        Args:
+            video_path: 비디오 파일 경로
+            
+        Returns:
+            길이 (초)
+        """
         cmd = [
-            "ffmpeg",
-            "-i", str(video_path),
-            "-vn",  # 비디오 스트림 제거
-            "-acodec", codec,
-            "-ar", str(self.sample_rate),  # 샘플레이트
-            "-ac", "1",  # 모노 채널
-            "-y",  # 파일 덮어쓰기 허용
-            str(output_path)
+            _ensure_ffprobe(),
+            "-v", "error",
+            "-show_entries", "format=duration",
+            "-of", "default=noprint_wrappers=1:nokey=1",
+            str(video_path)
         ]
-        
         try:
-            print(f"오디오 추출 중: {video_path.name} -> {output_path.name}")
-            subprocess.run(
+            result = subprocess.run(
                 cmd,
                 check=True,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.PIPE
             )
-            print(f"완료: {output_path}")
-            return output_path
-        except subprocess.CalledProcessError as e:
-            error_msg = e.stderr.decode() if e.stderr else str(e)
-            raise RuntimeError(
-                f"오디오 추출 실패 ({video_path.name}): {error_msg}"
-            )
+            return float(result.stdout.decode().strip())
+        except (subprocess.CalledProcessError, ValueError) as e:
+            raise RuntimeError(f"길이 조회 실패 ({video_path.name}): {e}")
+    
+    def extract_stream(
+        self,
+        mov_files: List[Path],
+        chunk_size: int = 1024 * 1024,
+        prefetch: int = 1
+    ) -> Iterator[Tuple[Path, bytes]]:
+        """
+        여러 비디오 파일을 하나의 ffmpeg(concat demuxer)로 이어서 디코딩하고,
+        파일 하나 분량의 PCM이 모일 때마다 바로 돌려줍니다.
+        stdout은 백그라운드 스레드가 계속 읽어 큐에 쌓으므로, 호출 측이 앞 파일을
+        전사하는 동안에도 ffmpeg는 파이프가 막히지 않고 다음 파일을 디코딩합니다.
+        
+        concat demuxer는 입력들의 오디오 코덱/채널 구성이 같아야 하므로
+        같은 장비로 녹화한 .mov 묶음에 사용하세요.
+        
+        Args:
+            mov_files: 비디오 파일 경로 리스트
+            chunk_size: stdout 읽기 단위 (바이트)
+            prefetch: 호출 측이 가져가기 전에 미리 디코딩해 둘 파일 수 (메모리 상한)
+            
+        Yields:
+            (비디오 파일 경로, 해당 파일의 s16le 모노 PCM 바이트)
+        """
+        if not mov_files:
+            return
+        _ensure_ffprobe()
+        
+        # ffprobe 길이로 파일별 바이트 경계 계산 (누적 반올림으로 오차 누적 방지)
+        bytes_per_sample = 2
+        boundaries = []
+        elapsed = 0.0
+        for mov_file in mov_files:
+            elapsed += self._probe_duration(mov_file)
+            boundaries.append(int(round(elapsed * self.sample_rate)) * bytes_per_sample)
+        
+        with tempfile.NamedTemporaryFile(
+            "w", suffix=".txt", delete=False, encoding="utf-8"
+        ) as list_file:
+            for mov_file in mov_files:
+                escaped = str(Path(mov_file).resolve()).replace("'", "'\\''")
+                list_file.write(f"file '{escaped}'\n")
+            list_path = list_file.name
+        
+        cmd = [
+            "ffmpeg",
+            "-nostats", "-loglevel", "error",
+            "-f", "concat",
+            "-safe", "0",
+            "-i", list_path,
+            "-vn",
+            "-f", "s16le",
+            "-acodec", "pcm_s16le",
+            "-ar", str(self.sample_rate),
+            "-ac", "1",
+            "pipe:1"
+        ]
+        
+        process = subprocess.Popen(
+            cmd,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            preexec_fn=affinity_preexec(self.cpu_affinity)
+        )
+        results = queue.Queue(maxsize=max(1, prefetch))
+        stop = threading.Event()
+        done = object()
+        
+        def put(item) -> bool:
+            # 호출 측이 중단하면(stop) 큐가 가득 차 있어도 빠져나옴
+            while not stop.is_set():
+                try:
+                    results.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+        
+        def reader():
+            try:
+                buffer = bytearray()
+                consumed = 0
+                idx = 0
+                last = len(mov_files) - 1
+                while True:
+                    chunk = process.stdout.read(chunk_size)
+                    if not chunk:
+                        break
+                    buffer.extend(chunk)
+                    while idx < last and consumed + len(buffer) >= boundaries[idx]:
+                        size = boundaries[idx] - consumed
+                        if not put((mov_files[idx], bytes(buffer[:size]))):
+                            return
+                        del buffer[:size]
+                        consumed += size
+                        idx += 1
+                
+                stderr = process.stderr.read()
+                process.wait()
+                if process.returncode != 0:
+                    error_msg = stderr.decode() if stderr else f"return code {process.returncode}"
+                    put(RuntimeError(f"스트림 추출 실패: {error_msg}"))
+                    return
+                
+                # 마지막 파일은 남은 바이트 전체
+                if idx <= last:
+                    put((mov_files[idx], bytes(buffer)))
+            except Exception as e:
+                put(e)
+            finally:
+                put(done)
+        
+        thread = threading.Thread(target=reader, daemon=True)
+        thread.start()
+        try:
+            while True:
+                item = results.get()
+                if item is done:
+                    break
+                if isinstance(item, Exception):
+                    raise item
+                yield item
+        finally:
+            stop.set()
+            if process.poll() is None:
+                process.kill()
+                process.wait()
+            thread.join()
+            os.unlink(list_path)
     
     def extract_all(
         self,
         input_folder: Path,
         output_folder: Path,
-        skip_existing: bool = True
+        skip_existing: bool = True,
+        max_workers: int = 1,
+        batch_size: int = 32
     ) -> List[Path]:
         """
         입력 폴더의 모든 .mov 파일에서 오디오를 추출합니다.
@@ -139,43 +562,125 @@ class AudioExtractor:
             input_folder: .mov 파일이 있는 폴더
             output_folder: 추출된 오디오 저장 폴더
             skip_existing: True이면 이미 추출된 파일 건너뛰기
+            max_workers: 동시에 실행할 ffmpeg 프로세스 수 (1이면 순차 처리)
+            batch_size: 순차 처리 시 ffmpeg 한 번에 넣을 파일 수 (1이면 파일별 실행)
             
         Returns:
             추출된 오디오 파일 경로 리스트
         """
-        mov_files = self.find_mov_files(input_folder)
-        
-        if not mov_files:
-            print("추출할 파일이 없습니다.")
-            return []
-        
         # 이미 추출된 파일 필터링
         files_to_process = []
         extracted_files = []
         
         if skip_existing:
-            for mov_file in mov_files:
-                expected_output = output_folder / f"{mov_file.stem}.{self.audio_format}"
-                if expected_output.exists():
-                    print(f"건너뛰기 (이미 추출됨): {mov_file.name}")
-                    extracted_files.append(expected_output)
-                else:
-                    files_to_process.append(mov_file)
+            if not input_folder.exists():
+                raise FileNotFoundError(f"입력 폴더를 찾을 수 없습니다: {input_folder}")
+            
+            # 입력/출력 폴더를 각각 한 번씩만 순회하며 바로 분류 (파일별 Path 생성/stat 없음)
+            existing_stems = set()
+            if output_folder.exists():
+                with os.scandir(output_folder) as entries:
+                    existing_stems = {
+                        entry.name[:-len(self._suffix)] for entry in entries
+                        if entry.name.endswith(self._suffix)
+                    }
+            
+            found = False
+            with os.scandir(input_folder) as entries:
+                for entry in entries:
+                    if not (entry.name.lower().endswith(".mov") and entry.is_file()):
+                        continue
+                    found = True
+                    stem = os.path.splitext(entry.name)[0]
+                    if stem in existing_stems:
+                        logger.info(f"건너뛰기 (이미 추출됨): {entry.name}")
+                        extracted_files.append(output_folder / (stem + self._suffix))
+                    else:
+                        files_to_process.append(Path(entry.path))
+            
+            if not found:
+                print(f"경고: {input_folder}에서 .mov 파일을 찾을 수 없습니다.")
+                print("추출할 파일이 없습니다.")
+                return []
         else:
-            files_to_process = mov_files
+            files_to_process = self.find_mov_files(input_folder)
+            if not files_to_process:
+                print("추출할 파일이 없습니다.")
+                return []
         
         if not files_to_process:
             print("모든 파일이 이미 추출되었습니다.")
             return extracted_files
         
+        # 동시 실행 수는 CPU 코어 수와 파일 수를 넘지 않도록 제한
+        workers = max(1, min(max_workers, os.cpu_count() or 1, len(files_to_process)))
+        
         # tqdm으로 진행률 표시하며 추출
         print(f"\n총 {len(files_to_process)}개의 파일을 추출합니다...")
-        for mov_file in tqdm(files_to_process, desc="오디오 추출 진행"):
-            try:
-                output_path = self.extract_audio(mov_file, output_folder)
-                extracted_files.append(output_path)
-            except Exception as e:
-                tqdm.write(f"오류 발생 ({mov_file.name}): {e}")
-                continue
+        if workers == 1:
+            # 명령행 길이를 적당히 유지하도록 batch_size개씩 묶어서 ffmpeg 한 번으로 처리
+            batch_size = max(1, batch_size)
+            with tqdm(total=len(files_to_process), desc="오디오 추출 진행", unit="파일",
+                      mininterval=1.0, smoothing=0.1) as pbar:
+                for start in range(0, len(files_to_process), batch_size):
+                    batch = files_to_process[start:start + batch_size]
+                    try:
+                        extracted_files.extend(self.extract_batch(batch, output_folder))
+                    except Exception as e:
+                        tqdm.write(f"오류 발생 ({', '.join(f.name for f in batch)}): {e}")
+                    pbar.update(len(batch))
+            
+            return extracted_files
+        
+        # 워커마다 ffmpeg 내부 스레드를 1개로 제한하여 코어 과점유 방지
+        print(f"병렬 추출: {workers}개 워커")
+        output_folder.mkdir(parents=True, exist_ok=True)
+        extracted_files.extend(
+            asyncio.run(self._extract_all_async(files_to_process, output_folder, workers))
+        )
+        
+        return extracted_files
+    
+    async def _extract_all_async(
+        self,
+        files_to_process: List[Path],
+        output_folder: Path,
+        workers: int
+    ) -> List[Path]:
+        """
+        세마포어로 동시 실행 수를 제한하면서 여러 ffmpeg를 비동기로 실행합니다.
         
+        Args:
+            files_to_process: 추출할 비디오 파일 리스트
+            output_folder: 오디오 파일 저장 폴더
+            workers: 동시에 실행할 ffmpeg 프로세스 수
+            
+        Returns:
+            추출에 성공한 오디오 파일 경로 리스트
+        """
+        semaphore = asyncio.Semaphore(workers)
+        
+        async def run_one(mov_file: Path) -> Path:
+            async with semaphore:
+                return await self.extract_audio_async(mov_file, output_folder, threads=1)
+        
+        with tqdm(total=len(files_to_process), desc="오디오 추출 진행", unit="파일",
+                  mininterval=1.0, smoothing=0.1) as pbar:
+            async def tracked(mov_file: Path) -> Path:
+                try:
+                    return await run_one(mov_file)
+                finally:
+                    pbar.update(1)
+            
+            results = await asyncio.gather(
+                *(tracked(mov_file) for mov_file in files_to_process),
+                return_exceptions=True
+            )
+        
+        extracted_files = []
+        for mov_file, result in zip(files_to_process, results):
+            if isinstance(result, Exception):
+                tqdm.write(f"오류 발생 ({mov_file.name}): {result}")
+            else:
+                extracted_files.append(result)
         return extracted_files
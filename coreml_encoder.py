@@ -0,0 +1,102 @@
+"""
+CoreML Whisper encoder module.
+whisper.cpp 방식으로 변환한 CoreML 인코더(.mlmodelc)를 Apple Neural Engine에서 실행하고,
+openai-whisper 모델의 encoder 자리에 끼워 넣어 디코딩은 기존 PyTorch 경로를 그대로 사용합니다.
+"""
+import shutil
+from pathlib import Path
+
+import numpy as np
+import torch
+
+
+class CoreMLEncoder(torch.nn.Module):
+    """openai-whisper AudioEncoder를 대체하는 CoreML 인코더 래퍼 클래스"""
+
+    def __init__(self, encoder_path: Path, compute_units: str = "CPU_AND_NE"):
+        """
+        CoreMLEncoder 초기화
+
+        Args:
+            encoder_path: CoreML 인코더 경로 (예: ggml-base-encoder.mlmodelc)
+            compute_units: coremltools ComputeUnit 이름 ("CPU_AND_NE", "ALL", "CPU_AND_GPU", "CPU_ONLY")
+        """
+        super().__init__()
+        try:
+            import coremltools as ct
+        except ImportError:
+            raise RuntimeError(
+                "coremltools가 설치되어 있지 않습니다. "
+                "pip install coremltools를 실행하세요."
+            )
+
+        encoder_path = Path(encoder_path)
+        if not encoder_path.exists():
+            raise FileNotFoundError(
+                f"CoreML 인코더를 찾을 수 없습니다: {encoder_path}\n"
+                f"whisper.cpp의 models/generate-coreml-model.sh로 변환한 뒤 .pt 파일 옆에 두세요."
+            )
+
+        units = getattr(ct.ComputeUnit, compute_units)
+        if encoder_path.suffix != ".mlmodelc":
+            # .mlpackage/.mlmodel은 실행할 때마다 컴파일되므로 옆에 .mlmodelc로 한 번 컴파일해 두고 재사용
+            encoder_path = self._compiled_path(ct, encoder_path)
+        if encoder_path.suffix == ".mlmodelc":
+            # 컴파일된 모델은 CompiledMLModel로 로드 (변환 없이 바로 실행)
+            self.mlmodel = ct.models.CompiledMLModel(str(encoder_path), compute_units=units)
+        else:
+            self.mlmodel = ct.models.MLModel(str(encoder_path), compute_units=units)
+    
+    @staticmethod
+    def _compiled_path(ct, source_path: Path) -> Path:
+        """
+        .mlpackage/.mlmodel을 같은 폴더의 .mlmodelc로 컴파일하고 그 경로를 반환합니다.
+        원본보다 새로운 .mlmodelc가 이미 있으면 다시 컴파일하지 않습니다.
+        
+        Args:
+            ct: coremltools 모듈
+            source_path: 컴파일 전 CoreML 모델 경로
+            
+        Returns:
+            .mlmodelc 경로 (컴파일할 수 없으면 원본 경로)
+        """
+        compiled_path = source_path.with_suffix(".mlmodelc")
+        if compiled_path.exists() and compiled_path.stat().st_mtime >= source_path.stat().st_mtime:
+            return compiled_path
+        
+        compile_model = getattr(getattr(ct, "utils", None), "compile_model", None)
+        if compile_model is None:
+            return source_path
+        try:
+            print(f"CoreML 모델 컴파일 중 (최초 1회): {compiled_path}")
+            if compiled_path.exists():
+                # 원본이 바뀌어 오래된 컴파일 결과는 지우고 다시 컴파일
+                shutil.rmtree(compiled_path)
+            return Path(compile_model(str(source_path), str(compiled_path)))
+        except Exception as e:
+            print(f"경고: CoreML 모델 컴파일 결과를 저장할 수 없습니다 (매번 컴파일): {e}")
+            return source_path
+
+    def forward(self, mel: torch.Tensor) -> torch.Tensor:
+        """
+        log-mel 스펙트로그램을 인코딩합니다.
+
+        Args:
+            mel: (n_mels, 3000) 또는 (batch, n_mels, 3000) 텐서
+
+        Returns:
+            (batch, 1500, n_state) 오디오 특징 (입력과 같은 dtype/device)
+        """
+        single = mel.ndim == 2
+        if single:
+            mel = mel.unsqueeze(0)
+
+        # CoreML 인코더는 배치 1 입력이므로 배치를 나눠서 실행
+        features = []
+        for item in mel.detach().cpu().float().numpy():
+            output = self.mlmodel.predict({"logmel_data": item[np.newaxis]})
+            features.append(next(iter(output.values())))
+
+        # 디코더가 mel과 같은 dtype(fp16/fp32)을 기대하므로 맞춰서 반환
+        result = torch.from_numpy(np.concatenate(features, axis=0)).to(device=mel.device, dtype=mel.dtype)
+        return result[0] if single else result
@@ -1,12 +1,15 @@
 """
 이미 전사된 파일들에 대해 SRT 파일 생성 스크립트
 """
+import logging
 import sys
 from pathlib import Path
 from config import Config
-from stt_transcriber import STTTranscriber
+from stt_server import get_transcriber
 from tqdm import tqdm
 
+logger = logging.getLogger(__name__)
+
 def main():
     """SRT 파일 생성"""
     Config.create_directories()
@@ -14,13 +17,17 @@ def main():
     audio_folder = Config.AUDIO_OUTPUT_FOLDER
     text_folder = Config.TEXT_OUTPUT_FOLDER
     
-    # STT Transcriber 초기화
-    transcriber = STTTranscriber(
+    # STT Transcriber 초기화 (STT_DAEMON=1이면 실행 중인 데몬에 연결)
+    transcriber = get_transcriber(
         model_type=Config.WHISPER_MODEL_TYPE,
         model_path=Config.WHISPER_MODEL_PATH,
         model_name=Config.WHISPER_MODEL_NAME,
         mlx_model_name=Config.MLX_MODEL_NAME,
-        hf_home_path=Config.HF_HOME_PATH
+        hf_home_path=Config.HF_HOME_PATH,
+        cache_folder=getattr(Config, 'TRANSCRIPT_CACHE_FOLDER', Config.PROJECT_ROOT / "cache"),
+        quantization=getattr(Config, 'WHISPER_QUANTIZATION', None),
+        mlx_fast_sdpa=getattr(Config, 'MLX_FAST_SDPA', False),
+        trim_short_mel=getattr(Config, 'WHISPER_TRIM_SHORT_MEL', False)
     )
     
     # .wav 파일 찾기
@@ -46,10 +53,14 @@ def main():
     print(f"SRT 파일 생성 대상: {len(files_to_process)}개 파일")
     print("=" * 60)
     
+    # 첫 파일 전에 모델을 미리 올려둠 (같은 transcriber를 루프 전체에서 재사용)
+    transcriber.warmup()
+    
     # SRT 파일 생성 (word_timestamps=True로 재전사)
-    for wav_file in tqdm(files_to_process, desc="SRT 파일 생성", unit="파일"):
+    for wav_file in tqdm(files_to_process, desc="SRT 파일 생성", unit="파일",
+                         mininterval=1.0, smoothing=0.1):
         try:
-            print(f"\n처리 중: {wav_file.name}")
+            logger.info(f"처리 중: {wav_file.name}")
             
             # word_timestamps=True로 재전사하여 SRT 생성
             transcriber.transcribe_audio(
@@ -61,12 +72,12 @@ def main():
             
             srt_file = text_folder / f"{wav_file.stem}_SRT.srt"
             if srt_file.exists():
-                print(f"✓ 완료: {srt_file.name}")
+                logger.info(f"✓ 완료: {srt_file.name}")
             else:
-                print(f"✗ 경고: SRT 파일이 생성되지 않았습니다: {wav_file.name}")
+                tqdm.write(f"✗ 경고: SRT 파일이 생성되지 않았습니다: {wav_file.name}")
                 
         except Exception as e:
-            print(f"✗ 오류 ({wav_file.name}): {e}")
+            tqdm.write(f"✗ 오류 ({wav_file.name}): {e}")
             continue
     
     print("\n" + "=" * 60)
@@ -74,6 +85,7 @@ def main():
     print("=" * 60)
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s %(message)s')
     try:
         main()
     except KeyboardInterrupt:
@@ -2,11 +2,84 @@
 Main script for audio extraction and STT transcription pipeline.
 오디오 추출 및 STT 전사 파이프라인의 메인 스크립트입니다.
 """
+import logging
 import sys
 from pathlib import Path
 from config import Config
-from audio_extractor import AudioExtractor
+from audio_extractor import AudioExtractor, split_cpu_sets, set_cpu_affinity
 from stt_transcriber import STTTranscriber
+from stt_server import daemon_enabled, get_transcriber
+from tqdm import tqdm
+
+
+def run_streaming(
+    extractor: AudioExtractor,
+    transcriber: STTTranscriber,
+    input_folder: Path,
+    text_output_folder: Path,
+    extract_srt: bool
+) -> int:
+    """
+    .mov 파일을 중간 WAV 파일 없이 메모리에서 바로 전사합니다.
+    하나의 ffmpeg가 파일들을 이어서 디코딩하는 동안 앞 파일을 전사하여 두 단계를 겹칩니다.
+    스트림 디코딩이 실패하면(코덱 구성이 다른 파일 등) 남은 파일은 파일별로 추출합니다.
+    
+    Args:
+        extractor: 오디오 추출기
+        transcriber: STT 전사기
+        input_folder: .mov 파일이 있는 폴더
+        text_output_folder: 전사 텍스트 저장 폴더
+        extract_srt: True이면 SRT 파일도 생성
+        
+    Returns:
+        전사 완료된 파일 수
+    """
+    mov_files = extractor.find_mov_files(input_folder)
+    files_to_process = [
+        f for f in mov_files
+        if not (text_output_folder / f"{f.stem}.txt").exists()
+    ]
+    
+    if not files_to_process:
+        print("모든 파일이 이미 전사되었습니다.")
+        return 0
+    
+    def transcribe(mov_file: Path, audio_array) -> bool:
+        try:
+            transcriber.transcribe_audio(
+                audio_path=mov_file,
+                output_folder=text_output_folder,
+                language="ko",
+                extract_srt=extract_srt,
+                audio_array=audio_array
+            )
+            return True
+        except Exception as e:
+            tqdm.write(f"  ✗ 오류 발생 ({mov_file.name}): {e}")
+            return False
+    
+    print(f"\n총 {len(files_to_process)}개의 파일을 스트리밍 전사합니다...")
+    transcribed_count = 0
+    streamed = 0
+    with tqdm(total=len(files_to_process), desc="스트리밍 전사 진행", unit="파일",
+              mininterval=1.0, smoothing=0.1) as pbar:
+        try:
+            for mov_file, pcm in extractor.extract_stream(files_to_process):
+                streamed += 1
+                transcribed_count += transcribe(mov_file, extractor.pcm_to_array(pcm))
+                pbar.update(1)
+        except RuntimeError as e:
+            tqdm.write(f"  ✗ 스트림 디코딩 실패, 남은 파일은 파일별로 추출합니다: {e}")
+            for mov_file in files_to_process[streamed:]:
+                try:
+                    audio_array = extractor.extract_audio_to_buffer(mov_file)
+                except Exception as e:
+                    tqdm.write(f"  ✗ 오류 발생 ({mov_file.name}): {e}")
+                else:
+                    transcribed_count += transcribe(mov_file, audio_array)
+                pbar.update(1)
+    
+    return transcribed_count
 
 
 def main():
@@ -24,6 +97,21 @@ def main():
     mlx_model_name = Config.MLX_MODEL_NAME
     audio_format = Config.AUDIO_FORMAT
     sample_rate = Config.AUDIO_SAMPLE_RATE
+    extract_jobs = getattr(Config, 'AUDIO_EXTRACT_JOBS', 1)
+    stream_audio = getattr(Config, 'STREAM_AUDIO_TO_STT', False)
+    transcript_cache_folder = getattr(Config, 'TRANSCRIPT_CACHE_FOLDER', Config.PROJECT_ROOT / "cache")
+    
+    # 스트리밍 모드에서는 extract_stream의 ffmpeg가 다음 파일을 디코딩하는 동안 현재 파일을
+    # 전사하므로, ffmpeg와 Whisper를 서로 다른 CPU 집합에 고정해 캐시 경합을 줄임 (Linux 전용).
+    # 데몬 모드에서는 Whisper가 데몬 프로세스에서 돌기 때문에 이 프로세스를 고정해도 의미가 없음
+    ffmpeg_cpus, stt_cpus = None, None
+    if stream_audio and getattr(Config, 'CPU_AFFINITY', False):
+        if daemon_enabled():
+            print("STT 데몬 사용 중이므로 CPU 고정을 건너뜁니다.")
+        else:
+            cpu_sets = split_cpu_sets()
+            if cpu_sets:
+                ffmpeg_cpus, stt_cpus = cpu_sets
     
     print("=" * 60)
     print("오디오 추출 및 STT 전사 파이프라인")
@@ -39,9 +127,49 @@ def main():
     else:
         print(f"OpenAI Whisper 모델: {whisper_model_path or whisper_model_name}")
     print(f"오디오 형식: {audio_format}")
+    print(f"추출 병렬 작업 수: {extract_jobs}")
+    if ffmpeg_cpus:
+        print(f"CPU 고정: ffmpeg {sorted(ffmpeg_cpus)} / Whisper {sorted(stt_cpus)}")
     print("=" * 60)
     print()
     
+    if stream_audio:
+        # WAV 파일을 디스크에 저장하지 않고 ffmpeg 출력을 바로 전사
+        print("[스트리밍 모드] .mov → 메모리 → 텍스트 전사")
+        print("-" * 60)
+        extractor = AudioExtractor(
+            audio_format=audio_format,
+            sample_rate=sample_rate,
+            cpu_affinity=ffmpeg_cpus
+        )
+        # 모델 로드 전에 고정해야 이후 생기는 Whisper 연산 스레드도 같은 CPU 집합을 물려받음
+        set_cpu_affinity(0, stt_cpus)
+        transcriber = get_transcriber(
+            model_type=whisper_model_type,
+            model_path=whisper_model_path,
+            model_name=whisper_model_name,
+            mlx_model_name=mlx_model_name,
+            hf_home_path=hf_home_path,
+            cache_folder=transcript_cache_folder,
+            quantization=getattr(Config, 'WHISPER_QUANTIZATION', None),
+            mlx_fast_sdpa=getattr(Config, 'MLX_FAST_SDPA', False),
+            trim_short_mel=getattr(Config, 'WHISPER_TRIM_SHORT_MEL', False)
+        )
+        transcriber.warmup()
+        transcribed_count = run_streaming(
+            extractor=extractor,
+            transcriber=transcriber,
+            input_folder=input_folder,
+            text_output_folder=text_output_folder,
+            extract_srt=Config.EXTRACT_SRT
+        )
+        print(f"\n총 {transcribed_count}개의 파일 전사 완료")
+        print()
+        print("=" * 60)
+        print("모든 작업이 완료되었습니다!")
+        print("=" * 60)
+        return
+    
     # 1단계: 오디오 추출
     print("[1단계] .mov 파일에서 오디오 추출")
     print("-" * 60)
@@ -53,7 +181,8 @@ def main():
     extracted_audio_files = extractor.extract_all(
         input_folder=input_folder,
         output_folder=audio_output_folder,
-        skip_existing=True  # 이미 추출된 파일 건너뛰기
+        skip_existing=True,  # 이미 추출된 파일 건너뛰기
+        max_workers=extract_jobs
     )
     
     if not extracted_audio_files:
@@ -66,14 +195,20 @@ def main():
     # 2단계: STT 전사
     print("[2단계] 오디오를 텍스트로 전사")
     print("-" * 60)
-    transcriber = STTTranscriber(
+    transcriber = get_transcriber(
         model_type=whisper_model_type,
         model_path=whisper_model_path,
         model_name=whisper_model_name,
         mlx_model_name=mlx_model_name,
-        hf_home_path=hf_home_path
+        hf_home_path=hf_home_path,
+        cache_folder=transcript_cache_folder,
+        quantization=getattr(Config, 'WHISPER_QUANTIZATION', None),
+        mlx_fast_sdpa=getattr(Config, 'MLX_FAST_SDPA', False),
+        trim_short_mel=getattr(Config, 'WHISPER_TRIM_SHORT_MEL', False)
     )
     
+    transcriber.warmup()
+    
     extract_srt = Config.EXTRACT_SRT
     
     transcribed_texts = transcriber.transcribe_all(
@@ -81,10 +216,12 @@ def main():
         output_folder=text_output_folder,
         language="ko",  # 한국어로 설정 (자동 감지하려면 None)
         skip_existing=True,  # 이미 전사된 파일 건너뛰기
-        extract_srt=extract_srt
+        extract_srt=extract_srt,
+        batch_size=getattr(Config, 'WHISPER_BATCH_SIZE', 1),
+        workers=getattr(Config, 'STT_PARALLEL', 1)
     )
     
-    print(f"\n총 {len(transcribed_texts)}개의 파일 전사 완료")
+    print(f"\n총 {len(transcribed_texts)}개의 파일 새로 전사 완료")
     print()
     print("=" * 60)
     print("모든 작업이 완료되었습니다!")
@@ -151,6 +288,26 @@ def update_config_from_args():
         choices=["mp3", "wav"],
         help="오디오 형식 (mp3 또는 wav)"
     )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        help="동시에 실행할 ffmpeg 추출 작업 수 (기본값: 1)"
+    )
+    parser.add_argument(
+        "--stream_audio",
+        action="store_true",
+        help="중간 WAV 파일 없이 ffmpeg 출력을 바로 전사"
+    )
+    parser.add_argument(
+        "--quiet",
+        action="store_true",
+        help="파일별 진행 로그를 숨기고 경고/오류만 출력"
+    )
+    parser.add_argument(
+        "--cpu_affinity",
+        action="store_true",
+        help="스트리밍 모드에서 ffmpeg와 Whisper를 서로 다른 CPU 집합에 고정 (Linux 전용, STT_DAEMON 사용 시 무시)"
+    )
     
     args = parser.parse_args()
     
@@ -166,9 +323,19 @@ def update_config_from_args():
         mlx_model_name=args.mlx_model_name,
         audio_format=args.audio_format
     )
+    if args.jobs:
+        Config.AUDIO_EXTRACT_JOBS = max(1, args.jobs)
+    if args.stream_audio:
+        Config.STREAM_AUDIO_TO_STT = True
+    if args.cpu_affinity:
+        Config.CPU_AFFINITY = True
+    if args.quiet:
+        logging.getLogger().setLevel(logging.WARNING)
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s %(message)s')
+    
     # 명령행 인자가 있으면 설정 업데이트
     if len(sys.argv) > 1:
         update_config_from_args()
@@ -2,6 +2,7 @@
 Main script for YouTube audio downloader.
 YouTube에서 오디오를 다운로드하는 메인 스크립트입니다.
 """
+import os
 import sys
 from pathlib import Path
 from config import Config
@@ -59,7 +60,9 @@ def main():
         csv_path=input_df_path,
         url_column="url",
         convert_to_wav=True,  # extracted_audio와 동일한 형식
-        skip_existing=True
+        skip_existing=True,
+        download_workers=4,  # 다운로드(네트워크)와 변환(CPU)을 겹쳐 실행
+        encode_workers=os.cpu_count() or 1
     )
     
     print()
@@ -2,75 +2,340 @@
 전체 파이프라인 실행 스크립트
 (1) record_text_raw → structured (.md/.html)
 (2) extracted_audio → transcribed (.txt) → structured (.md/.html)
-각 단계별 완료 상태를 log.csv에 기록
+각 단계별 완료 상태를 log.sqlite에 기록하고 종료 시 log.csv로 내보냄
 """
-import sys
+import atexit
 import csv
+import logging
+import os
+import queue
+import signal
+import sqlite3
+import sys
 import time
 from pathlib import Path
+from typing import Optional
 from datetime import datetime
+from logging.handlers import QueueHandler, QueueListener
 from config import Config
 from text_processor import TextProcessor
 from stt_transcriber import STTTranscriber
-from main_record_processor import build_record_prompt
-from main_text_processor import main as process_transcribed_texts
+from text_pipeline import build_processing_kwargs
+
+# 파일별 진행 메시지용 로거 (PipelineLogger와 구분하기 위해 log로 명명)
+log = logging.getLogger(__name__)
+
+
+def _start_log_listener() -> QueueListener:
+    """
+    루트 로거를 큐에 연결하고 백그라운드 스레드에서 stderr로 출력합니다.
+    파일별 루프가 터미널 출력 지연에 막히지 않도록 하기 위함입니다.
+    
+    Returns:
+        시작된 QueueListener (종료 시 stop() 호출)
+    """
+    log_queue = queue.Queue(-1)
+    stream_handler = logging.StreamHandler(sys.stderr)
+    stream_handler.setFormatter(logging.Formatter('%(message)s'))
+    listener = QueueListener(log_queue, stream_handler)
+    
+    root = logging.getLogger()
+    root.addHandler(QueueHandler(log_queue))
+    root.setLevel(logging.INFO)
+    listener.start()
+    return listener
 
 
 class PipelineLogger:
-    """파이프라인 진행 상황 로거"""
+    """
+    파이프라인 진행 상황 로거
+    상태는 log.sqlite(WAL 모드)에 저장하고 filename 기본키 인덱스로 한 행씩 갱신합니다.
+    완료 시점 입력 파일의 (mtime_ns, size)도 함께 저장해서 내용이 바뀐 파일은 다시 처리합니다.
+    log.csv는 save()에서 실행 종료 시 한 번만 내보냅니다.
+    """
+    
+    STAGES = ['extracted_audio', 'record_text_raw', 'transcribed', 'structured']
+    STAGE_INDEX = {stage: idx for idx, stage in enumerate(STAGES)}
     
     def __init__(self, log_path: Path):
         self.log_path = log_path
-        self.records = {}
-        self._load_existing_log()
+        self.db_path = log_path.with_suffix('.sqlite')
+        self.log_path.parent.mkdir(parents=True, exist_ok=True)
+        
+        # isolation_level=None: 문장마다 자동 커밋 (mark_complete 한 번이 곧 한 트랜잭션)
+        self._db = sqlite3.connect(self.db_path, isolation_level=None)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        # WAL에서는 NORMAL이어도 중단 시 DB가 손상되지 않음 (커밋마다 fsync 생략)
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        columns = ", ".join(f"{stage} TEXT" for stage in self.STAGES)
+        self._db.execute(f"CREATE TABLE IF NOT EXISTS log(filename TEXT PRIMARY KEY, {columns})")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS fingerprint("
+            "stage TEXT, source TEXT, mtime_ns INTEGER, size INTEGER, PRIMARY KEY(stage, source))"
+        )
+        
+        if self._db.execute("SELECT 1 FROM log LIMIT 1").fetchone() is None:
+            self._load_existing_log()
+    
+    def _stage_column(self, stage: str) -> str:
+        """SQL에 넣을 단계 컬럼명 (STAGES에 있는 이름만 허용)"""
+        if stage not in self.STAGE_INDEX:
+            raise ValueError(f"알 수 없는 단계: {stage}")
+        return stage
+    
+    @classmethod
+    def _export_sql(cls) -> str:
+        """
+        log.csv 한 줄(\r\n 포함)을 돌려주는 SELECT 문
+        파일명은 csv 최소 인용 규칙을 따름: 구분자/따옴표/줄바꿈이 있을 때만 따옴표로 감쌈
+        """
+        quoted_name = (
+            "CASE WHEN instr(filename, ',') OR instr(filename, '\"') "
+            "OR instr(filename, char(13)) OR instr(filename, char(10)) "
+            "THEN '\"' || replace(filename, '\"', '\"\"') || '\"' ELSE filename END"
+        )
+        stages = " || ',' || ".join(f"IFNULL({stage}, '')" for stage in cls.STAGES)
+        return f"SELECT {quoted_name} || ',' || {stages} || char(13, 10) FROM log ORDER BY filename"
     
     def _load_existing_log(self):
-        """기존 로그 파일 읽기"""
-        if self.log_path.exists():
+        """DB가 비어 있으면 기존 log.csv를 가져오기 (같은 파일명이 여러 줄이면 마지막 줄이 최신 상태)"""
+        if not self.log_path.exists():
+            return
+        columns = ", ".join(self.STAGES)
+        placeholders = ", ".join("?" * (len(self.STAGES) + 1))
+        try:
+            with open(self.log_path, 'r', encoding='utf-8-sig') as f:
+                rows = [
+                    [row['filename']] + ['O' if row.get(stage) == 'O' else None for stage in self.STAGES]
+                    for row in csv.DictReader(f)
+                ]
+            with self._db:
+                self._db.execute("BEGIN")
+                self._db.executemany(
+                    f"INSERT OR REPLACE INTO log(filename, {columns}) VALUES ({placeholders})",
+                    rows
+                )
+        except Exception as e:
+            print(f"기존 로그 파일 읽기 오류 (새로 시작): {e}")
+            self._db.execute("DELETE FROM log")
+    
+    @staticmethod
+    def _source_key(path: Path) -> str:
+        """
+        fingerprint 테이블의 입력 파일 키 (전체 경로)
+        record_text_raw/X.txt와 transcribed/X.txt처럼 이름이 같은 입력이 서로의 기록을 덮어쓰지 않도록 합니다.
+        """
+        return str(path.resolve())
+    
+    def is_done(self, path: Path, stage: str, filename: Optional[str] = None) -> Optional[bool]:
+        """
+        입력 파일이 마지막 완료 시점 이후 바뀌지 않았는지 확인합니다.
+        stat 한 번과 기본키 조회로 판단하며, 바뀐 경우 기록을 지워 다시 처리되게 합니다.
+        
+        Args:
+            path: 단계의 입력 파일
+            stage: 단계 이름
+            filename: 로그 행 파일명 (기본값: path.name)
+            
+        Returns:
+            True (완료, 변경 없음), False (미완료 또는 변경됨), None (기록 없음: 기존 방식으로 확인)
+        """
+        column = self._stage_column(stage)
+        source_key = self._source_key(path)
+        stored = self._db.execute(
+            "SELECT mtime_ns, size FROM fingerprint WHERE stage = ? AND source = ?",
+            (stage, source_key)
+        ).fetchone()
+        if stored is None:
+            return None
+        
+        try:
+            st = path.stat()
+        except OSError:
+            return False
+        if stored == (st.st_mtime_ns, st.st_size):
+            return True
+        
+        # 내용이 바뀌었으므로 완료 표시와 기록 제거
+        with self._db:
+            self._db.execute("BEGIN")
+            self._db.execute("DELETE FROM fingerprint WHERE stage = ? AND source = ?", (stage, source_key))
+            self._db.execute(f"UPDATE log SET {column} = NULL WHERE filename = ?", (filename or path.name,))
+        return False
+    
+    def mark_complete(self, filename: str, stage: str, source: Optional[Path] = None):
+        """
+        단계 완료 표시 (해당 파일의 한 행만 갱신하고 바로 커밋)
+        
+        Args:
+            filename: 로그 행 파일명
+            stage: 단계 이름
+            source: 단계의 입력 파일 (주어지면 현재 mtime/size를 기록)
+        """
+        column = self._stage_column(stage)
+        fingerprint = None
+        if source is not None:
             try:
-                with open(self.log_path, 'r', encoding='utf-8-sig') as f:
-                    reader = csv.DictReader(f)
-                    for row in reader:
-                        filename = row['filename']
-                        self.records[filename] = {
-                            'extracted_audio': row.get('extracted_audio', ''),
-                            'record_text_raw': row.get('record_text_raw', ''),
-                            'transcribed': row.get('transcribed', ''),
-                            'structured': row.get('structured', '')
-                        }
-            except Exception as e:
-                print(f"기존 로그 파일 읽기 오류 (새로 시작): {e}")
-                self.records = {}
-    
-    def mark_complete(self, filename: str, stage: str):
-        """단계 완료 표시"""
-        if filename not in self.records:
-            self.records[filename] = {
-                'extracted_audio': '',
-                'record_text_raw': '',
-                'transcribed': '',
-                'structured': ''
-            }
-        self.records[filename][stage] = 'O'
+                st = source.stat()
+                fingerprint = (stage, self._source_key(source), st.st_mtime_ns, st.st_size)
+            except OSError:
+                pass
+        
+        with self._db:
+            self._db.execute("BEGIN")
+            self._db.execute(
+                f"INSERT INTO log(filename, {column}) VALUES (?, 'O') "
+                f"ON CONFLICT(filename) DO UPDATE SET {column} = 'O' WHERE {column} IS NOT 'O'",
+                (filename,)
+            )
+            if fingerprint is not None:
+                self._db.execute("INSERT OR REPLACE INTO fingerprint VALUES (?, ?, ?, ?)", fingerprint)
+    
+    def close(self):
+        """DB 연결 닫기"""
+        if self._db is not None:
+            self._db.close()
+            self._db = None
     
     def save(self):
-        """로그 파일 저장"""
-        self.log_path.parent.mkdir(parents=True, exist_ok=True)
+        """
+        log.csv 내보내기 후 DB 연결 닫기 (파일명 순으로 DB에서 한 행씩 읽어 기록)
+        임시 파일에 쓴 뒤 os.replace로 교체하여 중간에 종료되어도 log.csv가 잘리지 않습니다.
+        이미 저장(연결 종료)한 뒤 다시 호출하면 아무것도 하지 않습니다.
+        """
+        if self._db is None:
+            return
+        tmp_path = self.log_path.with_suffix('.csv.tmp')
         
-        with open(self.log_path, 'w', encoding='utf-8-sig', newline='') as f:
-            writer = csv.writer(f)
-            writer.writerow(['filename', 'extracted_audio', 'record_text_raw', 
-                           'transcribed', 'structured'])
-            
-            for filename in sorted(self.records.keys()):
-                record = self.records[filename]
-                writer.writerow([
-                    filename,
-                    record.get('extracted_audio', ''),
-                    record.get('record_text_raw', ''),
-                    record.get('transcribed', ''),
-                    record.get('structured', '')
-                ])
+        # CSV 한 줄을 SQLite 안에서 문자열로 조합해서 Python은 받은 줄을 쓰기만 함 (행마다 리스트/join 없음)
+        # 단계 값은 'O' 또는 NULL뿐이므로 IFNULL로 충분
+        # (csv.writer와 같은 결과: 필요한 경우에만 파일명 인용, \r\n 줄바꿈)
+        cursor = self._db.execute(self._export_sql())
+        with open(tmp_path, 'w', encoding='utf-8-sig', newline='') as f:
+            f.write(','.join(['filename'] + self.STAGES) + '\r\n')
+            f.writelines(line for (line,) in cursor)
+            f.flush()
+            os.fsync(f.fileno())
+        
+        os.replace(tmp_path, self.log_path)
+        self.close()
+
+
+# 같은 프로세스에서 파이프라인을 다시 실행해도 모델을 재로드하지 않도록 보관
+_TRANSCRIBER: Optional[STTTranscriber] = None
+
+
+def _get_transcriber() -> STTTranscriber:
+    """
+    Config 설정으로 STTTranscriber를 생성합니다 (프로세스당 한 번만 모델 로드).
+    
+    Returns:
+        STTTranscriber
+    """
+    global _TRANSCRIBER
+    if _TRANSCRIBER is None:
+        _TRANSCRIBER = STTTranscriber(
+            model_type=Config.WHISPER_MODEL_TYPE,
+            model_path=Config.WHISPER_MODEL_PATH,
+            model_name=Config.WHISPER_MODEL_NAME,
+            mlx_model_name=Config.MLX_MODEL_NAME,
+            hf_home_path=Config.HF_HOME_PATH,
+            quantization=getattr(Config, 'WHISPER_QUANTIZATION', None),
+            mlx_fast_sdpa=getattr(Config, 'MLX_FAST_SDPA', False),
+            trim_short_mel=getattr(Config, 'WHISPER_TRIM_SHORT_MEL', False)
+        )
+    return _TRANSCRIBER
+
+
+def _existing_md_bases(folder: Path) -> set:
+    """
+    폴더의 .md 파일명에서 '_' 뒤에 오는 모든 꼬리 부분을 한 번의 scandir로 모읍니다.
+    파일마다 glob(f"*_{base_name}.md")를 호출하는 대신 집합 조회로 같은 판정을 합니다.
+    
+    Args:
+        folder: 구조화 결과 폴더
+        
+    Returns:
+        '*_{base}.md'에 해당하는 base 집합
+    """
+    bases = set()
+    if not folder.exists():
+        return bases
+    with os.scandir(folder) as entries:
+        for entry in entries:
+            if not entry.name.endswith('.md'):
+                continue
+            stem = entry.name[:-3]
+            idx = stem.find('_')
+            while idx != -1:
+                bases.add(stem[idx + 1:])
+                idx = stem.find('_', idx + 1)
+    return bases
+
+
+def _scan_files(folder: Path, *suffixes: str) -> list:
+    """
+    os.scandir 한 번으로 이름이 suffixes 중 하나로 끝나는 파일을 찾습니다.
+    glob처럼 항목마다 fnmatch를 거치지 않고, 일치하는 항목만 Path로 만듭니다.
+    
+    Args:
+        folder: 검색할 폴더
+        *suffixes: 파일명 끝부분 (예: ".wav", "_SRT.srt")
+        
+    Returns:
+        파일 경로 리스트
+    """
+    if not folder.exists():
+        return []
+    with os.scandir(folder) as entries:
+        return [
+            Path(entry.path) for entry in entries
+            if entry.name.endswith(suffixes) and entry.is_file()
+        ]
+
+
+def _list_names(folder: Path) -> frozenset:
+    """폴더의 파일명 집합 (파일마다 exists()를 호출하지 않도록 한 번만 나열)"""
+    if not folder.exists():
+        return frozenset()
+    return frozenset(os.listdir(folder))
+
+
+def _run_structuring(processor: TextProcessor, tasks: list, logger: PipelineLogger) -> int:
+    """
+    GPT 구조화 요청을 TextProcessor.structure_files로 동시에 실행합니다.
+    로그 기록과 완료 메시지는 메인 스레드에서 파일이 끝나는 순서대로 바로 처리하므로
+    도중에 종료되어도 이미 저장된 파일의 완료 기록은 남습니다.
+    
+    Args:
+        processor: TextProcessor
+        tasks: (text_file, 로그 파일명, 로그 단계 리스트, process_single_file 인자) 리스트
+        logger: 파이프라인 로거
+        
+    Returns:
+        성공한 파일 수
+    """
+    processed_count = 0
+    
+    def on_result(index: int, result, error):
+        nonlocal processed_count
+        text_file, log_name, stages, _ = tasks[index]
+        if error is not None or not result:
+            log.warning(f"✗ 실패 ({text_file.name}): {error}")
+            return
+        for stage in stages:
+            logger.mark_complete(log_name, stage, source=text_file)
+        processed_count += 1
+        log.info(f"✓ 완료: {text_file.name}")
+    
+    # structure_text_file 내부에서 파일별 진행 메시지를 출력함
+    processor.structure_files(
+        [(text_file, kwargs) for text_file, _, _, kwargs in tasks],
+        max_concurrency=max(1, getattr(Config, 'GPT_CONCURRENCY', 4)),
+        render_workers=getattr(Config, 'RENDER_WORKERS', 1),
+        on_result=on_result
+    )
+    return processed_count
 
 
 def process_record_texts(logger: PipelineLogger):
@@ -79,30 +344,23 @@ def process_record_texts(logger: PipelineLogger):
     print("[1단계] record_text_raw → structured (.md/.html)")
     print("=" * 60)
     
-    Config.create_directories()
-    
     record_folder = Config.RECORD_TEXT_RAW_FOLDER
     output_folder = Config.STRUCTURED_OUTPUT_FOLDER
     api_key_path = Config.API_KEY_PATH
     api_key_file = Config.OPENAI_API_KEY_FILE
     model = Config.GPT_MODEL
     
-    # 레코드 텍스트용 프롬프트 구성
-    (context_query, main_query, additional_query, 
-     math_specific_query, example_query, tone_query) = build_record_prompt()
-    
-    token_range = Config.TOKEN_RANGE
-    language = Config.LANGUAGE
-    style = Config.OUTPUT_STYLE
-    save_html = Config.SAVE_HTML
-    html_template = Config.HTML_TEMPLATE
+    # 레코드 텍스트용 프롬프트와 구조화 옵션 (Config는 루프 전에 한 번만 읽음)
+    process_kwargs = build_processing_kwargs("record")
     
     # TextProcessor 초기화
     try:
         processor = TextProcessor(
             api_key_path=api_key_path if api_key_path else None,
             api_key_file=api_key_file,
-            model=model
+            model=model,
+            requests_per_minute=getattr(Config, 'GPT_RPM_LIMIT', None),
+            tokens_per_minute=getattr(Config, 'GPT_TPM_LIMIT', None)
         )
     except Exception as e:
         print(f"초기화 실패: {e}")
@@ -117,51 +375,23 @@ def process_record_texts(logger: PipelineLogger):
     
     print(f"총 {len(text_files)}개의 파일을 처리합니다.\n")
     
-    processed_count = 0
+    # 이미 처리된 파일 확인용 (출력 폴더는 한 번만 나열)
+    existing_md_bases = _existing_md_bases(output_folder)
+    
+    tasks = []
     for text_file in text_files:
-        try:
-            # 이미 처리된 파일 확인
-            base_name = text_file.stem
-            existing_md = list(output_folder.glob(f"*_{base_name}.md"))
-            
-            if existing_md:
-                print(f"건너뛰기 (이미 처리됨): {text_file.name}")
-                logger.mark_complete(text_file.name, 'record_text_raw')
-                logger.mark_complete(text_file.name, 'structured')
-                continue
-            
-            # process_single_file 내부에서 메시지 출력하므로 여기서는 출력하지 않음
-            result = processor.process_single_file(
-                text_file=text_file,
-                output_folder=output_folder,
-                context_query=context_query,
-                main_query=main_query,
-                additional_query=additional_query,
-                math_specific_query=math_specific_query,
-                example_query=example_query,
-                tone_query=tone_query,
-                token_range=token_range,
-                language=language,
-                style=style,
-                save_html=save_html,
-                html_template=html_template
-            )
-            
-            if result:
-                logger.mark_complete(text_file.name, 'record_text_raw')
-                logger.mark_complete(text_file.name, 'structured')
-                processed_count += 1
-                logger.save()  # 중간 저장
-                print(f"✓ 완료: {text_file.name}\n")
-            else:
-                print(f"✗ 실패: {text_file.name}\n")
-                
-        except Exception as e:
-            print(f"✗ 오류 ({text_file.name}): {e}\n")
+        # 이미 처리된 파일 확인 (기록이 있으면 내용 변경 여부로, 없으면 출력 파일명으로)
+        done = logger.is_done(text_file, 'structured')
+        if done or (done is None and text_file.stem in existing_md_bases):
+            log.info(f"건너뛰기 (이미 처리됨): {text_file.name}")
+            logger.mark_complete(text_file.name, 'record_text_raw', source=text_file)
+            logger.mark_complete(text_file.name, 'structured', source=text_file)
             continue
+        tasks.append((text_file, text_file.name, ['record_text_raw', 'structured'], process_kwargs))
+    
+    processed_count = _run_structuring(processor, tasks, logger)
     
     print(f"\n[1단계 완료] {processed_count}개 파일 처리")
-    logger.save()
     return True
 
 
@@ -171,8 +401,6 @@ def process_audio_files(logger: PipelineLogger):
     print("[2단계] extracted_audio → transcribed → structured")
     print("=" * 60)
     
-    Config.create_directories()
-    
     audio_folder = Config.AUDIO_OUTPUT_FOLDER
     text_folder = Config.TEXT_OUTPUT_FOLDER
     structured_folder = Config.STRUCTURED_OUTPUT_FOLDER
@@ -181,24 +409,10 @@ def process_audio_files(logger: PipelineLogger):
     print("\n[2-1] 오디오 → 텍스트 전사")
     print("-" * 60)
     
-    whisper_model_type = Config.WHISPER_MODEL_TYPE
-    hf_home_path = Config.HF_HOME_PATH
-    whisper_model_path = Config.WHISPER_MODEL_PATH
-    whisper_model_name = Config.WHISPER_MODEL_NAME
-    mlx_model_name = Config.MLX_MODEL_NAME
     extract_srt = Config.EXTRACT_SRT
     
-    # STT Transcriber 초기화
-    transcriber = STTTranscriber(
-        model_type=whisper_model_type,
-        model_path=whisper_model_path,
-        model_name=whisper_model_name,
-        mlx_model_name=mlx_model_name,
-        hf_home_path=hf_home_path
-    )
-    
     # .wav 파일 찾기
-    wav_files = list(audio_folder.glob("*.wav"))
+    wav_files = _scan_files(audio_folder, ".wav")
     
     if not wav_files:
         print("처리할 오디오 파일이 없습니다.")
@@ -211,43 +425,59 @@ def process_audio_files(logger: PipelineLogger):
     # 이미 전사된 파일 필터링 및 SRT 파일 확인
     files_to_transcribe = []
     files_to_generate_srt = []  # txt는 있지만 SRT가 없는 파일들
+    existing_texts = _list_names(text_folder)
     
     for wav_file in wav_files:
-        expected_txt = text_folder / f"{wav_file.stem}.txt"
-        expected_srt = text_folder / f"{wav_file.stem}_SRT.srt"
-        
-        if expected_txt.exists():
+        # 기록이 있으면 wav 내용 변경 여부로, 없으면 txt 존재 여부로 판단
+        done = logger.is_done(wav_file, 'transcribed')
+        if done is False:
+            # wav가 바뀌었으면 예전 전사 결과를 지워서 transcribe_audio가 건너뛰지 않고 다시 쓰게 함
+            for stale_name in (f"{wav_file.stem}.txt", f"{wav_file.stem}_SRT.srt"):
+                if stale_name in existing_texts:
+                    (text_folder / stale_name).unlink(missing_ok=True)
+                    log.info(f"변경된 오디오의 이전 전사 결과 삭제: {stale_name}")
+        if done or (done is None and f"{wav_file.stem}.txt" in existing_texts):
             # txt 파일은 있지만 SRT 파일이 없고 extract_srt가 True인 경우
-            if extract_srt and not expected_srt.exists():
+            if extract_srt and f"{wav_file.stem}_SRT.srt" not in existing_texts:
                 files_to_generate_srt.append(wav_file)
-                print(f"SRT 생성 필요: {wav_file.name} (txt는 있지만 SRT 없음)")
+                log.info(f"SRT 생성 필요: {wav_file.name} (txt는 있지만 SRT 없음)")
             else:
-                print(f"건너뛰기 (이미 전사됨): {wav_file.name}")
-            logger.mark_complete(wav_file.name, 'transcribed')
+                log.info(f"건너뛰기 (이미 전사됨): {wav_file.name}")
+            logger.mark_complete(wav_file.name, 'transcribed', source=wav_file)
         else:
             files_to_transcribe.append(wav_file)
     
+    # 전사할 파일이 있을 때만 모델 로드 (모두 전사된 경우 로드 생략)
+    if files_to_generate_srt or files_to_transcribe:
+        transcriber = _get_transcriber()
+    
     # SRT 파일만 생성이 필요한 경우 처리
     if files_to_generate_srt:
         print(f"\nSRT 파일 생성: {len(files_to_generate_srt)}개 파일")
         print("-" * 60)
+        attempted = []
         for wav_file in files_to_generate_srt:
             try:
-                print(f"SRT 생성 중: {wav_file.name}")
+                log.info(f"SRT 생성 중: {wav_file.name}")
                 transcriber.transcribe_audio(
                     audio_path=wav_file,
                     output_folder=text_folder,
                     language="ko",
                     extract_srt=True  # SRT 파일만 생성 (txt는 이미 있음)
                 )
-                expected_srt = text_folder / f"{wav_file.stem}_SRT.srt"
-                if expected_srt.exists():
-                    print(f"✓ SRT 생성 완료: {expected_srt.name}")
-                else:
-                    print(f"✗ 경고: SRT 파일이 생성되지 않았습니다: {wav_file.name}")
+                attempted.append(wav_file)
             except Exception as e:
-                print(f"✗ SRT 생성 실패 ({wav_file.name}): {e}")
+                log.warning(f"✗ SRT 생성 실패 ({wav_file.name}): {e}")
                 continue
+        
+        # 생성 결과는 폴더를 한 번만 나열해서 확인
+        existing_texts = _list_names(text_folder)
+        for wav_file in attempted:
+            srt_name = f"{wav_file.stem}_SRT.srt"
+            if srt_name in existing_texts:
+                log.info(f"✓ SRT 생성 완료: {srt_name}")
+            else:
+                log.warning(f"✗ 경고: SRT 파일이 생성되지 않았습니다: {wav_file.name}")
         print()
     
     if files_to_transcribe:
@@ -257,16 +487,17 @@ def process_audio_files(logger: PipelineLogger):
             output_folder=text_folder,
             language="ko",
             skip_existing=False,  # 이미 필터링했으므로
-            extract_srt=extract_srt
+            extract_srt=extract_srt,
+            batch_size=getattr(Config, 'WHISPER_BATCH_SIZE', 1),
+            workers=getattr(Config, 'STT_PARALLEL', 1)
         )
         
         # 로그 업데이트
+        existing_texts = _list_names(text_folder)
         for wav_file in files_to_transcribe:
-            expected_txt = text_folder / f"{wav_file.stem}.txt"
-            if expected_txt.exists():
-                logger.mark_complete(wav_file.name, 'transcribed')
+            if f"{wav_file.stem}.txt" in existing_texts:
+                logger.mark_complete(wav_file.name, 'transcribed', source=wav_file)
         
-        logger.save()
         print(f"\n전사 완료: {len(transcribed_texts)}개 파일")
     else:
         print("모든 파일이 이미 전사되었습니다.")
@@ -276,48 +507,44 @@ def process_audio_files(logger: PipelineLogger):
     print("-" * 60)
     
     # 전사된 텍스트 파일들을 structured로 변환 (.txt와 .srt 모두)
-    text_files = list(text_folder.glob("*.txt")) + list(text_folder.glob("*_SRT.srt"))
+    text_files = _scan_files(text_folder, ".txt", "_SRT.srt")
     
     if not text_files:
         print("처리할 텍스트 파일이 없습니다.")
         return True
     
-    # 이미 처리된 파일 필터링
-    files_to_structure = []
+    # 이미 처리된 파일 필터링 (구조화 폴더는 한 번만 나열)
+    # 파일별 확인용 이름과 로그용 wav 파일명은 여기서 한 번만 계산
+    existing_md_bases = _existing_md_bases(structured_folder)
+    files_to_structure = []  # (text_file, wav 파일명, SRT 여부)
     for text_file in text_files:
         base_name = text_file.stem
+        is_srt = text_file.suffix == '.srt'
         
         # SRT 파일인 경우 _SRT를 제거하고 _srt를 추가한 파일명으로 확인
-        if text_file.suffix == '.srt':
-            # _SRT.srt -> base_name에서 _SRT 제거 -> _srt 추가
+        if is_srt:
             if base_name.endswith('_SRT'):
-                base_name_for_check = base_name[:-4]  # _SRT 제거
-                existing_md = list(structured_folder.glob(f"*_{base_name_for_check}_srt.md"))
+                original_name = base_name[:-4]  # _SRT 제거
+                check_name = f"{original_name}_srt"
             else:
-                existing_md = list(structured_folder.glob(f"*_{base_name}_srt.md"))
+                original_name = base_name.replace('_srt', '')
+                check_name = f"{base_name}_srt"
         else:
             # .txt 파일인 경우 기존 로직
-            existing_md = list(structured_folder.glob(f"*_{base_name}.md"))
+            original_name = base_name
+            check_name = base_name
+        wav_filename = original_name + ".wav"
         
-        if existing_md:
-            print(f"건너뛰기 (이미 처리됨): {text_file.name}")
+        done = logger.is_done(text_file, 'structured', filename=wav_filename)
+        if done or (done is None and check_name in existing_md_bases):
+            log.info(f"건너뛰기 (이미 처리됨): {text_file.name}")
             # wav 파일명으로 로그 기록
-            if text_file.suffix == '.srt':
-                # _SRT.srt -> wav 파일명 추출
-                if base_name.endswith('_SRT'):
-                    wav_base = base_name[:-4]
-                else:
-                    wav_base = base_name.replace('_srt', '')
-                wav_filename = wav_base + ".wav"
-            else:
-                wav_filename = base_name + ".wav"
-            logger.mark_complete(wav_filename, 'structured')
+            logger.mark_complete(wav_filename, 'structured', source=text_file)
         else:
-            files_to_structure.append(text_file)
+            files_to_structure.append((text_file, wav_filename, is_srt))
     
     if not files_to_structure:
         print("모든 파일이 이미 구조화되었습니다.")
-        logger.save()
         return True
     
     print(f"총 {len(files_to_structure)}개의 파일을 구조화합니다...\n")
@@ -331,76 +558,29 @@ def process_audio_files(logger: PipelineLogger):
         processor = TextProcessor(
             api_key_path=api_key_path if api_key_path else None,
             api_key_file=api_key_file,
-            model=model
+            model=model,
+            requests_per_minute=getattr(Config, 'GPT_RPM_LIMIT', None),
+            tokens_per_minute=getattr(Config, 'GPT_TPM_LIMIT', None)
         )
     except Exception as e:
         print(f"초기화 실패: {e}")
         return False
     
-    # 프롬프트 설정 (일반 transcribed 텍스트용)
-    context_query = Config.CONTEXT_QUERY
-    main_query = Config.MAIN_QUERY
-    additional_query = Config.ADDITIONAL_QUERY
-    math_specific_query = Config.MATH_SPECIFIC_QUERY
-    example_query = Config.EXAMPLE_QUERY
-    tone_query = Config.TONE_QUERY
-    token_range = Config.TOKEN_RANGE
-    language = Config.LANGUAGE
-    style = Config.OUTPUT_STYLE
-    save_html = Config.SAVE_HTML
-    html_template = Config.HTML_TEMPLATE
+    # 프롬프트 설정 (일반 transcribed 텍스트용). 파일마다 다른 건 접미사뿐이므로 두 가지만 미리 구성
+    txt_kwargs = build_processing_kwargs("default")
+    txt_kwargs["output_folder"] = structured_folder
+    txt_kwargs["output_filename_suffix"] = ''
+    srt_kwargs = dict(txt_kwargs, output_filename_suffix='_srt')
     
-    processed_count = 0
-    for text_file in files_to_structure:
-        try:
-            # SRT 파일인 경우 파일명에 _srt 접미사 추가
-            is_srt = text_file.suffix == '.srt'
-            if is_srt:
-                # 원본 파일명에서 _SRT 제거 후 _srt 추가
-                base_name = text_file.stem
-                if base_name.endswith('_SRT'):
-                    original_name = base_name[:-4]  # _SRT 제거
-                else:
-                    original_name = base_name.replace('_srt', '')
-                output_filename_suffix = '_srt'
-            else:
-                original_name = text_file.stem
-                output_filename_suffix = ''
-            
-            # process_single_file 내부에서 메시지 출력하므로 여기서는 출력하지 않음
-            result = processor.process_single_file(
-                text_file=text_file,
-                output_folder=structured_folder,
-                context_query=context_query,
-                main_query=main_query,
-                additional_query=additional_query,
-                math_specific_query=math_specific_query,
-                example_query=example_query,
-                tone_query=tone_query,
-                token_range=token_range,
-                language=language,
-                style=style,
-                save_html=save_html,
-                html_template=html_template,
-                output_filename_suffix=output_filename_suffix if is_srt else ''
-            )
-            
-            if result:
-                # wav 파일명으로 로그 기록
-                wav_filename = original_name + ".wav"
-                logger.mark_complete(wav_filename, 'structured')
-                processed_count += 1
-                logger.save()  # 중간 저장
-                print(f"✓ 완료: {text_file.name}\n")
-            else:
-                print(f"✗ 실패: {text_file.name}\n")
-                
-        except Exception as e:
-            print(f"✗ 오류 ({text_file.name}): {e}\n")
-            continue
+    # SRT 파일인 경우 파일명에 _srt 접미사 추가, 로그는 wav 파일명으로 기록
+    tasks = [
+        (text_file, wav_filename, ['structured'], srt_kwargs if is_srt else txt_kwargs)
+        for text_file, wav_filename, is_srt in files_to_structure
+    ]
+    
+    processed_count = _run_structuring(processor, tasks, logger)
     
     print(f"\n[2-2 완료] {processed_count}개 파일 처리")
-    logger.save()
     return True
 
 
@@ -414,16 +594,20 @@ def main():
     print(f"시작 시간: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     print()
     
+    # 출력 폴더는 단계마다가 아니라 실행 시작 시 한 번만 생성
+    Config.create_directories()
+    
     # 로거 초기화
     log_path = Config.PROJECT_ROOT / "log.csv"
     logger = PipelineLogger(log_path)
+    # 정상 종료/실패/중단 어느 경우든 종료 시 log.csv를 한 번만 내보냄
+    atexit.register(logger.save)
     
     # (1) record_text_raw → structured
     success_1 = process_record_texts(logger)
     
     if not success_1:
         print("\n[1단계 실패] 파이프라인 중단")
-        logger.save()
         return
     
     # (2) extracted_audio → transcribed → structured
@@ -431,7 +615,6 @@ def main():
     
     if not success_2:
         print("\n[2단계 실패] 파이프라인 중단")
-        logger.save()
         return
     
     # 최종 로그 저장
@@ -447,15 +630,25 @@ def main():
     print("=" * 60)
 
 
+def _exit_on_sigterm(signum, frame):
+    """SIGTERM을 SystemExit로 바꿔 atexit 핸들러(로그 저장)가 실행되게 함"""
+    sys.exit(128 + signum)
+
+
 if __name__ == "__main__":
+    signal.signal(signal.SIGTERM, _exit_on_sigterm)
+    log_listener = _start_log_listener()
     try:
         main()
     except KeyboardInterrupt:
         print("\n\n사용자에 의해 중단되었습니다.")
-        print("진행 상황은 log.csv에 저장되었습니다.")
+        print("진행 상황은 log.sqlite에 저장되었습니다.")
         sys.exit(1)
     except Exception as e:
         print(f"\n\n치명적 오류 발생: {e}")
         import traceback
         traceback.print_exc()
         sys.exit(1)
+    finally:
+        # 큐에 남은 메시지를 모두 출력한 뒤 종료
+        log_listener.stop()
@@ -3,11 +3,79 @@ Lightning-SimulWhisper 기반 STT 전사 모듈 (테스팅용)
 Apple Silicon용 초고속 실시간 음성 인식 엔진
 기존 STTTranscriber와 동일한 인터페이스 제공
 """
+import argparse
+import functools
+import json
 import os
+import subprocess
 import sys
+import time
 from pathlib import Path
 from typing import List, Optional
+import numpy as np
 from tqdm import tqdm
+from config import Config
+
+
+@functools.lru_cache(maxsize=1)
+def _resolve_lightning_path(configured_path: Optional[Path] = None) -> Path:
+    """
+    Lightning-SimulWhisper 프로젝트 경로를 찾습니다.
+    결과는 고정이므로 프로세스당 한 번만 탐색하고 이후에는 캐시된 경로를 반환합니다.
+    
+    Args:
+        configured_path: Config.LIGHTNING_SIMUL_WHISPER_PATH 값
+        
+    Returns:
+        simulstreaming_whisper.py가 있는 프로젝트 경로
+    """
+    # Lightning-SimulWhisper 프로젝트 경로 확인
+    # 1. Config에서 경로 확인
+    if configured_path:
+        lightning_path = Path(configured_path)
+    # 2. 환경변수 확인
+    elif "LIGHTNING_SIMUL_WHISPER_PATH" in os.environ:
+        lightning_path = Path(os.environ["LIGHTNING_SIMUL_WHISPER_PATH"])
+        # 3. 기본 경로 확인 (여러 가능한 위치)
+    else:
+        possible_paths = [
+            Path(__file__).parent.parent.parent.parent / "Lightning-SimulWhisper",  # /Users/suengj/Documents/Code/Python/PJT/Lightning-SimulWhisper
+            Path(__file__).parent.parent.parent / "Lightning-SimulWhisper",  # /Users/suengj/Documents/Code/Python/Lightning-SimulWhisper
+            Path(__file__).parent.parent / "Lightning-SimulWhisper",  # p10_bromath/Lightning-SimulWhisper
+        ]
+        
+        lightning_path = None
+        for path in possible_paths:
+            if path.joinpath("simulstreaming_whisper.py").is_file():
+                lightning_path = path
+                break
+        
+        if lightning_path is None:
+            # 기본값: PJT/Lightning-SimulWhisper (설치 가이드에 따라)
+            lightning_path = possible_paths[0]
+    
+    if not lightning_path.exists():
+        raise RuntimeError(
+            f"Lightning-SimulWhisper 프로젝트를 찾을 수 없습니다.\n"
+            f"예상 경로: {lightning_path}\n"
+            f"설치 방법:\n"
+            f"  1. git clone https://github.com/altalt-org/Lightning-SimulWhisper.git\n"
+            f"  2. 환경변수 설정: export LIGHTNING_SIMUL_WHISPER_PATH=/path/to/Lightning-SimulWhisper\n"
+            f"  3. config.py에서 LIGHTNING_SIMUL_WHISPER_PATH 설정\n"
+            f"  4. 또는 프로젝트를 {lightning_path}에 배치\n"
+            f"자세한 내용은 tbd/LIGHTNING_SIMUL_WHISPER_SETUP.md 참고"
+        )
+    
+    # simulstreaming_whisper.py 파일 존재 확인
+    simulstreaming_script = lightning_path / "simulstreaming_whisper.py"
+    if not simulstreaming_script.exists():
+        raise RuntimeError(
+            f"simulstreaming_whisper.py를 찾을 수 없습니다: {simulstreaming_script}\n"
+            f"프로젝트 경로: {lightning_path}\n"
+            f"설치 가이드: tbd/LIGHTNING_SIMUL_WHISPER_SETUP.md 참고"
+        )
+    
+    return lightning_path
 
 
 class LightningSimulWhisperTranscriber:
@@ -31,21 +99,32 @@ class LightningSimulWhisperTranscriber:
             language: 언어 코드
             hf_home_path: Hugging Face 홈 디렉토리 경로
         """
-        from config import Config
-        
-        # Config에서 기본값 가져오기
-        if model_name == "base" and hasattr(Config, 'LIGHTNING_SIMUL_MODEL_NAME'):
-            model_name = Config.LIGHTNING_SIMUL_MODEL_NAME
-        if model_path is None and hasattr(Config, 'LIGHTNING_SIMUL_MODEL_PATH') and Config.LIGHTNING_SIMUL_MODEL_PATH:
-            model_path = Config.LIGHTNING_SIMUL_MODEL_PATH
-        if use_coreml and hasattr(Config, 'LIGHTNING_SIMUL_USE_COREML'):
-            use_coreml = Config.LIGHTNING_SIMUL_USE_COREML
+        # Config에서 기본값 가져오기 (이후 메서드에서 다시 조회하지 않도록 한 번만 읽어 둠)
+        if model_name == "base":
+            model_name = getattr(Config, 'LIGHTNING_SIMUL_MODEL_NAME', model_name)
+        if model_path is None:
+            model_path = getattr(Config, 'LIGHTNING_SIMUL_MODEL_PATH', None) or None
+        if use_coreml:
+            use_coreml = getattr(Config, 'LIGHTNING_SIMUL_USE_COREML', use_coreml)
+        self._lightning_path_cfg = getattr(Config, 'LIGHTNING_SIMUL_WHISPER_PATH', None)
+        self._coreml_units = getattr(Config, 'LIGHTNING_SIMUL_COREML_COMPUTE_UNITS', None)
+        self._worker_python = getattr(Config, 'LIGHTNING_SIMUL_PYTHON', None)
+        # model_path가 실제 파일/디렉토리 경로인 경우에만 --model_path 인자로 사용 (한 번만 확인)
+        # (없으면 HuggingFace repo ID로 간주하고 model_name으로 자동 다운로드)
+        self._model_arg = (
+            ["--model_path", str(Path(model_path).resolve())]
+            if model_path and Path(model_path).exists() else []
+        )
         self.model_path = model_path
         self.model_name = model_name
         self.use_coreml = use_coreml
         self.language = language
         self.hf_home_path = hf_home_path
         self.whisper_module = None
+        self._asr = None
+        self._online = None
+        self._loaded_language = None
+        self._proc = None
         self._check_dependencies()
         self._load_whisper_module()
     
@@ -64,58 +143,142 @@ class LightningSimulWhisperTranscriber:
     
     def _load_whisper_module(self):
         """Lightning-SimulWhisper 모듈 로드"""
-        from config import Config
-        
-        # Lightning-SimulWhisper 프로젝트 경로 확인
-        # 1. Config에서 경로 확인
-        if Config.LIGHTNING_SIMUL_WHISPER_PATH:
-            lightning_path = Config.LIGHTNING_SIMUL_WHISPER_PATH
-        # 2. 환경변수 확인
-        elif "LIGHTNING_SIMUL_WHISPER_PATH" in os.environ:
-            lightning_path = Path(os.environ["LIGHTNING_SIMUL_WHISPER_PATH"])
-            # 3. 기본 경로 확인 (여러 가능한 위치)
-        else:
-            possible_paths = [
-                Path(__file__).parent.parent.parent.parent / "Lightning-SimulWhisper",  # /Users/suengj/Documents/Code/Python/PJT/Lightning-SimulWhisper
-                Path(__file__).parent.parent.parent / "Lightning-SimulWhisper",  # /Users/suengj/Documents/Code/Python/Lightning-SimulWhisper
-                Path(__file__).parent.parent / "Lightning-SimulWhisper",  # p10_bromath/Lightning-SimulWhisper
-            ]
+        lightning_path = _resolve_lightning_path(self._lightning_path_cfg)
+        self._lightning_path = lightning_path
+        
+        print(f"Lightning-SimulWhisper 프로젝트 경로: {lightning_path}")
+        
+        # 별도 가상환경의 python을 지정한 경우: 워커 프로세스를 한 번 띄워 두고 파일 경로를 stdin으로 전달
+        worker_python = self._worker_python
+        if worker_python and os.environ.get("LIGHTNING_SIMUL_WORKER") != "1":
+            self._start_worker(worker_python)
+            return
+        
+        # 파일마다 python을 새로 띄우지 않도록 모듈을 이 프로세스에 한 번만 import
+        if str(lightning_path) not in sys.path:
+            sys.path.insert(0, str(lightning_path))
+        import simulstreaming_whisper
+        from whisper_streaming import whisper_online_main
+        self.whisper_module = simulstreaming_whisper
+        self._online_main = whisper_online_main
+        
+        # 모델은 한 번 로드해서 모든 파일에 재사용
+        self._load_asr(self.language)
+    
+    def _start_worker(self, worker_python: str):
+        """
+        이 모듈을 --server 모드로 실행하는 워커 프로세스를 시작합니다.
+        모델 로드와 CoreML 컴파일은 워커 시작 시 한 번만 일어납니다.
+        
+        Args:
+            worker_python: Lightning-SimulWhisper 의존성이 설치된 python 실행 파일
+        """
+        cmd = [
+            str(worker_python), str(Path(__file__).resolve()), "--server",
+            "--model_name", self.model_name,
+            "--language", self.language or ""
+        ]
+        if self.model_path:
+            cmd.extend(["--model_path", str(self.model_path)])
+        if self.use_coreml:
+            cmd.append("--use_coreml")
+        if self.hf_home_path:
+            cmd.extend(["--hf_home_path", str(self.hf_home_path)])
+        
+        print(f"Lightning-SimulWhisper 워커 시작: {worker_python}")
+        self._proc = subprocess.Popen(
+            cmd,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            text=True,
+            encoding="utf-8",
+            bufsize=1,
+            cwd=str(Path(__file__).resolve().parent),
+            env=dict(os.environ, LIGHTNING_SIMUL_WORKER="1")
+        )
+    
+    def _request_worker(self, audio_path: Path, language: Optional[str], extract_srt: bool) -> dict:
+        """
+        워커 프로세스에 전사 요청 한 줄을 보내고 결과 한 줄을 받습니다.
+        
+        Args:
+            audio_path: 오디오 파일 경로
+            language: 언어 코드
+            extract_srt: SRT 추출 여부
             
-            lightning_path = None
-            for path in possible_paths:
-                if path.exists() and (path / "simulstreaming_whisper.py").exists():
-                    lightning_path = path
-                    break
+        Returns:
+            {"text": str, "segments": list} 형식의 결과
+        """
+        request = {
+            "audio_path": str(audio_path),
+            "language": language,
+            "extract_srt": extract_srt
+        }
+        self._proc.stdin.write(json.dumps(request, ensure_ascii=False) + "\n")
+        self._proc.stdin.flush()
+        line = self._proc.stdout.readline()
+        if not line:
+            raise RuntimeError(f"Lightning-SimulWhisper 워커가 종료되었습니다 (return code: {self._proc.poll()})")
+        response = json.loads(line)
+        if "error" in response:
+            raise RuntimeError(response["error"])
+        return response
+    
+    def close(self):
+        """워커 프로세스 종료 (stdin을 닫으면 워커 루프가 끝남)"""
+        if getattr(self, "_proc", None) is not None:
+            try:
+                self._proc.stdin.close()
+                self._proc.wait(timeout=10)
+            except (OSError, subprocess.TimeoutExpired):
+                self._proc.kill()
+            self._proc = None
+    
+    def __del__(self):
+        self.close()
+    
+    def _build_args(self, language: Optional[str]):
+        """
+        simulstreaming_whisper.py 명령행과 같은 설정으로 인자 객체를 만듭니다.
+        
+        Args:
+            language: 언어 코드
             
-            if lightning_path is None:
-                # 기본값: PJT/Lightning-SimulWhisper (설치 가이드에 따라)
-                lightning_path = possible_paths[0]
+        Returns:
+            simul_asr_factory에 넘길 argparse.Namespace
+        """
+        parser = argparse.ArgumentParser()
+        parser.add_argument("audio_path", nargs="?", default="")
+        if hasattr(self._online_main, "processor_args"):
+            self._online_main.processor_args(parser)
+        self.whisper_module.simulwhisper_args(parser)
         
-        if not lightning_path.exists():
-            raise RuntimeError(
-                f"Lightning-SimulWhisper 프로젝트를 찾을 수 없습니다.\n"
-                f"예상 경로: {lightning_path}\n"
-                f"설치 방법:\n"
-                f"  1. git clone https://github.com/altalt-org/Lightning-SimulWhisper.git\n"
-                f"  2. 환경변수 설정: export LIGHTNING_SIMUL_WHISPER_PATH=/path/to/Lightning-SimulWhisper\n"
-                f"  3. config.py에서 LIGHTNING_SIMUL_WHISPER_PATH 설정\n"
-                f"  4. 또는 프로젝트를 {lightning_path}에 배치\n"
-                f"자세한 내용은 tbd/LIGHTNING_SIMUL_WHISPER_SETUP.md 참고"
-            )
+        argv = ["--model_name", self.model_name, "--lan", language or "ko"] + self._model_arg
         
-        # 경로 저장 (subprocess에서 사용)
-        self._lightning_path = lightning_path
+        if self.use_coreml:
+            argv.append("--use_coreml")
+            if self._coreml_units:
+                argv.extend(["--coreml_compute_units", self._coreml_units])
         
-        # simulstreaming_whisper.py 파일 존재 확인
-        simulstreaming_script = lightning_path / "simulstreaming_whisper.py"
-        if not simulstreaming_script.exists():
-            raise RuntimeError(
-                f"simulstreaming_whisper.py를 찾을 수 없습니다: {simulstreaming_script}\n"
-                f"프로젝트 경로: {lightning_path}\n"
-                f"설치 가이드: tbd/LIGHTNING_SIMUL_WHISPER_SETUP.md 참고"
-            )
+        args, _ = parser.parse_known_args(argv)
+        return args
+    
+    def _load_asr(self, language: Optional[str]):
+        """
+        ASR 모델과 온라인 처리기를 생성합니다 (언어가 바뀔 때만 다시 생성).
         
-        print(f"Lightning-SimulWhisper 프로젝트 경로: {lightning_path}")
+        Args:
+            language: 언어 코드
+        """
+        # HF_HOME 환경변수 설정 (모델 다운로드 위치)
+        if self.hf_home_path:
+            os.environ["HF_HOME"] = str(self.hf_home_path)
+        
+        args = self._build_args(language)
+        print(f"Lightning-SimulWhisper 모델 로드: {self.model_name} (언어: {args.lan})")
+        self._asr, self._online = self.whisper_module.simul_asr_factory(args)
+        self._min_chunk_size = getattr(args, "min_chunk_size", 1.0) or 1.0
+        self._loaded_language = language
     
     def transcribe_audio(
         self,
@@ -123,7 +286,8 @@ class LightningSimulWhisperTranscriber:
         output_folder: Optional[Path] = None,
         output_filename: Optional[str] = None,
         language: Optional[str] = None,
-        extract_srt: bool = False
+        extract_srt: bool = False,
+        audio_array=None
     ) -> str:
         """
         오디오 파일을 텍스트로 전사합니다.
@@ -134,10 +298,14 @@ class LightningSimulWhisperTranscriber:
             output_filename: 출력 파일명 (None이면 자동 생성)
             language: 언어 코드 (예: "ko", "en"). None이면 자동 감지
             extract_srt: True이면 SRT 자막 파일도 생성
+            audio_array: 이미 디코딩된 16kHz 모노 float32 오디오 (None이면 audio_path에서 읽음.
+                워커 프로세스 모드에서는 사용하지 않음)
             
         Returns:
             전사된 텍스트
         """
+        # 워커 프로세스는 작업 폴더가 다르므로 절대 경로로 한 번만 변환
+        audio_path = Path(audio_path).absolute()
         if not audio_path.exists():
             raise FileNotFoundError(f"오디오 파일을 찾을 수 없습니다: {audio_path}")
         
@@ -145,21 +313,14 @@ class LightningSimulWhisperTranscriber:
             # 언어 설정 (파라미터 우선, 없으면 인스턴스 변수 사용)
             transcribe_language = language if language else self.language
             
-            # HF_HOME 환경변수 설정
-            if self.hf_home_path:
-                os.environ["HF_HOME"] = str(self.hf_home_path)
-            
-            # Lightning-SimulWhisper 전사 실행
-            # 실제 API는 프로젝트 구조에 따라 조정 필요
-            # 예상: simulstreaming_whisper.transcribe_audio() 또는 유사한 함수
+            # Lightning-SimulWhisper 전사 실행 (로드된 모델로 프로세스 안에서 호출)
             print(f"Lightning-SimulWhisper 전사 시작: {audio_path.name}")
             
-            # 임시: subprocess로 실행하는 방식 (실제 구현 시 조정)
-            # 또는 직접 Python API 호출
             result = self._run_lightning_transcribe(
                 audio_path=audio_path,
                 language=transcribe_language,
-                extract_srt=extract_srt
+                extract_srt=extract_srt,
+                audio_array=audio_array
             )
             
             text = result.get("text", "").strip()
@@ -194,163 +355,64 @@ class LightningSimulWhisperTranscriber:
         self,
         audio_path: Path,
         language: Optional[str],
-        extract_srt: bool
+        extract_srt: bool,
+        audio_array=None
     ) -> dict:
         """
         Lightning-SimulWhisper 실제 전사 실행
-        실제 API 구조에 맞게 조정 필요
+        로드해 둔 온라인 처리기에 오디오를 넣어 이 프로세스 안에서 전사합니다.
         
         Args:
             audio_path: 오디오 파일 경로
             language: 언어 코드
             extract_srt: SRT 추출 여부
+            audio_array: 이미 디코딩된 16kHz 모노 float32 오디오 (None이면 audio_path에서 읽음)
             
         Returns:
             {"text": str, "segments": list} 형식의 결과
         """
-        # Lightning-SimulWhisper의 simulstreaming_whisper.py 스크립트를 subprocess로 실행
-        # 또는 Python API를 직접 호출 (프로젝트 구조에 따라)
+        if self._proc is not None:
+            return self._request_worker(audio_path, language, extract_srt)
+        
         try:
-            import subprocess
-            import json
-            import tempfile
-            from config import Config
+            if language != self._loaded_language:
+                self._load_asr(language)
             
-            # Lightning-SimulWhisper 프로젝트 경로 (로드 시 탐색한 경로 재사용)
-            lightning_path = self._lightning_path
-            simulstreaming_script = lightning_path / "simulstreaming_whisper.py"
+            # whisper_online_main의 파일 시뮬레이션과 같은 방식:
+            # 오디오를 min_chunk_size 단위로 넣고 process_iter 결과를 모은 뒤 finish로 마무리
+            audio = audio_array if audio_array is not None else self._online_main.load_audio(str(audio_path))
+            sample_rate = 16000
+            chunk_samples = max(1, int(self._min_chunk_size * sample_rate))
             
-            # 임시 출력 파일들 (텍스트 및 타임스탬프)
-            with tempfile.TemporaryDirectory() as tmpdir:
-                tmpdir_path = Path(tmpdir)
-                output_txt = tmpdir_path / "output.txt"
-                output_segments = tmpdir_path / "output_segments.txt" if extract_srt else None
-                
-                # subprocess로 실행
-                # simulstreaming_whisper.py는 whisper_streaming.whisper_online_main을 사용
-                # audio_path는 첫 번째 위치 인자로 전달 (절대 경로로 변환)
-                audio_path_abs = Path(audio_path).resolve()
-                cmd = [
-                    sys.executable,
-                    str(simulstreaming_script),
-                    str(audio_path_abs),
-                    "--model_name", self.model_name,
-                    "--lan", language or "ko"
-                ]
-                
-                # model_path가 None이 아니고 실제 파일/디렉토리 경로인 경우에만 추가
-                # simulstreaming_whisper.py의 기본값 './base.pt'는 HuggingFace repo ID가 아니므로
-                # 실제 경로가 있을 때만 추가하고, 없으면 model_name으로 HuggingFace에서 자동 다운로드
-                if self.model_path:
-                    model_path_obj = Path(self.model_path)
-                    if model_path_obj.exists():
-                        cmd.extend(["--model_path", str(model_path_obj)])
-                    else:
-                        # 경로가 존재하지 않으면 HuggingFace repo ID로 간주하고 전달하지 않음
-                        # model_name으로 자동 다운로드됨
-                        pass
-                
-                if self.use_coreml:
-                    cmd.append("--use_coreml")
-                    if hasattr(Config, 'LIGHTNING_SIMUL_COREML_COMPUTE_UNITS'):
-                        cmd.extend(["--coreml_compute_units", Config.LIGHTNING_SIMUL_COREML_COMPUTE_UNITS])
-                
-                # 실행 및 출력 리다이렉션
-                print(f"Lightning-SimulWhisper 실행 명령: {' '.join(cmd)}")
-                
-                # stderr도 별도 파일로 저장하여 확인
-                stderr_file = tmpdir_path / "stderr.txt"
-                with open(output_txt, 'w', encoding='utf-8') as f_out, \
-                     open(stderr_file, 'w', encoding='utf-8') as f_err:
-                    result = subprocess.run(
-                        cmd,
-                        stdout=f_out,
-                        stderr=f_err,
-                        text=True,
-                        cwd=str(lightning_path)
-                    )
-                
-                # stderr 내용 읽기
-                stderr_content = ""
-                if stderr_file.exists():
-                    with open(stderr_file, 'r', encoding='utf-8') as f:
-                        stderr_content = f.read()
-                
-                # scikit-learn 경고는 무시 (경고일 뿐)
-                if result.returncode != 0:
-                    # 실제 오류만 확인 (scikit-learn 경고 제외)
-                    actual_error = stderr_content
-                    # scikit-learn 관련 경고 라인 제거
-                    error_lines = [line for line in stderr_content.split('\n') 
-                                 if 'scikit-learn' not in line.lower() and 
-                                    'cache for model files' not in line.lower() and
-                                    'migrating your old cache' not in line.lower()]
-                    actual_error = '\n'.join(error_lines)
-                    
-                    # stderr에 실제 오류가 없고 INFO만 있으면 성공으로 처리
-                    if actual_error.strip() and not any(keyword in actual_error.lower() for keyword in ['info', 'audio duration', 'arguments']):
-                        raise RuntimeError(
-                            f"Lightning-SimulWhisper 실행 실패 (return code: {result.returncode}):\n"
-                            f"STDERR: {actual_error[:1000]}"
-                        )
-                    elif result.returncode != 0:
-                        # return code가 0이 아니지만 실제 오류는 없는 경우 경고만 출력
-                        print(f"경고: return code {result.returncode}, 하지만 실제 오류는 감지되지 않았습니다.")
-                        print(f"STDERR (일부): {stderr_content[:500]}")
-                
-                # 결과 읽기
-                if output_txt.exists():
-                    with open(output_txt, 'r', encoding='utf-8') as f:
-                        output_text = f.read().strip()
-                    
-                    # stdout 형식 파싱
-                    # simulstreaming_whisper 출력 형식: 
-                    # "{now_ms} {start_ts_ms} {end_ts_ms} {text}"
-                    # 예: "4186.3606 0 1720 Takhle to je"
-                    lines = output_text.split('\n')
-                    text_lines = []
-                    segments = []
-                    
-                    for line in lines:
-                        line = line.strip()
-                        if not line:
-                            continue
-                        # INFO, DEBUG 등의 로그 라인 제외
-                        if line.startswith(('INFO', 'DEBUG', 'WARNING', 'ERROR', 'CRITICAL')):
-                            continue
-                        # 숫자로 시작하는 라인만 처리 (타임스탬프 형식)
-                        parts = line.split()
-                        if len(parts) >= 4:
-                            try:
-                                # 처음 3개는 숫자 (타임스탬프), 나머지가 텍스트
-                                now_ms = float(parts[0])
-                                start_ts_ms = float(parts[1])
-                                end_ts_ms = float(parts[2])
-                                text = ' '.join(parts[3:])
-                                
-                                if text:
-                                    text_lines.append(text)
-                                    if extract_srt:
-                                        segments.append({
-                                            "start": start_ts_ms / 1000.0,
-                                            "end": end_ts_ms / 1000.0,
-                                            "text": text
-                                        })
-                            except (ValueError, IndexError):
-                                # 숫자 파싱 실패 시 전체를 텍스트로 처리
-                                text_lines.append(line)
-                        else:
-                            # 형식이 맞지 않으면 전체를 텍스트로 처리
-                            text_lines.append(line)
-                    
-                    full_text = ' '.join(text_lines)
-                    
-                    return {
-                        "text": full_text,
-                        "segments": segments if extract_srt else []
-                    }
-                else:
-                    raise RuntimeError("출력 파일이 생성되지 않았습니다.")
+            # 각 출력은 {"start": 초, "end": 초, "text": str} (출력이 없으면 빈 dict)
+            # 출력을 모아 두지 않고 나오는 즉시 텍스트/세그먼트에 반영
+            text_lines = []
+            segments = []
+            
+            def collect(output: dict):
+                if not output:
+                    return
+                text = output.get("text", "").strip()
+                if not text:
+                    return
+                text_lines.append(text)
+                if extract_srt and output.get("start") is not None:
+                    segments.append({
+                        "start": float(output["start"]),
+                        "end": float(output["end"]),
+                        "text": text
+                    })
+            
+            self._online.init()
+            for beg in range(0, len(audio), chunk_samples):
+                self._online.insert_audio_chunk(audio[beg:beg + chunk_samples])
+                collect(self._online.process_iter())
+            collect(self._online.finish())
+            
+            return {
+                "text": ' '.join(text_lines),
+                "segments": segments if extract_srt else []
+            }
             
         except FileNotFoundError as e:
             raise e
@@ -381,15 +443,17 @@ class LightningSimulWhisperTranscriber:
         srt_filename = audio_path.stem + "_SRT.srt"
         srt_path = output_folder / srt_filename
         
+        # 타임스탬프는 한 번에 변환하고, 파일 전체를 문자열로 만들어 한 번에 기록
+        start_times = self._format_timestamps([segment.get("start", 0) for segment in segments])
+        end_times = self._format_timestamps([segment.get("end", 0) for segment in segments])
+        texts = [segment.get("text", "").strip() for segment in segments]
+        blob = "".join([
+            f"{idx}\n{start_time} --> {end_time}\n{text}\n\n"
+            for idx, (start_time, end_time, text) in enumerate(zip(start_times, end_times, texts), 1)
+        ])
+        
         with open(srt_path, "w", encoding="utf-8") as f:
-            for idx, segment in enumerate(segments, 1):
-                start_time = self._format_timestamp(segment.get("start", 0))
-                end_time = self._format_timestamp(segment.get("end", 0))
-                text = segment.get("text", "").strip()
-                
-                f.write(f"{idx}\n")
-                f.write(f"{start_time} --> {end_time}\n")
-                f.write(f"{text}\n\n")
+            f.write(blob)
         
         print(f"SRT 파일 저장: {srt_path}")
     
@@ -410,13 +474,79 @@ class LightningSimulWhisperTranscriber:
         
         return f"{hours:02d}:{minutes:02d}:{secs:02d},{millis:03d}"
     
+    def _format_timestamps(self, seconds_list: List[float]) -> List[str]:
+        """
+        여러 초 단위 시간을 한 번에 SRT 형식 (HH:MM:SS,mmm)으로 변환합니다.
+        _format_timestamp와 같은 연산을 NumPy 배열에 적용하므로 결과가 같습니다.
+        
+        Args:
+            seconds_list: 초 단위 시간 리스트
+            
+        Returns:
+            SRT 형식 타임스탬프 문자열 리스트
+        """
+        seconds = np.asarray(seconds_list, dtype=np.float64)
+        hours = (seconds // 3600).astype(np.int64).tolist()
+        minutes = ((seconds % 3600) // 60).astype(np.int64).tolist()
+        secs = (seconds % 60).astype(np.int64).tolist()
+        millis = ((seconds % 1) * 1000).astype(np.int64).tolist()
+        
+        return [
+            f"{h:02d}:{m:02d}:{s:02d},{ms:03d}"
+            for h, m, s, ms in zip(hours, minutes, secs, millis)
+        ]
+    
+    @staticmethod
+    def _existing_names(folder: Path) -> set:
+        """
+        폴더의 파일명 집합 (파일마다 exists()를 호출하지 않도록 scandir 한 번으로 나열)
+        
+        Args:
+            folder: 확인할 폴더
+            
+        Returns:
+            파일명 집합 (폴더가 없으면 빈 집합)
+        """
+        try:
+            with os.scandir(folder) as entries:
+                return {entry.name for entry in entries}
+        except FileNotFoundError:
+            return set()
+    
+    @staticmethod
+    def _file_sizes(files: List[Path]) -> dict:
+        """
+        파일 크기를 폴더별 scandir 한 번으로 모읍니다 (파일마다 stat()을 호출하지 않음).
+        
+        Args:
+            files: 파일 경로 리스트
+            
+        Returns:
+            {파일 경로: 바이트 크기} (찾지 못한 파일은 제외)
+        """
+        wanted = {}
+        for file_path in files:
+            wanted.setdefault(file_path.parent, set()).add(file_path.name)
+        
+        sizes = {}
+        for folder, names in wanted.items():
+            try:
+                with os.scandir(folder) as entries:
+                    for entry in entries:
+                        if entry.name in names:
+                            sizes[folder / entry.name] = entry.stat().st_size
+            except FileNotFoundError:
+                continue
+        return sizes
+    
     def transcribe_all(
         self,
         audio_files: List[Path],
         output_folder: Path,
         language: Optional[str] = None,
         skip_existing: bool = True,
-        extract_srt: bool = False
+        extract_srt: bool = False,
+        load_existing: bool = False
     ) -> List[str]:
         """
         여러 오디오 파일을 일괄 전사합니다.
@@ -427,6 +557,7 @@ class LightningSimulWhisperTranscriber:
             language: 언어 코드 (None이면 자동 감지)
             skip_existing: True이면 이미 전사된 파일 건너뛰기
             extract_srt: True이면 SRT 파일도 생성
+            load_existing: True이면 건너뛴 파일의 기존 텍스트도 결과에 포함
             
         Returns:
             전사된 텍스트 리스트
@@ -440,15 +571,17 @@ class LightningSimulWhisperTranscriber:
         # 이미 전사된 파일 필터링
         files_to_process = []
         if skip_existing:
+            existing_names = self._existing_names(output_folder)
             for audio_file in audio_files:
                 expected_txt = output_folder / f"{audio_file.stem}.txt"
-                if expected_txt.exists():
+                if expected_txt.name in existing_names:
                     print(f"건너뛰기 (이미 전사됨): {audio_file.name}")
-                    try:
-                        with open(expected_txt, 'r', encoding='utf-8') as f:
-                            transcribed_texts.append(f.read())
-                    except:
-                        pass
+                    # 요청한 경우에만 이미 있는 파일의 텍스트 읽기
+                    if load_existing:
+                        try:
+                            transcribed_texts.append(expected_txt.read_text(encoding="utf-8", errors="replace"))
+                        except OSError as e:
+                            print(f"경고: 기존 전사 파일 읽기 실패 ({expected_txt.name}): {e}")
                 else:
                     files_to_process.append(audio_file)
         else:
@@ -462,14 +595,13 @@ class LightningSimulWhisperTranscriber:
         print(f"\n총 {len(files_to_process)}개의 파일을 Lightning-SimulWhisper로 전사합니다...")
         print("(Lightning-SimulWhisper는 기존 MLX Whisper보다 빠를 수 있습니다)\n")
         
-        import time as time_module
-        
+        file_sizes = self._file_sizes(files_to_process)
         for idx, audio_file in enumerate(tqdm(files_to_process, desc="Lightning-SimulWhisper 전사 진행", unit="파일"), 1):
             try:
-                file_size_mb = audio_file.stat().st_size / (1024 * 1024)
+                file_size_mb = file_sizes.get(audio_file, 0) / (1024 * 1024)
                 tqdm.write(f"\n[{idx}/{len(files_to_process)}] 처리 중: {audio_file.name} ({file_size_mb:.1f} MB)")
                 
-                start_time = time_module.time()
+                start_time = time.time()
                 
                 text = self.transcribe_audio(
                     audio_file,
@@ -478,7 +610,7 @@ class LightningSimulWhisperTranscriber:
                     extract_srt=extract_srt
                 )
                 
-                elapsed_time = time_module.time() - start_time
+                elapsed_time = time.time() - start_time
                 
                 transcribed_texts.append(text)
                 tqdm.write(f"  ✓ 완료: {audio_file.name} ({elapsed_time:.2f}초 소요, {len(text)} 문자)")
@@ -488,7 +620,7 @@ class LightningSimulWhisperTranscriber:
                 tqdm.write(f"진행 상황: {idx-1}/{len(files_to_process)} 완료")
                 break
             except Exception as e:
-                elapsed = time_module.time() - start_time if 'start_time' in locals() else 0
+                elapsed = time.time() - start_time if 'start_time' in locals() else 0
                 error_msg = f"  ✗ 오류 발생 ({audio_file.name}): {e}"
                 tqdm.write(error_msg)
                 if elapsed > 0:
@@ -496,3 +628,48 @@ class LightningSimulWhisperTranscriber:
                 continue
         
         return transcribed_texts
+
+
+def serve_stdio():
+    """
+    워커 모드: stdin의 JSON 요청 한 줄마다 전사 결과 JSON 한 줄을 stdout으로 출력합니다.
+    모델 로드/전사 중 print 출력은 응답과 섞이지 않도록 stderr로 보냅니다.
+    """
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--server", action="store_true")
+    parser.add_argument("--model_name", default="base")
+    parser.add_argument("--model_path", default=None)
+    parser.add_argument("--language", default="")
+    parser.add_argument("--use_coreml", action="store_true")
+    parser.add_argument("--hf_home_path", default=None)
+    args = parser.parse_args()
+    
+    responses = sys.stdout
+    sys.stdout = sys.stderr
+    
+    transcriber = LightningSimulWhisperTranscriber(
+        model_path=Path(args.model_path) if args.model_path else None,
+        model_name=args.model_name,
+        use_coreml=args.use_coreml,
+        language=args.language or None,
+        hf_home_path=Path(args.hf_home_path) if args.hf_home_path else None
+    )
+    
+    for line in sys.stdin:
+        if not line.strip():
+            continue
+        try:
+            request = json.loads(line)
+            response = transcriber._run_lightning_transcribe(
+                audio_path=Path(request["audio_path"]),
+                language=request.get("language"),
+                extract_srt=request.get("extract_srt", False)
+            )
+        except Exception as e:
+            response = {"error": str(e)}
+        responses.write(json.dumps(response, ensure_ascii=False) + "\n")
+        responses.flush()
+
+
+if __name__ == "__main__" and "--server" in sys.argv:
+    serve_stdio()
@@ -0,0 +1,207 @@
+"""
+STT daemon that keeps one Whisper model loaded across script runs.
+Whisper 모델을 한 번만 로드해 두고 여러 스크립트가 공유하는 전사 데몬입니다.
+
+사용법:
+    python stt_server.py                       # 데몬 실행 (모델 로드 후 대기)
+    STT_DAEMON=1 python main.py                # 데몬에 연결해서 전사
+    STT_DAEMON=1 python generate_srt_files.py
+"""
+import os
+import secrets
+import threading
+from multiprocessing.managers import BaseManager
+from pathlib import Path
+
+# 매니저는 받은 데이터를 unpickle하므로 소켓과 인증키는 현재 사용자만 접근할 수 있는 디렉토리에 둠
+SOCKET_NAME = "stt.sock"
+AUTHKEY_NAME = "authkey"
+
+
+def runtime_dir() -> Path:
+    """
+    소켓과 인증키를 둘 사용자 전용(0700) 디렉토리를 반환합니다.
+    $XDG_RUNTIME_DIR가 있으면 그 아래를, 없으면 프로젝트 cache 폴더 아래를 사용합니다.
+
+    Returns:
+        디렉토리 경로
+
+    Raises:
+        RuntimeError: 사용자 전용 디렉토리를 준비할 수 없는 경우
+    """
+    xdg_runtime = os.environ.get("XDG_RUNTIME_DIR")
+    if xdg_runtime and os.path.isdir(xdg_runtime):
+        directory = Path(xdg_runtime) / "bromath"
+    else:
+        directory = Path(__file__).parent / "cache" / "stt_daemon"
+
+    try:
+        directory.mkdir(mode=0o700, parents=True, exist_ok=True)
+        st = directory.stat()
+        if st.st_uid == os.getuid() and st.st_mode & 0o077:
+            os.chmod(directory, 0o700)
+            st = directory.stat()
+    except OSError as e:
+        raise RuntimeError(f"STT 데몬 디렉토리를 준비할 수 없습니다 ({directory}): {e}")
+    if st.st_uid != os.getuid() or st.st_mode & 0o077:
+        raise RuntimeError(
+            f"STT 데몬 디렉토리가 현재 사용자 전용(0700)이 아닙니다: {directory}\n"
+            "다른 사용자가 접근할 수 있는 위치에서는 데몬을 실행하지 않습니다."
+        )
+    return directory
+
+
+def _create_authkey(directory: Path) -> bytes:
+    """데몬 실행마다 새 무작위 인증키를 만들어 0600 파일로 저장합니다."""
+    authkey = secrets.token_bytes(32)
+    key_path = directory / AUTHKEY_NAME
+    tmp_path = directory / (AUTHKEY_NAME + ".tmp")
+    tmp_path.unlink(missing_ok=True)
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+    with os.fdopen(fd, "wb") as f:
+        f.write(authkey)
+    os.replace(tmp_path, key_path)
+    return authkey
+
+
+class TranscriberService:
+    """데몬 안에서 STTTranscriber 호출을 직렬화하는 래퍼 클래스"""
+
+    def __init__(self, transcriber):
+        """
+        TranscriberService 초기화
+
+        Args:
+            transcriber: 로드된 STTTranscriber
+        """
+        self._transcriber = transcriber
+        # 모델은 스레드 안전하지 않으므로 클라이언트 요청을 한 번에 하나씩 처리
+        self._lock = threading.Lock()
+
+    def transcribe_audio(self, *args, **kwargs):
+        """STTTranscriber.transcribe_audio를 데몬에서 실행합니다."""
+        with self._lock:
+            return self._transcriber.transcribe_audio(*args, **kwargs)
+
+    def transcribe_all(self, *args, **kwargs):
+        """STTTranscriber.transcribe_all을 데몬에서 실행합니다."""
+        with self._lock:
+            return self._transcriber.transcribe_all(*args, **kwargs)
+
+    def warmup(self, *args, **kwargs):
+        """데몬 시작 시 이미 워밍업했으므로 아무것도 하지 않습니다."""
+        return None
+
+
+class STTManager(BaseManager):
+    """전사 데몬 매니저 (서버 측)"""
+    pass
+
+
+class STTClientManager(BaseManager):
+    """전사 데몬 매니저 (클라이언트 측)"""
+    pass
+
+
+STTClientManager.register('transcriber')
+
+
+def daemon_enabled() -> bool:
+    """
+    STT_DAEMON=1 환경변수로 데몬 사용이 켜져 있는지 확인합니다.
+
+    Returns:
+        데몬 사용 여부
+    """
+    return os.environ.get("STT_DAEMON") == "1"
+
+
+def connect_transcriber():
+    """
+    실행 중인 데몬에 연결해 전사기 프록시를 가져옵니다.
+
+    Returns:
+        transcribe_audio / transcribe_all / warmup을 가진 프록시
+    """
+    directory = runtime_dir()
+    socket_path = str(directory / SOCKET_NAME)
+    try:
+        authkey = (directory / AUTHKEY_NAME).read_bytes()
+        manager = STTClientManager(address=socket_path, authkey=authkey)
+        manager.connect()
+    except (FileNotFoundError, ConnectionRefusedError) as e:
+        raise RuntimeError(
+            f"STT 데몬에 연결할 수 없습니다 ({socket_path}): {e}\n"
+            "먼저 'python stt_server.py'로 데몬을 실행하세요."
+        )
+    return manager.transcriber()
+
+
+def get_transcriber(**kwargs):
+    """
+    STT_DAEMON=1이면 데몬 프록시를, 아니면 로컬 STTTranscriber를 반환합니다.
+    데몬 모드에서는 kwargs(모델 설정)가 무시되고 데몬에 로드된 모델을 사용합니다.
+
+    Args:
+        **kwargs: STTTranscriber 생성 인자
+
+    Returns:
+        STTTranscriber 또는 데몬 프록시
+    """
+    if daemon_enabled():
+        print(f"STT 데몬 사용: {runtime_dir() / SOCKET_NAME}")
+        return connect_transcriber()
+
+    from stt_transcriber import STTTranscriber
+    return STTTranscriber(**kwargs)
+
+
+def main():
+    """데몬 실행 함수"""
+    from config import Config
+    from stt_transcriber import STTTranscriber
+
+    # 모델을 로드하기 전에 사용자 전용 디렉토리부터 확인 (준비할 수 없으면 시작하지 않음)
+    directory = runtime_dir()
+    socket_path = str(directory / SOCKET_NAME)
+
+    transcriber = STTTranscriber(
+        model_type=Config.WHISPER_MODEL_TYPE,
+        model_path=Config.WHISPER_MODEL_PATH,
+        model_name=Config.WHISPER_MODEL_NAME,
+        mlx_model_name=Config.MLX_MODEL_NAME,
+        hf_home_path=Config.HF_HOME_PATH,
+        cache_folder=getattr(Config, 'TRANSCRIPT_CACHE_FOLDER', Config.PROJECT_ROOT / "cache"),
+        quantization=getattr(Config, 'WHISPER_QUANTIZATION', None),
+        mlx_fast_sdpa=getattr(Config, 'MLX_FAST_SDPA', False),
+        trim_short_mel=getattr(Config, 'WHISPER_TRIM_SHORT_MEL', False)
+    )
+    transcriber.warmup()
+    service = TranscriberService(transcriber)
+
+    # 이전 실행에서 남은 소켓 파일 정리
+    if os.path.exists(socket_path):
+        os.unlink(socket_path)
+
+    STTManager.register('transcriber', callable=lambda: service)
+    manager = STTManager(address=socket_path, authkey=_create_authkey(directory))
+    server = manager.get_server()
+
+    print("=" * 60)
+    print(f"STT 데몬 대기 중: {socket_path}")
+    print("종료하려면 Ctrl+C를 누르세요.")
+    print("=" * 60)
+    try:
+        server.serve_forever()
+    finally:
+        if os.path.exists(socket_path):
+            os.unlink(socket_path)
+
+
+if __name__ == "__main__":
+    try:
+        main()
+    except RuntimeError as e:
+        print(f"STT 데몬을 시작할 수 없습니다: {e}")
+    except KeyboardInterrupt:
+        print("\n\nSTT 데몬을 종료합니다.")
@@ -2,11 +2,46 @@
 Speech-to-Text transcription module using Whisper.
 Whisper 모델을 사용한 STT 전사 모듈입니다.
 openai-whisper와 mlx-whisper를 모두 지원합니다.
+coreml 타입은 openai-whisper 디코더에 CoreML(Neural Engine) 인코더를 결합합니다.
+whisperkit 타입은 인코더와 디코더를 모두 Neural Engine에서 실행하는 whisperkit-cli를 호출합니다.
 """
+import json
 import os
+import re
+import shutil
+import subprocess
+import tempfile
+import threading
+import wave
 from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from multiprocessing import get_context
 from typing import List, Optional
 from tqdm import tqdm
+from transcript_cache import TranscriptCache
+
+# 프로세스 안에서 같은 설정의 모델을 다시 로드하지 않도록 인스턴스 간 공유
+_MODEL_CACHE = {}
+_MODEL_CACHE_LOCK = threading.Lock()
+
+# 병렬 전사 워커 프로세스마다 한 번만 생성하는 전사기
+_WORKER_TRANSCRIBER = None
+
+
+def _init_worker(init_kwargs: dict):
+    """병렬 전사 워커 초기화 (모델은 pickle할 수 없으므로 워커 안에서 다시 로드)"""
+    global _WORKER_TRANSCRIBER
+    _WORKER_TRANSCRIBER = STTTranscriber(**init_kwargs)
+
+
+def _worker_transcribe(audio_file: Path, output_folder: Path, language: Optional[str], extract_srt: bool) -> str:
+    """워커 프로세스에서 파일 하나를 전사"""
+    return _WORKER_TRANSCRIBER.transcribe_audio(
+        audio_file,
+        output_folder,
+        language=language,
+        extract_srt=extract_srt
+    )
 
 
 class STTTranscriber:
@@ -14,47 +49,121 @@ class STTTranscriber:
     
     def __init__(
         self,
-        model_type: str = "openai",  # "openai" 또는 "mlx"
+        model_type: str = "openai",  # "openai", "mlx", "coreml" 또는 "whisperkit"
         model_path: Optional[Path] = None,
         model_name: str = "base",  # OpenAI Whisper 모델 이름
         mlx_model_name: str = "turbo",  # MLX Whisper 모델 이름 ("large" 또는 "turbo")
-        hf_home_path: Optional[Path] = None
+        hf_home_path: Optional[Path] = None,
+        cache_folder: Optional[Path] = None,
+        coreml_encoder_path: Optional[Path] = None,
+        quantization: Optional[str] = None,
+        mlx_fast_sdpa: bool = False,
+        trim_short_mel: bool = False
     ):
         """
         STTTranscriber 초기화
         
         Args:
-            model_type: 모델 타입 ("openai" 또는 "mlx")
-            model_path: Whisper 모델 파일 경로 (None이면 기본 모델 사용)
-            model_name: OpenAI Whisper 기본 모델 이름 ("base", "small", "medium", "large")
+            model_type: 모델 타입 ("openai", "mlx", "coreml" 또는 "whisperkit")
+                whisperkit은 macOS 14 이상, Apple Silicon, PATH의 whisperkit-cli가 필요
+            model_path: Whisper 모델 파일 경로 (None이면 기본 모델 사용.
+                whisperkit에서는 WhisperKit 모델 폴더)
+            model_name: OpenAI Whisper 기본 모델 이름 ("base", "small", "medium", "large").
+                whisperkit에서는 WhisperKit 모델 이름 (예: "large-v3")
             mlx_model_name: MLX Whisper 모델 이름 ("large" 또는 "turbo")
             hf_home_path: Hugging Face 홈 디렉토리 경로
+            cache_folder: 전사 결과 캐시 폴더 (None이면 캐시 사용 안 함)
+            coreml_encoder_path: CoreML 인코더 경로 (coreml 타입에서 None이면
+                모델 파일 옆의 ggml-{model_name}-encoder.mlmodelc 사용)
+            quantization: "int8" 또는 "int4"면 양자화 가중치 사용 (None이면 원본 가중치).
+                mlx는 4비트 모델("-q4")로, openai/coreml은 CPU에서 Linear 층 동적 int8 양자화로 적용
+            mlx_fast_sdpa: True이면 mlx 모델의 self-attention을 mx.fast.scaled_dot_product_attention
+                융합 커널로 실행 (word timestamp에 쓰이는 cross-attention은 기존 구현 유지)
+            trim_short_mel: True이면 짧은 파일 배치 디코딩(openai)에서 mel을 30초로 패딩하지 않고
+                배치 안 가장 긴 파일 길이까지만 인코딩
         """
         self.model_type = model_type.lower()
         self.model_path = model_path
         self.model_name = model_name
         self.mlx_model_name = mlx_model_name
         self.hf_home_path = hf_home_path
+        self.coreml_encoder_path = coreml_encoder_path
+        self.quantization = quantization.lower() if quantization else None
+        self.mlx_fast_sdpa = mlx_fast_sdpa
+        self.trim_short_mel = trim_short_mel
+        # 병렬 전사 워커에서 같은 설정으로 다시 생성하기 위한 인자
+        self._init_kwargs = {
+            "model_type": model_type,
+            "model_path": model_path,
+            "model_name": model_name,
+            "mlx_model_name": mlx_model_name,
+            "hf_home_path": hf_home_path,
+            "cache_folder": cache_folder,
+            "coreml_encoder_path": coreml_encoder_path,
+            "quantization": quantization,
+            "mlx_fast_sdpa": mlx_fast_sdpa,
+            "trim_short_mel": trim_short_mel
+        }
+        self.cache = TranscriptCache(cache_folder) if cache_folder else None
         self.model = None
         self._load_model()
     
+    def _model_id(self) -> str:
+        """캐시 키에 사용할 모델 식별자"""
+        if self.model_type == "mlx":
+            return str(self.model)
+        if self.model_type in ("coreml", "whisperkit"):
+            model_id = f"{self.model_type}:{self.model_path or self.model_name}"
+        else:
+            model_id = str(self.model_path or self.model_name)
+        # 양자화 모델은 결과가 조금 다르므로 캐시 키를 분리
+        if self.model_type != "whisperkit" and self.quantization in ("int8", "int4"):
+            model_id += f":dq-{self.quantization}"
+        return model_id
+    
     def _mlx_model_selection(self, mlx_model: str) -> str:
         """
         MLX 모델 이름 매핑 (p03_speech2text 참고)
         
         Args:
-            mlx_model: "large" 또는 "turbo"
+            mlx_model: "large", "turbo", "large-q4" 또는 "turbo-q4"
             
         Returns:
             MLX 모델 이름
         """
         model_mapping = {
             "large": "whisper-large-v3-mlx",
-            "turbo": "whisper-large-v3-turbo"
+            "turbo": "whisper-large-v3-turbo",
+            "large-q4": "whisper-large-v3-q4",
+            "turbo-q4": "whisper-large-v3-turbo-q4"
         }
+        # 양자화 옵션이 있으면 같은 모델의 4비트 버전 사용
+        if self.quantization in ("int8", "int4") and f"{mlx_model}-q4" in model_mapping:
+            mlx_model = f"{mlx_model}-q4"
         return model_mapping.get(mlx_model, "whisper-large-v3-turbo")
     
     def _load_model(self):
+        """Whisper 모델 로드 (같은 설정으로 이미 로드한 모델이 있으면 재사용)"""
+        key = (
+            self.model_type,
+            str(self.model_path or self.model_name),
+            self.mlx_model_name,
+            self.quantization,
+            str(self.coreml_encoder_path),
+            # 아래 두 옵션은 로드된 모델 인스턴스를 직접 바꾸므로 설정이 다르면 다른 인스턴스를 사용
+            self.mlx_fast_sdpa,
+            self.trim_short_mel
+        )
+        with _MODEL_CACHE_LOCK:
+            cached = _MODEL_CACHE.get(key)
+            if cached is not None:
+                self.model = cached
+                print("이미 로드된 모델 재사용")
+                return
+            self._load_model_from_disk()
+            _MODEL_CACHE[key] = self.model
+    
+    def _load_model_from_disk(self):
         """Whisper 모델 로드"""
         try:
             if self.model_type == "mlx":
@@ -74,9 +183,25 @@ class STTTranscriber:
                 
                 selected_model = self._mlx_model_selection(self.mlx_model_name)
                 print(f"MLX Whisper 모델 사용: {selected_model}")
-                # MLX는 실제 전사 시 로드하므로 여기서는 모델 이름만 저장
+                # mlx_whisper.transcribe는 repo 이름을 받으므로 모델 이름을 저장
                 self.model = f"mlx-community/{selected_model}"
                 
+                # transcribe(fp16 기본값)가 쓰는 ModelHolder 캐시에 가중치를 미리 한 번 올려 둠
+                # 이후 모든 파일은 같은 repo/dtype이므로 디스크에서 다시 로드하지 않음
+                self._apply_mlx_attention()
+                
+            elif self.model_type == "whisperkit":
+                # WhisperKit CLI 사용 (인코더/디코더 모두 Neural Engine)
+                cli_path = shutil.which("whisperkit-cli")
+                if cli_path is None:
+                    raise RuntimeError(
+                        "whisperkit-cli를 찾을 수 없습니다. "
+                        "brew install whisperkit-cli를 실행하세요 (macOS 14 이상, Apple Silicon)."
+                    )
+                print(f"WhisperKit 모델 사용: {self.model_path or self.model_name}")
+                # 모델은 whisperkit-cli가 실행 시 로드하므로 여기서는 CLI 경로만 저장
+                self.model = cli_path
+                
             else:
                 # OpenAI Whisper 모델 사용
                 import whisper
@@ -85,94 +210,300 @@ class STTTranscriber:
                     print(f"커스텀 모델 로드 중: {self.model_path}")
                     # 커스텀 모델 로드 (경로가 지정된 경우)
                     if self.model_path.is_file():
-                        # .pt 파일인 경우
-                        self.model = whisper.load_model(str(self.model_path))
+                        # .pt 파일인 경우 (mmap으로 로드)
+                        self.model = self._load_openai_checkpoint(self.model_path)
                     else:
                         # 디렉토리인 경우
                         self.model = whisper.load_model(str(self.model_path))
                 else:
                     print(f"OpenAI Whisper 모델 로드 중: {self.model_name}")
-                    self.model = whisper.load_model(self.model_name)
+                    if self.model_name in whisper._MODELS:
+                        # 다운로드 캐시의 .pt 파일을 mmap으로 로드
+                        checkpoint_path = whisper._download(
+                            whisper._MODELS[self.model_name],
+                            os.path.join(os.getenv("XDG_CACHE_HOME", os.path.join(os.path.expanduser("~"), ".cache")), "whisper"),
+                            False
+                        )
+                        self.model = self._load_openai_checkpoint(
+                            Path(checkpoint_path),
+                            alignment_heads=whisper._ALIGNMENT_HEADS.get(self.model_name)
+                        )
+                    else:
+                        self.model = whisper.load_model(self.model_name)
+                
+                if self.quantization in ("int8", "int4"):
+                    self._quantize_dynamic()
+                
+                if self.model_type == "coreml":
+                    self._attach_coreml_encoder()
             
             print("모델 로드 완료")
         except Exception as e:
             raise RuntimeError(f"모델 로드 실패: {e}")
     
+    def _apply_mlx_attention(self):
+        """
+        mlx_whisper ModelHolder에 캐시된 모델을 불러오고 이 인스턴스의 mlx_fast_sdpa 설정을 적용합니다.
+        ModelHolder는 프로세스 전체에서 모델 하나를 공유하므로 mlx 전사 직전마다 호출해
+        설정이 다른 STTTranscriber가 같은 프로세스에 있어도 서로의 attention 교체를 물려받지 않게 합니다.
+        """
+        try:
+            import mlx.core as mx
+            from mlx_whisper.transcribe import ModelHolder
+        except ImportError:
+            return
+        mlx_model = ModelHolder.get_model(self.model, mx.float16)
+        if self.mlx_fast_sdpa:
+            self._patch_mlx_fast_sdpa(mlx_model)
+        else:
+            self._unpatch_mlx_fast_sdpa(mlx_model)
+    
+    @staticmethod
+    def _unpatch_mlx_fast_sdpa(mlx_model):
+        """
+        _patch_mlx_fast_sdpa로 교체한 self-attention을 원래 클래스 메서드로 되돌립니다.
+        
+        Args:
+            mlx_model: mlx_whisper.whisper.Whisper 모델
+        """
+        for block in list(mlx_model.encoder.blocks) + list(mlx_model.decoder.blocks):
+            if "qkv_attention" in vars(block.attn):
+                del block.attn.qkv_attention
+    
+    @staticmethod
+    def _patch_mlx_fast_sdpa(mlx_model):
+        """
+        mlx_whisper 모델의 self-attention을 mx.fast.scaled_dot_product_attention 융합 커널로 교체합니다.
+        ModelHolder에 캐시된 모델 인스턴스만 바꾸므로 이후 mlx_whisper.transcribe 호출에 모두 적용됩니다.
+        cross-attention은 word timestamp 정렬에 쓰는 qk를 반환해야 하므로 그대로 둡니다.
+        
+        Args:
+            mlx_model: mlx_whisper.whisper.Whisper 모델
+        """
+        import types
+        import mlx.core as mx
+        
+        if not hasattr(getattr(mx, "fast", None), "scaled_dot_product_attention"):
+            print("경고: 이 MLX 버전에는 mx.fast.scaled_dot_product_attention이 없어 기본 attention을 사용합니다.")
+            return
+        
+        def fused_qkv_attention(attn, q, k, v, mask=None):
+            # 기존 qkv_attention과 같은 연산: q, k에 각각 d^-0.25를 곱하는 대신 scale=d^-0.5로 한 번에 적용
+            n_batch, n_ctx, n_state = q.shape
+            q = q.reshape(n_batch, n_ctx, attn.n_head, -1).transpose(0, 2, 1, 3)
+            k = k.reshape(*k.shape[:2], attn.n_head, -1).transpose(0, 2, 1, 3)
+            v = v.reshape(*v.shape[:2], attn.n_head, -1).transpose(0, 2, 1, 3)
+            if mask is not None:
+                mask = mask[:n_ctx, :n_ctx].astype(q.dtype)
+            out = mx.fast.scaled_dot_product_attention(
+                q, k, v, scale=(n_state // attn.n_head) ** -0.5, mask=mask
+            )
+            # self-attention의 qk는 호출하는 쪽에서 사용하지 않음
+            return out.transpose(0, 2, 1, 3).reshape(n_batch, n_ctx, n_state), None
+        
+        blocks = list(mlx_model.encoder.blocks) + list(mlx_model.decoder.blocks)
+        if all("qkv_attention" in vars(block.attn) for block in blocks):
+            return  # 이미 교체됨
+        for block in blocks:
+            block.attn.qkv_attention = types.MethodType(fused_qkv_attention, block.attn)
+        print("MLX self-attention: mx.fast.scaled_dot_product_attention 사용")
+    
+    @staticmethod
+    def _load_openai_checkpoint(checkpoint_path: Path, alignment_heads: Optional[bytes] = None):
+        """
+        openai-whisper .pt 체크포인트를 torch.load(mmap=True)로 로드합니다.
+        파일 전체를 중간 버퍼로 읽지 않고 페이지 캐시에서 바로 모델 파라미터로 복사합니다.
+        (mmap을 지원하지 않는 PyTorch 2.1 미만이나 예전 형식 체크포인트는 whisper.load_model로 로드)
+        
+        Args:
+            checkpoint_path: .pt 파일 경로
+            alignment_heads: 단어 타임스탬프용 alignment head (공식 모델만 있음)
+            
+        Returns:
+            whisper.model.Whisper
+        """
+        import torch
+        import whisper
+        from whisper.model import ModelDimensions, Whisper
+        
+        # Linux에서는 미리 읽기(readahead)를 요청해서 mmap 페이지 폴트를 줄임
+        if hasattr(os, "posix_fadvise"):
+            fd = os.open(checkpoint_path, os.O_RDONLY)
+            try:
+                os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+            finally:
+                os.close(fd)
+        
+        try:
+            checkpoint = torch.load(str(checkpoint_path), map_location="cpu", mmap=True, weights_only=True)
+        except (TypeError, RuntimeError):
+            # TypeError: mmap 미지원 PyTorch, RuntimeError: zipfile 형식이 아닌 예전 체크포인트
+            return whisper.load_model(str(checkpoint_path))
+        
+        model = Whisper(ModelDimensions(**checkpoint["dims"]))
+        # 공식 체크포인트는 fp16으로 저장되어 있으므로 assign 없이 fp32 파라미터로 복사
+        # (whisper.load_model과 같은 dtype; fp16 텐서를 그대로 쓰면 LayerNorm/동적 양자화에서 dtype 불일치)
+        model.load_state_dict(checkpoint["model_state_dict"])
+        if alignment_heads is not None:
+            model.set_alignment_heads(alignment_heads)
+        
+        device = "cuda" if torch.cuda.is_available() else "cpu"
+        return model.to(device)
+    
+    def _quantize_dynamic(self):
+        """
+        openai-whisper 모델의 Linear 층을 동적 int8 양자화합니다 (가중치 int8, 활성값은 실행 시 양자화).
+        정적 양자화는 Whisper 정확도가 크게 떨어지므로 사용하지 않습니다.
+        """
+        import torch
+        
+        if self.model.device.type != "cpu":
+            print(f"경고: 동적 양자화는 CPU에서만 지원되어 건너뜁니다 (현재 장치: {self.model.device})")
+            return
+        if self.quantization == "int4":
+            print("경고: PyTorch 동적 양자화는 int4를 지원하지 않아 int8로 적용합니다.")
+        
+        torch.quantization.quantize_dynamic(
+            self.model,
+            {torch.nn.Linear},
+            dtype=torch.qint8,
+            inplace=True
+        )
+        print("동적 int8 양자화 적용 완료")
+    
+    def _attach_coreml_encoder(self):
+        """
+        openai-whisper 모델의 인코더를 CoreML 인코더로 교체합니다.
+        인코더는 Neural Engine에서, 디코더(토큰 생성)는 기존 PyTorch 경로에서 실행됩니다.
+        """
+        from coreml_encoder import CoreMLEncoder
+        
+        encoder_path = self.coreml_encoder_path
+        if encoder_path is None:
+            # whisper.cpp 변환 스크립트의 출력 이름을 모델 파일 옆에서 찾음
+            model_dir = self.model_path.parent if self.model_path and self.model_path.is_file() else (self.model_path or Path("."))
+            encoder_path = Path(model_dir) / f"ggml-{self.model_name}-encoder.mlmodelc"
+        
+        print(f"CoreML 인코더 로드 중 (CPU + Neural Engine): {encoder_path}")
+        self.model.encoder = CoreMLEncoder(encoder_path, compute_units="CPU_AND_NE")
+    
+    def warmup(self, duration_seconds: float = 1.0):
+        """
+        짧은 무음 버퍼를 한 번 전사하여 모델을 미리 메모리/가속기에 올려둡니다.
+        첫 번째 실제 파일에서 가중치 로드와 초기화 비용이 발생하지 않도록 루프 전에 호출합니다.
+        
+        Args:
+            duration_seconds: 무음 버퍼 길이 (초)
+        """
+        import numpy as np
+        
+        if self.model_type == "whisperkit":
+            # CLI는 실행마다 모델을 로드하므로 미리 올려둘 수 없음
+            return
+        
+        silence = np.zeros(int(16000 * duration_seconds), dtype=np.float32)
+        try:
+            if self.model_type == "mlx":
+                import mlx_whisper
+                
+                # mlx_whisper는 같은 repo의 모델을 프로세스 내에서 재사용함
+                mlx_whisper.transcribe(
+                    silence,
+                    path_or_hf_repo=self.model,
+                    verbose=None
+                )
+            else:
+                self.model.transcribe(silence, verbose=None)
+            print("모델 워밍업 완료")
+        except Exception as e:
+            print(f"경고: 모델 워밍업 실패 (계속 진행): {e}")
+    
     def transcribe_audio(
         self,
         audio_path: Path,
         output_folder: Optional[Path] = None,
         output_filename: Optional[str] = None,
         language: Optional[str] = None,
-        extract_srt: bool = False
+        extract_srt: bool = False,
+        audio_array=None
     ) -> str:
         """
         오디오 파일을 텍스트로 전사합니다.
         
         Args:
-            audio_path: 오디오 파일 경로
+            audio_path: 오디오 파일 경로 (audio_array 사용 시 출력 파일명 기준으로만 사용)
             output_folder: 텍스트 파일 저장 폴더 (None이면 저장 안 함)
             output_filename: 출력 파일명 (None이면 자동 생성)
             language: 언어 코드 (예: "ko", "en"). None이면 자동 감지
             extract_srt: True이면 SRT 자막 파일도 생성
+            audio_array: 이미 디코딩된 16kHz 모노 float32 오디오 (None이면 audio_path에서 읽음)
             
         Returns:
             전사된 텍스트
         """
-        if not audio_path.exists():
+        if audio_array is None and not audio_path.exists():
             raise FileNotFoundError(f"오디오 파일을 찾을 수 없습니다: {audio_path}")
         
+        # Whisper는 파일 경로와 numpy 배열을 모두 입력으로 받음
+        audio_input = audio_array if audio_array is not None else str(audio_path)
+        
         try:
+            # 같은 내용의 오디오를 같은 모델/언어로 전사한 적이 있으면 캐시 사용
+            result = None
+            cache_key = None
+            if self.cache is not None and (audio_array is None or audio_path.exists()):
+                cache_key = self.cache.make_key(audio_path, self._model_id(), language)
+                result = self.cache.get(cache_key)
+                if result is not None:
+                    print(f"캐시된 전사 결과 사용: {audio_path.name}")
+            cache_hit = result is not None
+            
             # Whisper 전사
-            if self.model_type == "mlx":
+            if not cache_hit and self.model_type == "mlx":
                 # MLX Whisper 전사
                 import mlx_whisper
                 
                 # MLX Whisper는 자체적으로 진행률을 표시하므로
                 # verbose=False로 설정하여 출력 최소화 (tqdm과 충돌 방지)
                 try:
+                    self._apply_mlx_attention()
                     # SRT 추출이 필요한 경우 segments 정보도 가져오기
                     result = mlx_whisper.transcribe(
-                        str(audio_path),
+                        audio_input,
                         word_timestamps=extract_srt,  # SRT 추출 시 True
                         path_or_hf_repo=self.model,
                         verbose=False  # False로 설정하여 MLX의 자체 진행률 표시 최소화
                     )
-                    text = result["text"].strip()
-                    
-                    # SRT 파일 저장
-                    if extract_srt and output_folder and "segments" in result:
-                        self._save_srt_file(
-                            result=result,
-                            output_folder=output_folder,
-                            audio_path=audio_path
-                        )
-                    
                 except Exception as mlx_error:
                     raise RuntimeError(f"MLX Whisper 전사 중 오류: {mlx_error}")
-            else:
+            elif not cache_hit and self.model_type == "whisperkit":
+                result = self._whisperkit_transcribe(audio_path, language, audio_array)
+            elif not cache_hit:
                 # OpenAI Whisper 전사
                 if language:
                     result = self.model.transcribe(
-                        str(audio_path),
+                        audio_input,
                         language=language,
                         word_timestamps=extract_srt
                     )
                 else:
                     result = self.model.transcribe(
-                        str(audio_path),
+                        audio_input,
                         word_timestamps=extract_srt
                     )
-                
-                text = result["text"].strip()
-                
-                # SRT 파일 저장
-                if extract_srt and output_folder and "segments" in result:
-                    self._save_srt_file(
-                        result=result,
-                        output_folder=output_folder,
-                        audio_path=audio_path
-                    )
+            
+            if cache_key and not cache_hit:
+                self.cache.put(cache_key, result, self._model_id(), language)
+            
+            text = result["text"].strip()
+            
+            # SRT 파일 저장
+            if extract_srt and output_folder and "segments" in result:
+                self._save_srt_file(
+                    result=result,
+                    output_folder=output_folder,
+                    audio_path=audio_path
+                )
             
             # 텍스트 파일로 저장 (이미 존재하는 경우 건너뛰기)
             if output_folder:
@@ -193,6 +524,79 @@ class STTTranscriber:
         except Exception as e:
             raise RuntimeError(f"전사 실패 ({audio_path.name}): {e}")
     
+    def _whisperkit_transcribe(self, audio_path: Path, language: Optional[str], audio_array=None) -> dict:
+        """
+        whisperkit-cli로 전사하고 JSON 리포트를 {"text", "segments"} 형식으로 읽습니다.
+        
+        Args:
+            audio_path: 오디오 파일 경로
+            language: 언어 코드 (None이면 자동 감지)
+            audio_array: 이미 디코딩된 16kHz 모노 float32 오디오 (있으면 임시 WAV로 저장해서 전달)
+            
+        Returns:
+            Whisper transcribe와 같은 형식의 결과
+        """
+        with tempfile.TemporaryDirectory() as tmpdir:
+            tmpdir_path = Path(tmpdir)
+            if audio_array is not None:
+                input_path = tmpdir_path / f"{audio_path.stem}.wav"
+                self._write_wav(input_path, audio_array)
+            else:
+                input_path = Path(audio_path).resolve()
+            
+            cmd = [
+                self.model, "transcribe",
+                "--audio-path", str(input_path),
+                "--audio-encoder-compute-units", "cpuAndNeuralEngine",
+                "--text-decoder-compute-units", "cpuAndNeuralEngine",
+                "--report", "--report-path", str(tmpdir_path)
+            ]
+            if self.model_path:
+                cmd.extend(["--model-path", str(self.model_path)])
+            else:
+                cmd.extend(["--model", self.model_name])
+            if language:
+                cmd.extend(["--language", language])
+            
+            completed = subprocess.run(cmd, capture_output=True, text=True)
+            if completed.returncode != 0:
+                raise RuntimeError(f"whisperkit-cli 실패: {completed.stderr.strip()[:1000]}")
+            
+            report_path = tmpdir_path / f"{input_path.stem}.json"
+            with open(report_path, "r", encoding="utf-8") as f:
+                report = json.load(f)
+        
+        # 세그먼트 텍스트에 남는 특수 토큰(<|0.00|>, <|endoftext|> 등) 제거
+        special_tokens = re.compile(r"<\|[^|]*\|>")
+        segments = [
+            {
+                "start": float(segment["start"]),
+                "end": float(segment["end"]),
+                "text": special_tokens.sub("", segment.get("text", "")).strip()
+            }
+            for segment in report.get("segments", [])
+        ]
+        text = special_tokens.sub("", report.get("text", "")).strip()
+        return {"text": text, "segments": segments}
+    
+    @staticmethod
+    def _write_wav(path: Path, audio_array):
+        """
+        16kHz 모노 float32 오디오를 16비트 PCM WAV로 저장합니다.
+        
+        Args:
+            path: 저장할 WAV 경로
+            audio_array: -1.0~1.0 범위 float32 배열
+        """
+        import numpy as np
+        
+        pcm = (np.clip(audio_array, -1.0, 1.0) * 32767).astype("<i2")
+        with wave.open(str(path), "wb") as wav_file:
+            wav_file.setnchannels(1)
+            wav_file.setsampwidth(2)
+            wav_file.setframerate(16000)
+            wav_file.writeframes(pcm.tobytes())
+    
     def _save_srt_file(
         self,
         result: dict,
@@ -214,15 +618,18 @@ class STTTranscriber:
         srt_filename = audio_path.stem + "_SRT.srt"
         srt_path = output_folder / srt_filename
         
+        # 타임스탬프는 한 번에 변환하고, 파일 전체를 문자열로 만들어 한 번에 기록
+        segments = result["segments"]
+        start_times = self._format_timestamps([segment["start"] for segment in segments])
+        end_times = self._format_timestamps([segment["end"] for segment in segments])
+        texts = [segment["text"].strip() for segment in segments]
+        blob = "".join([
+            f"{idx}\n{start_time} --> {end_time}\n{text}\n\n"
+            for idx, (start_time, end_time, text) in enumerate(zip(start_times, end_times, texts), 1)
+        ])
+        
         with open(srt_path, "w", encoding="utf-8") as f:
-            for idx, segment in enumerate(result["segments"], 1):
-                start_time = self._format_timestamp(segment["start"])
-                end_time = self._format_timestamp(segment["end"])
-                text = segment["text"].strip()
-                
-                f.write(f"{idx}\n")
-                f.write(f"{start_time} --> {end_time}\n")
-                f.write(f"{text}\n\n")
+            f.write(blob)
         
         print(f"SRT 파일 저장: {srt_path}")
     
@@ -243,13 +650,340 @@ class STTTranscriber:
         
         return f"{hours:02d}:{minutes:02d}:{secs:02d},{millis:03d}"
     
+    def _format_timestamps(self, seconds_list: List[float]) -> List[str]:
+        """
+        여러 초 단위 시간을 한 번에 SRT 형식 (HH:MM:SS,mmm)으로 변환합니다.
+        _format_timestamp와 같은 연산을 NumPy 배열에 적용하므로 결과가 같습니다.
+        
+        Args:
+            seconds_list: 초 단위 시간 리스트
+            
+        Returns:
+            SRT 형식 타임스탬프 문자열 리스트
+        """
+        import numpy as np
+        
+        seconds = np.asarray(seconds_list, dtype=np.float64)
+        hours = (seconds // 3600).astype(np.int64).tolist()
+        minutes = ((seconds % 3600) // 60).astype(np.int64).tolist()
+        secs = (seconds % 60).astype(np.int64).tolist()
+        millis = ((seconds % 1) * 1000).astype(np.int64).tolist()
+        
+        return [
+            f"{h:02d}:{m:02d}:{s:02d},{ms:03d}"
+            for h, m, s, ms in zip(hours, minutes, secs, millis)
+        ]
+    
+    # Whisper 한 번의 디코딩 창 길이 (초). 이보다 짧은 파일만 묶어서 디코딩
+    BATCH_MAX_SECONDS = 30.0
+    
+    @staticmethod
+    def _audio_duration(audio_path: Path) -> Optional[float]:
+        """
+        WAV 헤더에서 오디오 길이(초)를 읽습니다.
+        
+        Args:
+            audio_path: 오디오 파일 경로
+            
+        Returns:
+            길이 (초). WAV가 아니거나 읽기 실패 시 None
+        """
+        if audio_path.suffix.lower() != ".wav":
+            return None
+        try:
+            with wave.open(str(audio_path), "rb") as wav_file:
+                return wav_file.getnframes() / float(wav_file.getframerate())
+        except (wave.Error, OSError):
+            return None
+    
+    @staticmethod
+    def read_wav_buffered(audio_path: Path, buffer_size: int = 1 << 20):
+        """
+        16kHz 모노 16비트 WAV를 큰 버퍼로 한 번에 읽어 float32 배열로 변환합니다.
+        ffmpeg(load_audio)의 s16le 디코딩과 같은 값(/32768)이므로 ffmpeg 프로세스 없이 대신 사용할 수 있습니다.
+        
+        Args:
+            audio_path: 오디오 파일 경로
+            buffer_size: 파일 읽기 버퍼 크기 (바이트)
+            
+        Returns:
+            numpy 배열 (WAV가 아니거나 16kHz 모노 16비트가 아니면 None)
+        """
+        import numpy as np
+        
+        if audio_path.suffix.lower() != ".wav":
+            return None
+        try:
+            with open(audio_path, "rb", buffering=buffer_size) as f, wave.open(f, "rb") as wav_file:
+                if (wav_file.getnchannels(), wav_file.getsampwidth(), wav_file.getframerate()) != (1, 2, 16000):
+                    return None
+                frames = wav_file.readframes(wav_file.getnframes())
+        except (wave.Error, EOFError):
+            return None
+        return np.frombuffer(frames, dtype="<i2").astype(np.float32) / 32768.0
+    
+    def _transcribe_short_batch(
+        self,
+        audio_files: List[Path],
+        output_folder: Path,
+        language: Optional[str],
+        batch_size: int
+    ) -> List[str]:
+        """
+        30초 이하 파일들을 길이순으로 묶어 whisper.decode 한 번에 배치 디코딩합니다.
+        (openai-whisper 전용, 타임스탬프 없이 파일당 세그먼트 1개)
+        whisper.decode가 쌓인 mel 배치에 인코더를 한 번만 실행하고,
+        현재 배치를 디코딩하는 동안 다음 배치의 오디오 디코딩(ffmpeg)을 백그라운드 스레드에서 미리 실행합니다.
+        
+        Args:
+            audio_files: 30초 이하 오디오 파일 리스트
+            output_folder: 텍스트 파일 저장 폴더
+            language: 언어 코드 (None이면 파일별 자동 감지)
+            batch_size: 한 번에 디코딩할 파일 수
+            
+        Returns:
+            전사된 텍스트 리스트
+        """
+        import torch
+        import whisper
+        
+        n_mels = getattr(self.model.dims, "n_mels", 80)
+        # CoreML 인코더는 입력 크기가 3000 프레임으로 고정되어 있으므로 openai 모델에만 적용
+        trim_mel = self.trim_short_mel and self.model_type == "openai"
+        if trim_mel:
+            self._allow_short_mel(self.model.encoder)
+        options = whisper.DecodingOptions(
+            language=language,
+            without_timestamps=True,
+            fp16=self.model.device.type == "cuda"
+        )
+        output_folder.mkdir(parents=True, exist_ok=True)
+        
+        def write_text(audio_file: Path, text: str):
+            output_path = output_folder / f"{audio_file.stem}.txt"
+            if not output_path.exists():
+                with open(output_path, "w", encoding="utf-8") as f:
+                    f.write(text)
+        
+        # transcribe_audio와 같이 캐시에 있는 파일은 디코딩하지 않음 (키는 저장할 때 다시 쓰므로 보관)
+        texts = []
+        cache_keys = {}
+        to_decode = []
+        for audio_file in audio_files:
+            if self.cache is not None:
+                cache_keys[audio_file] = self.cache.make_key(audio_file, self._model_id(), language)
+                cached = self.cache.get(cache_keys[audio_file])
+                if cached is not None:
+                    tqdm.write(f"  캐시된 전사 결과 사용: {audio_file.name}")
+                    text = cached.get("text", "").strip()
+                    write_text(audio_file, text)
+                    texts.append(text)
+                    continue
+            to_decode.append(audio_file)
+        if not to_decode:
+            return texts
+        
+        batches = [to_decode[start:start + batch_size] for start in range(0, len(to_decode), batch_size)]
+        
+        def load_batch(batch):
+            return [self._load_audio_array(audio_file) for audio_file in batch]
+        
+        loader = ThreadPoolExecutor(max_workers=1)
+        pending = loader.submit(load_batch, batches[0])
+        try:
+            for idx, batch in enumerate(batches):
+                audios = pending.result()
+                if idx + 1 < len(batches):
+                    pending = loader.submit(load_batch, batches[idx + 1])
+                
+                mels = torch.stack([
+                    whisper.log_mel_spectrogram(whisper.pad_or_trim(audio), n_mels=n_mels)
+                    for audio in audios
+                ]).to(self.model.device)
+                if trim_mel:
+                    # 10ms hop(160샘플) 기준 실제 길이까지만 남김 (conv stride 2에 맞춰 짝수 프레임)
+                    n_frames = -(-max(len(audio) for audio in audios) // whisper.audio.HOP_LENGTH)
+                    n_frames = min(mels.shape[-1], max(2, n_frames + n_frames % 2))
+                    mels = mels[..., :n_frames]
+                
+                decoded = whisper.decode(self.model, mels, options)
+                
+                for audio_file, audio, result in zip(batch, audios, decoded):
+                    text = result.text.strip()
+                    if self.cache is not None:
+                        self.cache.put(
+                            cache_keys[audio_file],
+                            {
+                                "text": text,
+                                "segments": [{"start": 0.0, "end": len(audio) / 16000, "text": text}]
+                            },
+                            self._model_id(),
+                            language
+                        )
+                    write_text(audio_file, text)
+                    texts.append(text)
+                tqdm.write(f"  ✓ 배치 디코딩 완료: {len(batch)}개 파일")
+        finally:
+            loader.shutdown(wait=False, cancel_futures=True)
+        
+        return texts
+    
+    @staticmethod
+    def _allow_short_mel(encoder):
+        """
+        openai-whisper AudioEncoder가 3000 프레임보다 짧은 mel도 받도록 forward를 교체합니다.
+        위치 임베딩을 입력 길이만큼 잘라 더하는 것 외에는 기존 forward와 같으므로
+        30초 입력의 결과는 바뀌지 않습니다.
+        
+        Args:
+            encoder: whisper.model.AudioEncoder
+        """
+        import types
+        import torch.nn.functional as F
+        
+        if getattr(encoder, "_allows_short_mel", False):
+            return
+        
+        def forward(enc, x):
+            x = F.gelu(enc.conv1(x))
+            x = F.gelu(enc.conv2(x))
+            x = x.permute(0, 2, 1)
+            x = (x + enc.positional_embedding[:x.shape[1]]).to(x.dtype)
+            for block in enc.blocks:
+                x = block(x)
+            return enc.ln_post(x)
+        
+        encoder.forward = types.MethodType(forward, encoder)
+        encoder._allows_short_mel = True
+    
+    def _load_audio_array(self, audio_path: Path):
+        """
+        오디오 파일을 16kHz 모노 float32 배열로 디코딩합니다 (백엔드의 load_audio 사용).
+        
+        Args:
+            audio_path: 오디오 파일 경로
+            
+        Returns:
+            numpy 배열
+        """
+        # 추출 단계에서 만든 16kHz 모노 WAV는 ffmpeg 없이 직접 읽음
+        audio = self.read_wav_buffered(audio_path)
+        if audio is not None:
+            return audio
+        if self.model_type == "mlx":
+            from mlx_whisper.audio import load_audio
+        else:
+            from whisper.audio import load_audio
+        return load_audio(str(audio_path))
+    
+    def _transcribe_parallel(
+        self,
+        audio_files: List[Path],
+        output_folder: Path,
+        language: Optional[str],
+        extract_srt: bool,
+        workers: int
+    ) -> List[str]:
+        """
+        spawn 프로세스 풀에서 파일별로 동시에 전사합니다.
+        
+        Args:
+            audio_files: 오디오 파일 경로 리스트
+            output_folder: 텍스트 파일 저장 폴더
+            language: 언어 코드
+            extract_srt: True이면 SRT 파일도 생성
+            workers: 워커 프로세스 수
+            
+        Returns:
+            전사된 텍스트 리스트 (입력 순서, 실패한 파일 제외)
+        """
+        workers = min(workers, len(audio_files))
+        print(f"\n총 {len(audio_files)}개의 파일을 {workers}개 프로세스로 동시에 전사합니다...\n")
+        
+        texts = [None] * len(audio_files)
+        executor = ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(self._init_kwargs,)
+        )
+        interrupted = False
+        try:
+            futures = {
+                executor.submit(_worker_transcribe, audio_file, output_folder, language, extract_srt): idx
+                for idx, audio_file in enumerate(audio_files)
+            }
+            for future in tqdm(as_completed(futures), total=len(futures), desc="STT 전사 진행", unit="파일"):
+                idx = futures[future]
+                audio_file = audio_files[idx]
+                try:
+                    texts[idx] = future.result()
+                    tqdm.write(f"  ✓ 완료: {audio_file.name} ({len(texts[idx])} 문자)")
+                except Exception as e:
+                    tqdm.write(f"  ✗ 오류 발생 ({audio_file.name}): {e}")
+        except KeyboardInterrupt:
+            tqdm.write(f"\n\n사용자에 의해 중단되었습니다.")
+            interrupted = True
+            raise
+        finally:
+            # 중단 시에는 실행 중인 워커의 현재 파일이 끝날 때까지 기다리지 않음
+            executor.shutdown(wait=not interrupted, cancel_futures=interrupted)
+        
+        return [text for text in texts if text is not None]
+    
+    @staticmethod
+    def _existing_names(folder: Path) -> set:
+        """
+        폴더의 파일명 집합 (파일마다 exists()를 호출하지 않도록 scandir 한 번으로 나열)
+        
+        Args:
+            folder: 확인할 폴더
+            
+        Returns:
+            파일명 집합 (폴더가 없으면 빈 집합)
+        """
+        try:
+            with os.scandir(folder) as entries:
+                return {entry.name for entry in entries}
+        except FileNotFoundError:
+            return set()
+    
+    @staticmethod
+    def _file_sizes(files: List[Path]) -> dict:
+        """
+        파일 크기를 폴더별 scandir 한 번으로 모읍니다 (파일마다 stat()을 호출하지 않음).
+        
+        Args:
+            files: 파일 경로 리스트
+            
+        Returns:
+            {파일 경로: 바이트 크기} (찾지 못한 파일은 제외)
+        """
+        wanted = {}
+        for file_path in files:
+            wanted.setdefault(file_path.parent, set()).add(file_path.name)
+        
+        sizes = {}
+        for folder, names in wanted.items():
+            try:
+                with os.scandir(folder) as entries:
+                    for entry in entries:
+                        if entry.name in names:
+                            sizes[folder / entry.name] = entry.stat().st_size
+            except FileNotFoundError:
+                continue
+        return sizes
+    
     def transcribe_all(
         self,
         audio_files: List[Path],
         output_folder: Path,
         language: Optional[str] = None,
         skip_existing: bool = True,
-        extract_srt: bool = False
+        extract_srt: bool = False,
+        batch_size: int = 1,
+        workers: int = 1,
+        load_existing: bool = False
     ) -> List[str]:
         """
         여러 오디오 파일을 일괄 전사합니다.
@@ -259,6 +993,12 @@ class STTTranscriber:
             output_folder: 텍스트 파일 저장 폴더
             language: 언어 코드 (None이면 자동 감지)
             skip_existing: True이면 이미 전사된 파일 건너뛰기
+            extract_srt: True이면 SRT 자막 파일도 생성
+            batch_size: 2 이상이면 30초 이하 파일을 묶어서 배치 디코딩
+                (openai-whisper에서 SRT 없이 전사할 때만 적용)
+            workers: 2 이상이면 워커 프로세스마다 모델을 로드해서 여러 파일을 동시에 전사
+                (워커마다 모델 메모리가 추가로 필요)
+            load_existing: True이면 건너뛴 파일의 기존 텍스트도 결과에 포함
             
         Returns:
             전사된 텍스트 리스트
@@ -272,16 +1012,17 @@ class STTTranscriber:
         # 이미 전사된 파일 필터링
         files_to_process = []
         if skip_existing:
+            existing_names = self._existing_names(output_folder)
             for audio_file in audio_files:
                 expected_txt = output_folder / f"{audio_file.stem}.txt"
-                if expected_txt.exists():
+                if expected_txt.name in existing_names:
                     print(f"건너뛰기 (이미 전사됨): {audio_file.name}")
-                    # 이미 있는 파일의 텍스트 읽기
-                    try:
-                        with open(expected_txt, 'r', encoding='utf-8') as f:
-                            transcribed_texts.append(f.read())
-                    except:
-                        pass
+                    # 요청한 경우에만 이미 있는 파일의 텍스트 읽기
+                    if load_existing:
+                        try:
+                            transcribed_texts.append(expected_txt.read_text(encoding="utf-8", errors="replace"))
+                        except OSError as e:
+                            print(f"경고: 기존 전사 파일 읽기 실패 ({expected_txt.name}): {e}")
                 else:
                     files_to_process.append(audio_file)
         else:
@@ -291,43 +1032,127 @@ class STTTranscriber:
             print("모든 파일이 이미 전사되었습니다.")
             return transcribed_texts
         
+        # 짧은 파일은 길이가 비슷한 것끼리 묶어서 배치 디코딩
+        if batch_size > 1 and self.model_type in ("openai", "coreml") and not extract_srt:
+            short_files = []
+            long_files = []
+            for audio_file in files_to_process:
+                duration = self._audio_duration(audio_file)
+                if duration is not None and duration <= self.BATCH_MAX_SECONDS:
+                    short_files.append((duration, audio_file))
+                else:
+                    long_files.append(audio_file)
+            
+            if short_files:
+                short_files.sort(key=lambda item: item[0])
+                print(f"\n{len(short_files)}개의 짧은 파일을 {batch_size}개씩 배치 디코딩합니다...")
+                try:
+                    transcribed_texts.extend(self._transcribe_short_batch(
+                        [audio_file for _, audio_file in short_files],
+                        output_folder,
+                        language,
+                        batch_size
+                    ))
+                except Exception as e:
+                    # 배치 디코딩 실패 시 파일별 전사로 처리
+                    print(f"경고: 배치 디코딩 실패, 파일별로 전사합니다: {e}")
+                    existing_names = self._existing_names(output_folder)
+                    long_files = [
+                        audio_file for _, audio_file in short_files
+                        if f"{audio_file.stem}.txt" not in existing_names
+                    ] + long_files
+            files_to_process = long_files
+            
+            if not files_to_process:
+                return transcribed_texts
+        
+        if workers > 1 and len(files_to_process) > 1:
+            transcribed_texts.extend(self._transcribe_parallel(
+                files_to_process,
+                output_folder,
+                language,
+                extract_srt,
+                workers
+            ))
+            return transcribed_texts
+        
         # tqdm으로 진행률 표시하며 전사
         print(f"\n총 {len(files_to_process)}개의 파일을 전사합니다...")
         print("(MLX Whisper는 각 파일당 2-10분 정도 소요될 수 있습니다)")
         print("(큰 파일의 경우 더 오래 걸릴 수 있습니다)\n")
         
+        transcribed_texts.extend(self._transcribe_serial(files_to_process, output_folder, language, extract_srt))
+        return transcribed_texts
+    
+    def _transcribe_serial(
+        self,
+        files_to_process: List[Path],
+        output_folder: Path,
+        language: Optional[str],
+        extract_srt: bool
+    ) -> List[str]:
+        """
+        파일을 하나씩 전사합니다.
+        현재 파일을 전사하는 동안 다음 파일의 오디오 디코딩(ffmpeg)을 백그라운드 스레드에서 미리 실행합니다.
+        
+        Args:
+            files_to_process: 오디오 파일 경로 리스트
+            output_folder: 텍스트 파일 저장 폴더
+            language: 언어 코드
+            extract_srt: True이면 SRT 파일도 생성
+            
+        Returns:
+            전사된 텍스트 리스트
+        """
         import time as time_module
         
-        for idx, audio_file in enumerate(tqdm(files_to_process, desc="STT 전사 진행", unit="파일"), 1):
-            try:
-                # 파일 정보 및 크기 출력
-                file_size_mb = audio_file.stat().st_size / (1024 * 1024)
-                tqdm.write(f"\n[{idx}/{len(files_to_process)}] 처리 중: {audio_file.name} ({file_size_mb:.1f} MB)")
-                
-                start_time = time_module.time()
-                
-                text = self.transcribe_audio(
-                    audio_file,
-                    output_folder,
-                    language=language,
-                    extract_srt=extract_srt
-                )
-                
-                elapsed_time = time_module.time() - start_time
-                
-                transcribed_texts.append(text)
-                tqdm.write(f"  ✓ 완료: {audio_file.name} ({elapsed_time/60:.1f}분 소요, {len(text)} 문자)")
-                
-            except KeyboardInterrupt:
-                tqdm.write(f"\n\n사용자에 의해 중단되었습니다.")
-                tqdm.write(f"진행 상황: {idx-1}/{len(files_to_process)} 완료")
-                break
-            except Exception as e:
-                elapsed = time_module.time() - start_time if 'start_time' in locals() else 0
-                error_msg = f"  ✗ 오류 발생 ({audio_file.name}): {e}"
-                tqdm.write(error_msg)
-                if elapsed > 0:
-                    tqdm.write(f"  경과 시간: {elapsed/60:.1f}분")
-                continue
+        transcribed_texts = []
+        file_sizes = self._file_sizes(files_to_process)
         
+        # whisperkit은 CLI에 파일 경로를 넘기므로 미리 디코딩하지 않음
+        loader = ThreadPoolExecutor(max_workers=1) if self.model_type in ("openai", "coreml", "mlx") else None
+        pending = loader.submit(self._load_audio_array, files_to_process[0]) if loader else None
+        try:
+            for idx, audio_file in enumerate(tqdm(files_to_process, desc="STT 전사 진행", unit="파일"), 1):
+                try:
+                    # 파일 정보 및 크기 출력
+                    file_size_mb = file_sizes.get(audio_file, 0) / (1024 * 1024)
+                    tqdm.write(f"\n[{idx}/{len(files_to_process)}] 처리 중: {audio_file.name} ({file_size_mb:.1f} MB)")
+                    
+                    start_time = time_module.time()
+                    
+                    audio_array = None
+                    if pending is not None:
+                        current = pending
+                        # 다음 파일 디코딩을 먼저 요청한 뒤 현재 파일 결과를 기다림
+                        pending = loader.submit(self._load_audio_array, files_to_process[idx]) if idx < len(files_to_process) else None
+                        audio_array = current.result()
+                    
+                    text = self.transcribe_audio(
+                        audio_file,
+                        output_folder,
+                        language=language,
+                        extract_srt=extract_srt,
+                        audio_array=audio_array
+                    )
+                    
+                    elapsed_time = time_module.time() - start_time
+                    
+                    transcribed_texts.append(text)
+                    tqdm.write(f"  ✓ 완료: {audio_file.name} ({elapsed_time/60:.1f}분 소요, {len(text)} 문자)")
+                    
+                except KeyboardInterrupt:
+                    tqdm.write(f"\n\n사용자에 의해 중단되었습니다.")
+                    tqdm.write(f"진행 상황: {idx-1}/{len(files_to_process)} 완료")
+                    break
+                except Exception as e:
+                    elapsed = time_module.time() - start_time if 'start_time' in locals() else 0
+                    error_msg = f"  ✗ 오류 발생 ({audio_file.name}): {e}"
+                    tqdm.write(error_msg)
+                    if elapsed > 0:
+                        tqdm.write(f"  경과 시간: {elapsed/60:.1f}분")
+                    continue
+        finally:
+            if loader is not None:
+                loader.shutdown(wait=False, cancel_futures=True)
         return transcribed_texts
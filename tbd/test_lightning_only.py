@@ -2,18 +2,63 @@
 Lightning-SimulWhisper 단독 테스트 스크립트
 MLX Whisper 없이 Lightning-SimulWhisper만 테스트
 """
+import argparse
+import functools
+import os
 import sys
 import time
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
+from typing import Optional
 
 # 프로젝트 루트를 sys.path에 추가
 project_root = Path(__file__).parent.parent
-sys.path.insert(0, str(project_root))
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
 
 from config import Config
 from stt_lightning_simulwhisper import LightningSimulWhisperTranscriber
 
 
+@functools.lru_cache(maxsize=8)
+def _list_wavs(folder: str, mtime_ns: int) -> tuple:
+    """폴더의 .wav 파일 목록 (폴더 수정 시각이 같으면 다시 나열하지 않음)"""
+    with os.scandir(folder) as entries:
+        return tuple(sorted(Path(e.path) for e in entries if e.name.endswith(".wav")))
+
+
+def list_wav_files(audio_folder: Path) -> list:
+    """
+    오디오 폴더의 .wav 파일 목록을 반환합니다.
+    
+    Args:
+        audio_folder: 오디오 폴더
+        
+    Returns:
+        파일명 순으로 정렬된 .wav 경로 리스트
+    """
+    return list(_list_wavs(str(audio_folder), audio_folder.stat().st_mtime_ns))
+
+
+# 프로세스마다 한 번만 만드는 전사기 (여러 파일 테스트 시 모델 재사용)
+_TRANSCRIBER: Optional[LightningSimulWhisperTranscriber] = None
+
+
+def _get_transcriber() -> LightningSimulWhisperTranscriber:
+    """Lightning-SimulWhisper 전사기 생성 (프로세스당 한 번)"""
+    global _TRANSCRIBER
+    if _TRANSCRIBER is None:
+        print("\nLightning-SimulWhisper 트랜스크라이버 초기화 중...")
+        _TRANSCRIBER = LightningSimulWhisperTranscriber(
+            model_name=Config.LIGHTNING_SIMUL_MODEL_NAME,
+            model_path=Config.LIGHTNING_SIMUL_MODEL_PATH,
+            use_coreml=Config.LIGHTNING_SIMUL_USE_COREML,
+            language="ko",
+            hf_home_path=Config.HF_HOME_PATH
+        )
+    return _TRANSCRIBER
+
+
 def test_lightning_only(audio_path: Path):
     """Lightning-SimulWhisper만 테스트"""
     if not audio_path.exists():
@@ -32,14 +77,7 @@ def test_lightning_only(audio_path: Path):
     output_folder.mkdir(parents=True, exist_ok=True)
     
     try:
-        print("\nLightning-SimulWhisper 트랜스크라이버 초기화 중...")
-        transcriber = LightningSimulWhisperTranscriber(
-            model_name=Config.LIGHTNING_SIMUL_MODEL_NAME,
-            model_path=Config.LIGHTNING_SIMUL_MODEL_PATH,
-            use_coreml=Config.LIGHTNING_SIMUL_USE_COREML,
-            language="ko",
-            hf_home_path=Config.HF_HOME_PATH
-        )
+        transcriber = _get_transcriber()
         
         print("\n전사 시작...")
         start_time = time.time()
@@ -71,28 +109,45 @@ def test_lightning_only(audio_path: Path):
 
 def main():
     """메인 함수"""
+    parser = argparse.ArgumentParser(description="Lightning-SimulWhisper 단독 테스트")
+    parser.add_argument("files", nargs="*", help="테스트할 오디오 파일 (경로 또는 오디오 폴더 안의 파일명)")
+    parser.add_argument("--all", action="store_true", help="오디오 폴더의 모든 .wav 파일 테스트")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="동시에 실행할 프로세스 수 (프로세스마다 모델을 따로 로드하므로 메모리 주의)")
+    args = parser.parse_args()
+    
     # 테스트 파일 선택
     audio_folder = Config.AUDIO_OUTPUT_FOLDER
     if not audio_folder.exists():
         print(f"오류: 오디오 폴더를 찾을 수 없습니다: {audio_folder}")
         return
     
-    audio_files = list(audio_folder.glob("*.wav"))
+    audio_files = list_wav_files(audio_folder)
     if not audio_files:
         print(f"오류: {audio_folder}에 .wav 파일이 없습니다.")
         return
     
-    if len(sys.argv) > 1:
+    if args.files:
         # 명령행 인자로 파일 지정
-        test_file = Path(sys.argv[1])
-        if not test_file.exists():
-            test_file = audio_folder / sys.argv[1]
-        test_lightning_only(test_file)
+        test_files = [Path(f) if Path(f).exists() else audio_folder / f for f in args.files]
+    elif args.all:
+        test_files = audio_files
     else:
         # 첫 번째 파일로 테스트
         print(f"사용 가능한 오디오 파일: {len(audio_files)}개")
         print(f"\n첫 번째 파일로 테스트: {audio_files[0].name}\n")
-        test_lightning_only(audio_files[0])
+        test_files = audio_files[:1]
+    
+    workers = max(1, min(args.workers, len(test_files), os.cpu_count() or 1))
+    if workers == 1:
+        results = [test_lightning_only(test_file) for test_file in test_files]
+    else:
+        print(f"{len(test_files)}개 파일을 {workers}개 프로세스로 테스트합니다.\n")
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(test_lightning_only, test_files))
+    
+    if len(test_files) > 1:
+        print(f"\n성공: {sum(1 for r in results if r)}/{len(test_files)}개")
 
 
 if __name__ == "__main__":
@@ -2,31 +2,115 @@
 Lightning-SimulWhisper 성능 및 기능 테스트 스크립트
 기존 MLX Whisper와 Lightning-SimulWhisper 비교 테스트
 """
+import argparse
 import sys
 import time
+from array import array
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Optional
 
+import numpy as np
+
 # 프로젝트 루트를 sys.path에 추가
 project_root = Path(__file__).parent.parent
-sys.path.insert(0, str(project_root))
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
 
 from config import Config
 from stt_transcriber import STTTranscriber
 from stt_lightning_simulwhisper import LightningSimulWhisperTranscriber
+from test_lightning_only import list_wav_files
+
+# 전사 결과 텍스트 저장은 측정 시간에 포함되지 않도록 백그라운드 스레드 하나에서 처리
+_writer = ThreadPoolExecutor(max_workers=1)
+
+
+def load_or_decode_audio(audio_path: Path, cache_folder: Optional[Path] = None, regenerate: bool = False):
+    """
+    오디오를 16kHz 모노 float32 배열로 디코딩합니다.
+    cache_folder가 있으면 (파일명, 수정 시각, 크기) 기준 .npy로 저장해 두고 다음 실행부터 재사용합니다.
+    
+    Args:
+        audio_path: 오디오 파일 경로
+        cache_folder: 디코딩 결과 캐시 폴더 (None이면 캐시 사용 안 함)
+        regenerate: True이면 캐시가 있어도 다시 디코딩
+        
+    Returns:
+        numpy 배열
+    """
+    from mlx_whisper.audio import load_audio
+    
+    # 16kHz 모노 WAV는 ffmpeg 없이 버퍼로 바로 읽음 (캐시보다 빠름)
+    audio = STTTranscriber.read_wav_buffered(audio_path)
+    if audio is not None:
+        return audio
+    if cache_folder is None:
+        return load_audio(str(audio_path))
+    
+    stat = audio_path.stat()
+    cache_path = cache_folder / f"{audio_path.stem}_{stat.st_mtime_ns}_{stat.st_size}.npy"
+    if cache_path.exists() and not regenerate:
+        return np.load(cache_path, mmap_mode="r")
+    
+    audio = load_audio(str(audio_path))
+    cache_folder.mkdir(parents=True, exist_ok=True)
+    np.save(cache_path, audio)
+    return audio
 
 
 class PerformanceComparison:
     """성능 비교 테스트 클래스"""
     
     def __init__(self):
-        self.results: Dict[str, Dict] = {}
+        # 통계용 결과는 테스트마다 한 칸씩 추가하는 열 단위 배열로 보관 (실패한 엔진의 시간은 NaN)
+        self.names: List[str] = []
+        self.mlx_time = array('d')
+        self.lightning_time = array('d')
+        # 텍스트 길이는 int32로 충분하므로 4바이트 정수 배열 사용
+        self.mlx_len = array('i')
+        self.lightning_len = array('i')
+        # 엔진별 전사기는 한 번만 생성해서 모든 파일에 재사용 (모델 초기화 비용이 파일마다 들지 않도록)
+        self._mlx_transcriber: Optional[STTTranscriber] = None
+        self._lightning_transcriber: Optional[LightningSimulWhisperTranscriber] = None
+        # 엔진별 모델 로드 시간 (파일별 전사 시간과 별도로 한 번만 기록)
+        self.load_times: Dict[str, float] = {}
+    
+    def _get_mlx_transcriber(self) -> STTTranscriber:
+        """MLX Whisper 전사기 생성 (첫 호출 때 한 번만 로드 및 워밍업)"""
+        if self._mlx_transcriber is None:
+            start_time = time.time()
+            self._mlx_transcriber = STTTranscriber(
+                model_type="mlx",
+                mlx_model_name=Config.MLX_MODEL_NAME,
+                hf_home_path=Config.HF_HOME_PATH
+            )
+            self._mlx_transcriber.warmup()
+            self.load_times["mlx"] = time.time() - start_time
+            print(f"  MLX Whisper 모델 로드: {self.load_times['mlx']:.2f}초")
+        return self._mlx_transcriber
+    
+    def _get_lightning_transcriber(self) -> LightningSimulWhisperTranscriber:
+        """Lightning-SimulWhisper 전사기 생성 (첫 호출 때 한 번만 로드)"""
+        if self._lightning_transcriber is None:
+            start_time = time.time()
+            self._lightning_transcriber = LightningSimulWhisperTranscriber(
+                model_name=Config.LIGHTNING_SIMUL_MODEL_NAME,
+                model_path=Config.LIGHTNING_SIMUL_MODEL_PATH,
+                use_coreml=Config.LIGHTNING_SIMUL_USE_COREML,
+                language="ko",
+                hf_home_path=Config.HF_HOME_PATH
+            )
+            self.load_times["lightning"] = time.time() - start_time
+            print(f"  Lightning-SimulWhisper 모델 로드: {self.load_times['lightning']:.2f}초")
+        return self._lightning_transcriber
     
     def test_single_file(
         self,
         audio_path: Path,
         output_base_folder: Path,
-        test_name: Optional[str] = None
+        test_name: Optional[str] = None,
+        audio_array=None
     ):
         """
         단일 파일로 두 엔진 비교 테스트
@@ -35,6 +119,7 @@ class PerformanceComparison:
             audio_path: 테스트할 오디오 파일 경로
             output_base_folder: 출력 폴더 (하위에 mlx, lightning 폴더 생성)
             test_name: 테스트 이름 (None이면 파일명 사용)
+            audio_array: 미리 디코딩한 오디오 (None이면 여기서 디코딩)
         """
         if not audio_path.exists():
             print(f"오류: 오디오 파일을 찾을 수 없습니다: {audio_path}")
@@ -59,73 +144,29 @@ class PerformanceComparison:
             "lightning": {}
         }
         
-        # 1. MLX Whisper 테스트
-        print("\n[1/2] MLX Whisper 테스트 시작...")
-        try:
-            mlx_transcriber = STTTranscriber(
-                model_type="mlx",
-                mlx_model_name=Config.MLX_MODEL_NAME,
-                hf_home_path=Config.HF_HOME_PATH
-            )
-            
+        # 오디오는 한 번만 디코딩해서 두 엔진에 같은 배열로 전달 (디코딩 시간은 비교에서 제외)
+        if audio_array is None:
             start_time = time.time()
-            mlx_text = mlx_transcriber.transcribe_audio(
-                audio_path=audio_path,
-                output_folder=mlx_output,
-                language="ko",
-                extract_srt=Config.EXTRACT_SRT
-            )
-            mlx_time = time.time() - start_time
-            
-            results["mlx"] = {
-                "success": True,
-                "time_seconds": mlx_time,
-                "text_length": len(mlx_text),
-                "output_path": mlx_output / f"{audio_path.stem}.txt"
-            }
-            print(f"  ✓ 완료: {mlx_time:.2f}초, {len(mlx_text)} 문자")
-            
-        except Exception as e:
-            results["mlx"] = {
-                "success": False,
-                "error": str(e)
-            }
-            print(f"  ✗ 실패: {e}")
+            audio_array = self._decode_audio(audio_path, output_base_folder)
+            print(f"오디오 디코딩: {time.time() - start_time:.2f}초")
         
-        # 2. Lightning-SimulWhisper 테스트
-        print("\n[2/2] Lightning-SimulWhisper 테스트 시작...")
-        try:
-            lightning_transcriber = LightningSimulWhisperTranscriber(
-                model_name=Config.LIGHTNING_SIMUL_MODEL_NAME,
-                model_path=Config.LIGHTNING_SIMUL_MODEL_PATH,
-                use_coreml=Config.LIGHTNING_SIMUL_USE_COREML,
-                language="ko",
-                hf_home_path=Config.HF_HOME_PATH
-            )
-            
-            start_time = time.time()
-            lightning_text = lightning_transcriber.transcribe_audio(
-                audio_path=audio_path,
-                output_folder=lightning_output,
-                language="ko",
-                extract_srt=Config.EXTRACT_SRT
-            )
-            lightning_time = time.time() - start_time
-            
-            results["lightning"] = {
-                "success": True,
-                "time_seconds": lightning_time,
-                "text_length": len(lightning_text),
-                "output_path": lightning_output / f"{audio_path.stem}.txt"
-            }
-            print(f"  ✓ 완료: {lightning_time:.2f}초, {len(lightning_text)} 문자")
-            
-        except Exception as e:
-            results["lightning"] = {
-                "success": False,
-                "error": str(e)
-            }
-            print(f"  ✗ 실패: {e}")
+        # 1. MLX Whisper / 2. Lightning-SimulWhisper 테스트
+        # PARALLEL_COMPARE이면 두 엔진을 동시에 실행 (같은 가속기를 쓰면 시간이 서로 영향을 받으므로 기본은 순차 실행)
+        engines = [
+            ("mlx", "[1/2] MLX Whisper", self._get_mlx_transcriber, mlx_output),
+            ("lightning", "[2/2] Lightning-SimulWhisper", self._get_lightning_transcriber, lightning_output)
+        ]
+        if getattr(Config, 'PARALLEL_COMPARE', False):
+            with ThreadPoolExecutor(max_workers=len(engines)) as executor:
+                futures = {
+                    key: executor.submit(self._run_engine, label, get_transcriber, audio_path, output_folder, audio_array)
+                    for key, label, get_transcriber, output_folder in engines
+                }
+                for key, future in futures.items():
+                    results[key] = future.result()
+        else:
+            for key, label, get_transcriber, output_folder in engines:
+                results[key] = self._run_engine(label, get_transcriber, audio_path, output_folder, audio_array)
         
         # 3. 성능 비교
         if results["mlx"].get("success") and results["lightning"].get("success"):
@@ -148,9 +189,73 @@ class PerformanceComparison:
             print(f"  Lightning-SimulWhisper: {lightning_len} 문자")
             print(f"  차이:                 {len_diff} 문자")
         
-        self.results[test_name] = results
+        self.names.append(test_name)
+        for engine, time_column, len_column in (
+            ("mlx", self.mlx_time, self.mlx_len),
+            ("lightning", self.lightning_time, self.lightning_len)
+        ):
+            engine_result = results[engine]
+            time_column.append(engine_result["time_seconds"] if engine_result.get("success") else float("nan"))
+            len_column.append(engine_result.get("text_length", 0))
         return results
     
+    @staticmethod
+    def _decode_audio(audio_path: Path, output_base_folder: Path):
+        """Config의 캐시 설정에 따라 오디오를 디코딩합니다."""
+        cache_folder = output_base_folder / "audio_cache" if getattr(Config, 'CACHE_FEATURES', False) else None
+        return load_or_decode_audio(
+            audio_path,
+            cache_folder=cache_folder,
+            regenerate=getattr(Config, 'CACHE_REGENERATE', False)
+        )
+    
+    def _run_engine(self, label: str, get_transcriber, audio_path: Path, output_folder: Path, audio_array) -> Dict:
+        """
+        한 엔진으로 파일 하나를 전사하고 결과를 기록합니다.
+        
+        Args:
+            label: 출력용 엔진 이름
+            get_transcriber: 전사기를 반환하는 함수
+            audio_path: 오디오 파일 경로
+            output_folder: 텍스트 저장 폴더
+            audio_array: 디코딩된 오디오 배열
+            
+        Returns:
+            {"success", "time_seconds", "text_length", "output_path"} 또는 {"success", "error"}
+        """
+        print(f"\n{label} 테스트 시작...")
+        try:
+            transcriber = get_transcriber()
+            
+            # SRT는 세그먼트가 필요하므로 전사기 안에서 저장하고, 텍스트만 저장할 때는 시간 측정 후 백그라운드로 저장
+            write_inline = Config.EXTRACT_SRT
+            start_time = time.time()
+            text = transcriber.transcribe_audio(
+                audio_path=audio_path,
+                output_folder=output_folder if write_inline else None,
+                language="ko",
+                extract_srt=Config.EXTRACT_SRT,
+                audio_array=audio_array
+            )
+            elapsed = time.time() - start_time
+            if not write_inline:
+                _writer.submit((output_folder / f"{audio_path.stem}.txt").write_text, text, encoding="utf-8")
+            
+            print(f"  ✓ {label} 완료: {elapsed:.2f}초, {len(text)} 문자")
+            return {
+                "success": True,
+                "time_seconds": elapsed,
+                "text_length": len(text),
+                "output_path": output_folder / f"{audio_path.stem}.txt"
+            }
+            
+        except Exception as e:
+            print(f"  ✗ {label} 실패: {e}")
+            return {
+                "success": False,
+                "error": str(e)
+            }
+    
     def test_multiple_files(
         self,
         audio_files: List[Path],
@@ -158,6 +263,8 @@ class PerformanceComparison:
     ):
         """
         여러 파일로 일괄 비교 테스트
+        엔진별 모델은 첫 파일에서 한 번만 로드하고, 파일은 크기순으로 처리합니다.
+        현재 파일을 전사하는 동안 다음 파일의 오디오 디코딩을 백그라운드 스레드에서 미리 실행합니다.
         
         Args:
             audio_files: 테스트할 오디오 파일 경로 리스트
@@ -167,9 +274,22 @@ class PerformanceComparison:
         print(f"일괄 비교 테스트 시작: {len(audio_files)}개 파일")
         print(f"{'=' * 80}\n")
         
-        for idx, audio_file in enumerate(audio_files, 1):
-            print(f"\n[{idx}/{len(audio_files)}]")
-            self.test_single_file(audio_file, output_base_folder)
+        audio_files = sorted(audio_files, key=lambda f: f.stat().st_size)
+        if not audio_files:
+            return
+        
+        loader = ThreadPoolExecutor(max_workers=1)
+        pending = loader.submit(self._decode_audio, audio_files[0], output_base_folder)
+        try:
+            for idx, audio_file in enumerate(audio_files, 1):
+                audio_array = pending.result()
+                if idx < len(audio_files):
+                    pending = loader.submit(self._decode_audio, audio_files[idx], output_base_folder)
+                
+                print(f"\n[{idx}/{len(audio_files)}]")
+                self.test_single_file(audio_file, output_base_folder, audio_array=audio_array)
+        finally:
+            loader.shutdown(wait=False, cancel_futures=True)
         
         # 전체 통계
         self.print_summary()
@@ -180,43 +300,63 @@ class PerformanceComparison:
         print("전체 테스트 결과 요약")
         print("=" * 80)
         
-        total_tests = len(self.results)
-        successful_both = sum(
-            1 for r in self.results.values()
-            if r["mlx"].get("success") and r["lightning"].get("success")
-        )
+        total_tests = len(self.names)
+        mlx_t = np.frombuffer(self.mlx_time, dtype=np.float64)
+        lightning_t = np.frombuffer(self.lightning_time, dtype=np.float64)
+        both = ~(np.isnan(mlx_t) | np.isnan(lightning_t))
+        successful_both = int(both.sum())
         
         print(f"\n총 테스트: {total_tests}개")
         print(f"양쪽 모두 성공: {successful_both}개")
         
+        # 모델 로드 시간은 한 번만 발생하므로 파일별 처리 시간과 따로 표시
+        if self.load_times:
+            print(f"\n모델 로드 시간 (1회):")
+            if "mlx" in self.load_times:
+                print(f"  MLX Whisper:          {self.load_times['mlx']:.2f}초")
+            if "lightning" in self.load_times:
+                print(f"  Lightning-SimulWhisper: {self.load_times['lightning']:.2f}초")
+        
         if successful_both > 0:
-            mlx_times = [
-                r["mlx"]["time_seconds"]
-                for r in self.results.values()
-                if r["mlx"].get("success")
-            ]
-            lightning_times = [
-                r["lightning"]["time_seconds"]
-                for r in self.results.values()
-                if r["lightning"].get("success")
-            ]
+            mlx_ok = mlx_t[~np.isnan(mlx_t)]
+            lightning_ok = lightning_t[~np.isnan(lightning_t)]
             
-            avg_speedup = sum(
-                r["mlx"]["time_seconds"] / r["lightning"]["time_seconds"]
-                for r in self.results.values()
-                if r["mlx"].get("success") and r["lightning"].get("success") and r["lightning"]["time_seconds"] > 0
-            ) / successful_both
+            # 양쪽 모두 성공한 파일의 속도 향상 (비율이므로 기하 평균, 시간이 0인 파일은 제외)
+            mlx_both, lightning_both = mlx_t[both], lightning_t[both]
+            valid = (mlx_both > 0) & (lightning_both > 0)
+            speedups = mlx_both[valid] / lightning_both[valid]
             
             print(f"\n평균 처리 시간:")
-            if mlx_times:
-                print(f"  MLX Whisper:          {sum(mlx_times)/len(mlx_times):.2f}초")
-            if lightning_times:
-                print(f"  Lightning-SimulWhisper: {sum(lightning_times)/len(lightning_times):.2f}초")
-            print(f"\n평균 속도 향상: {avg_speedup:.2f}x")
+            if mlx_ok.size:
+                print(f"  MLX Whisper:          {mlx_ok.mean():.2f}초")
+            if lightning_ok.size:
+                print(f"  Lightning-SimulWhisper: {lightning_ok.mean():.2f}초")
+            if speedups.size:
+                p50, p90 = np.quantile(speedups, [0.5, 0.9])
+                print(f"\n평균 속도 향상 (기하 평균): {np.exp(np.log(speedups).mean()):.2f}x")
+                print(f"  중앙값: {p50:.2f}x, p90: {p90:.2f}x")
+            
+            # 양쪽 모두 성공한 파일의 텍스트 길이 비교
+            mlx_l = np.frombuffer(self.mlx_len, dtype=np.int32)[both]
+            lightning_l = np.frombuffer(self.lightning_len, dtype=np.int32)[both]
+            len_diff = np.abs(mlx_l.astype(np.int64) - lightning_l)
+            print(f"\n평균 텍스트 길이:")
+            print(f"  MLX Whisper:          {mlx_l.mean():.0f} 문자")
+            print(f"  Lightning-SimulWhisper: {lightning_l.mean():.0f} 문자")
+            print(f"  차이 (평균/최대):     {len_diff.mean():.0f} / {len_diff.max()} 문자")
 
 
 def main():
     """메인 테스트 함수"""
+    parser = argparse.ArgumentParser(description="Lightning-SimulWhisper vs MLX Whisper 성능 비교 테스트")
+    parser.add_argument("files", nargs="*", help="테스트할 오디오 파일 (지정하면 이 파일들만 비교)")
+    parser.add_argument("--batch", choices=["1", "2", "3"],
+                        help="대화형 선택 대신 실행할 방법 (1: 단일 파일, 2: 처음 3개, 3: 모든 파일)")
+    parser.add_argument("--index", type=int, default=1, help="--batch 1에서 테스트할 파일 번호 (기본 1)")
+    args = parser.parse_args()
+    # 파일이나 방법을 명령행으로 지정하면 입력을 기다리지 않고 실행
+    unattended = bool(args.files or args.batch)
+    
     print("=" * 80)
     print("Lightning-SimulWhisper vs MLX Whisper 성능 비교 테스트")
     print("=" * 80)
@@ -225,9 +365,10 @@ def main():
     if not Config.LIGHTNING_SIMUL_WHISPER_ENABLED:
         print("\n경고: Config.LIGHTNING_SIMUL_WHISPER_ENABLED가 False로 설정되어 있습니다.")
         print("테스트를 진행하려면 config.py에서 True로 변경하세요.")
-        response = input("그래도 계속하시겠습니까? (y/n): ")
-        if response.lower() != 'y':
-            return
+        if not unattended:
+            response = input("그래도 계속하시겠습니까? (y/n): ")
+            if response.lower() != 'y':
+                return
     
     # 테스트 파일 선택
     audio_folder = Config.AUDIO_OUTPUT_FOLDER
@@ -236,7 +377,7 @@ def main():
         return
     
     # 사용 가능한 오디오 파일 목록
-    audio_files = list(audio_folder.glob("*.wav"))
+    audio_files = list_wav_files(audio_folder)
     if not audio_files:
         print(f"오류: {audio_folder}에 .wav 파일이 없습니다.")
         return
@@ -244,24 +385,31 @@ def main():
     print(f"\n사용 가능한 오디오 파일: {len(audio_files)}개")
     
     # 단일 파일 테스트 또는 일괄 테스트 선택
-    if len(sys.argv) > 1:
+    if args.files:
         # 명령행 인자로 파일 지정
-        test_file = Path(sys.argv[1])
-        if not test_file.exists():
-            print(f"오류: 파일을 찾을 수 없습니다: {test_file}")
+        test_files = [Path(f) for f in args.files]
+        missing = [f for f in test_files if not f.exists()]
+        if missing:
+            print(f"오류: 파일을 찾을 수 없습니다: {', '.join(str(f) for f in missing)}")
             return
         
         comparator = PerformanceComparison()
         output_folder = project_root / "test_output"
-        comparator.test_single_file(test_file, output_folder)
+        if len(test_files) == 1:
+            comparator.test_single_file(test_files[0], output_folder)
+        else:
+            comparator.test_multiple_files(test_files, output_folder)
     else:
-        # 대화형 선택
-        print("\n테스트 방법 선택:")
-        print("1. 단일 파일 테스트")
-        print("2. 여러 파일 일괄 테스트 (처음 3개)")
-        print("3. 모든 파일 테스트")
-        
-        choice = input("\n선택 (1/2/3): ").strip()
+        if args.batch:
+            choice = args.batch
+        else:
+            # 대화형 선택
+            print("\n테스트 방법 선택:")
+            print("1. 단일 파일 테스트")
+            print("2. 여러 파일 일괄 테스트 (처음 3개)")
+            print("3. 모든 파일 테스트")
+            
+            choice = input("\n선택 (1/2/3): ").strip()
         
         comparator = PerformanceComparison()
         output_folder = project_root / "test_output"
@@ -273,7 +421,7 @@ def main():
                 size_mb = f.stat().st_size / (1024 * 1024)
                 print(f"  {idx}. {f.name} ({size_mb:.1f} MB)")
             
-            file_idx = int(input("\n파일 번호 선택: ")) - 1
+            file_idx = (args.index if args.batch else int(input("\n파일 번호 선택: "))) - 1
             if 0 <= file_idx < len(audio_files):
                 comparator.test_single_file(audio_files[file_idx], output_folder)
             else:
@@ -283,7 +431,7 @@ def main():
             comparator.test_multiple_files(audio_files[:3], output_folder)
         
         elif choice == "3":
-            confirm = input(f"\n{len(audio_files)}개 파일을 모두 테스트합니다. 계속하시겠습니까? (y/n): ")
+            confirm = 'y' if args.batch else input(f"\n{len(audio_files)}개 파일을 모두 테스트합니다. 계속하시겠습니까? (y/n): ")
             if confirm.lower() == 'y':
                 comparator.test_multiple_files(audio_files, output_folder)
         
@@ -99,7 +99,8 @@ def test_single_file():
         text = transcriber.transcribe_audio(
             audio_path=extracted_audio,
             output_folder=text_output_folder,
-            language="ko"
+            language="ko",
+            audio_array=STTTranscriber.read_wav_buffered(extracted_audio)
         )
         
         print(f"\n전사 완료!")
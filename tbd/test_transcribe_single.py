@@ -1,6 +1,7 @@
 """
 단일 파일 STT 전사 테스트 (디버깅용)
 """
+import os
 import sys
 from pathlib import Path
 from config import Config
@@ -24,10 +25,15 @@ def test_single_transcribe():
     print("=" * 60)
     
     # 처리되지 않은 wav 파일 찾기
-    wav_files = list(audio_output_folder.glob("*.wav"))
-    transcribed_files = {f.stem for f in text_output_folder.glob("*.txt")}
-    
-    files_to_process = [f for f in wav_files if f.stem not in transcribed_files]
+    # 폴더마다 scandir 한 번으로 나열하고 파일명(stem) 집합 차이로 대상 선택
+    with os.scandir(text_output_folder) as entries:
+        transcribed_files = {e.name[:-4] for e in entries if e.name.endswith(".txt")}
+    with os.scandir(audio_output_folder) as entries:
+        files_to_process = [
+            Path(e.path)
+            for e in entries
+            if e.name.endswith(".wav") and e.name[:-4] not in transcribed_files
+        ]
     
     if not files_to_process:
         print("처리할 파일이 없습니다.")
@@ -63,7 +69,8 @@ def test_single_transcribe():
         text = transcriber.transcribe_audio(
             audio_path=test_file,
             output_folder=text_output_folder,
-            language="ko"
+            language="ko",
+            audio_array=STTTranscriber.read_wav_buffered(test_file)
         )
         
         transcribe_time = time.time() - transcribe_start
@@ -1,6 +1,7 @@
 """
 작은 파일로 STT 전사 테스트
 """
+import os
 import sys
 from pathlib import Path
 from config import Config
@@ -12,10 +13,15 @@ def find_smallest_wav():
     audio_output_folder = Config.AUDIO_OUTPUT_FOLDER
     text_output_folder = Config.TEXT_OUTPUT_FOLDER
     
-    wav_files = list(audio_output_folder.glob("*.wav"))
-    transcribed_files = {f.stem for f in text_output_folder.glob("*.txt")}
-    
-    files_to_process = [(f, f.stat().st_size) for f in wav_files if f.stem not in transcribed_files]
+    # 폴더마다 scandir 한 번으로 나열하고, 크기는 처리 대상 파일만 조회
+    with os.scandir(text_output_folder) as entries:
+        transcribed_files = {e.name[:-4] for e in entries if e.name.endswith(".txt")}
+    with os.scandir(audio_output_folder) as entries:
+        files_to_process = [
+            (Path(e.path), e.stat().st_size)
+            for e in entries
+            if e.name.endswith(".wav") and e.name[:-4] not in transcribed_files
+        ]
     
     if not files_to_process:
         print("처리할 파일이 없습니다.")
@@ -74,7 +80,8 @@ def test_small_file():
         text = transcriber.transcribe_audio(
             audio_path=test_file,
             output_folder=text_output_folder,
-            language="ko"
+            language="ko",
+            audio_array=STTTranscriber.read_wav_buffered(test_file)
         )
         
         transcribe_time = time.time() - transcribe_start
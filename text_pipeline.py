@@ -0,0 +1,222 @@
+"""
+Shared driver for structuring transcribed and record text files.
+전사 텍스트/레코드 텍스트 구조화를 하나로 처리하는 공통 드라이버입니다.
+
+사용법:
+    from text_pipeline import run
+    run("default")            # transcribed 폴더 처리
+    run("record", test=True)  # record_text_raw 폴더의 첫 파일만 테스트
+"""
+import functools
+from typing import Literal
+from config import Config
+from text_processor import TextProcessor
+
+
+@functools.lru_cache(maxsize=1)
+def build_record_prompt():
+    """레코드 텍스트용 프롬프트 구성 (프로세스당 한 번만 조합)"""
+    # 기존 프롬프트에 시간 순서 대화 형식 요구사항 추가
+    context_query = Config.CONTEXT_QUERY
+    main_query = Config.MAIN_QUERY
+    additional_query = Config.ADDITIONAL_QUERY
+    math_specific_query = Config.MATH_SPECIFIC_QUERY
+    timestamp_dialogue_query = Config.TIMESTAMP_DIALOGUE_QUERY
+    example_query = Config.EXAMPLE_QUERY
+    tone_query = Config.TONE_QUERY
+
+    # 시간 순서 정보를 포함한 컨텍스트
+    enhanced_context = context_query + "\n\n**Important**: This content is from a time-stamped dialogue recording with chronological markers (e.g., \"참석자 1 00:30\")."
+
+    return (
+        enhanced_context,
+        main_query,
+        additional_query,
+        math_specific_query + "\n\n" + timestamp_dialogue_query,  # 수학 요구사항 + 시간 순서 요구사항 결합
+        example_query,
+        tone_query
+    )
+
+
+def _build_default_prompt():
+    """전사 텍스트용 기본 프롬프트 구성"""
+    return (
+        Config.CONTEXT_QUERY,
+        Config.MAIN_QUERY,
+        Config.ADDITIONAL_QUERY,
+        Config.MATH_SPECIFIC_QUERY,
+        Config.EXAMPLE_QUERY,
+        Config.TONE_QUERY
+    )
+
+
+# 모드별 입력 폴더, 프롬프트, 출력 제목
+MODES = {
+    "default": {
+        "input_folder": lambda: Config.TEXT_OUTPUT_FOLDER,
+        "prompt": _build_default_prompt,
+        "title": "텍스트 구조화 파이프라인",
+        "test_title": "단일 파일 테스트"
+    },
+    "record": {
+        "input_folder": lambda: Config.RECORD_TEXT_RAW_FOLDER,
+        "prompt": build_record_prompt,
+        "title": "레코드 텍스트 구조화 파이프라인 (시간 순서 대화 형식)",
+        "test_title": "단일 레코드 파일 테스트"
+    }
+}
+
+
+def build_processing_kwargs(mode: str = "default") -> dict:
+    """
+    Config에서 텍스트 구조화 옵션을 읽어 process_* 호출 인자로 묶습니다.
+
+    Args:
+        mode: "default" 또는 "record"
+
+    Returns:
+        process_all_files / process_single_file에 넘길 키워드 인자
+    """
+    (context_query, main_query, additional_query,
+     math_specific_query, example_query, tone_query) = MODES[mode]["prompt"]()
+    # 파일과 무관한 프롬프트 앞부분은 실행마다 한 번만 조합
+    prebuilt_prompt = TextProcessor.build_prompt_prefix(
+        context_query, main_query, additional_query,
+        math_specific_query, example_query, tone_query
+    )
+    return {
+        "output_folder": Config.STRUCTURED_OUTPUT_FOLDER,
+        "context_query": context_query,
+        "main_query": main_query,
+        "additional_query": additional_query,
+        "math_specific_query": math_specific_query,
+        "example_query": example_query,
+        "tone_query": tone_query,
+        "token_range": Config.TOKEN_RANGE,
+        "language": Config.LANGUAGE,
+        "style": Config.OUTPUT_STYLE,
+        "save_html": Config.SAVE_HTML,
+        "html_template": Config.HTML_TEMPLATE,
+        "prebuilt_prompt": prebuilt_prompt
+    }
+
+
+def create_processor():
+    """
+    Config 설정으로 TextProcessor를 생성합니다.
+
+    Returns:
+        TextProcessor (초기화 실패 시 안내 메시지 출력 후 None)
+    """
+    api_key_path = Config.API_KEY_PATH
+    try:
+        return TextProcessor(
+            api_key_path=api_key_path if api_key_path else None,
+            api_key_file=Config.OPENAI_API_KEY_FILE,
+            model=Config.GPT_MODEL,
+            requests_per_minute=getattr(Config, 'GPT_RPM_LIMIT', None),
+            tokens_per_minute=getattr(Config, 'GPT_TPM_LIMIT', None)
+        )
+    except Exception as e:
+        print(f"초기화 실패: {e}")
+        print("\n해결 방법:")
+        print(".env 파일에 OPENAI_API_KEY를 설정해주세요.")
+        return None
+
+
+def _run_all(mode: str):
+    """폴더의 모든 파일 처리"""
+    settings = MODES[mode]
+    text_folder = settings["input_folder"]()
+    kwargs = build_processing_kwargs(mode)
+    output_folder = kwargs["output_folder"]
+
+    print("=" * 60)
+    print(settings["title"])
+    print("=" * 60)
+    print(f"입력 폴더: {text_folder}")
+    print(f"출력 폴더: {output_folder}")
+    print(f"GPT 모델: {Config.GPT_MODEL}")
+    print("=" * 60)
+    print()
+
+    # TextProcessor 초기화
+    processor = create_processor()
+    if processor is None:
+        return
+
+    # 모든 파일 처리
+    if getattr(Config, 'GPT_USE_BATCH_API', False):
+        # 결과를 기다릴 필요 없는 대량 처리는 Batch API로 (비용 절감, 최대 24시간 소요)
+        processed_files = processor.process_all_files_batch(text_folder=text_folder, **kwargs)
+    else:
+        processed_files = processor.process_all_files(
+            text_folder=text_folder,
+            max_concurrency=getattr(Config, 'GPT_CONCURRENCY', 4),
+            render_workers=getattr(Config, 'RENDER_WORKERS', 1),
+            **kwargs
+        )
+
+    print()
+    print("=" * 60)
+    md_count = len(processed_files)
+    html_count = sum(1 for _, html_path in processed_files if html_path is not None)
+    print(f"처리 완료: {md_count}개 마크다운 파일")
+    if kwargs["save_html"]:
+        print(f"HTML 파일: {html_count}개")
+    print(f"결과 폴더: {output_folder}")
+    print("=" * 60)
+
+
+def _run_single_test(mode: str):
+    """첫 번째 파일만 처리하는 테스트"""
+    settings = MODES[mode]
+    text_folder = settings["input_folder"]()
+    kwargs = build_processing_kwargs(mode)
+
+    print("=" * 60)
+    print(settings["test_title"])
+    print("=" * 60)
+
+    processor = create_processor()
+    if processor is None:
+        return
+
+    # 첫 번째 파일만 처리
+    text_files = processor.find_text_files(text_folder)
+    if not text_files:
+        print("처리할 파일이 없습니다.")
+        return
+
+    test_file = text_files[0]
+    print(f"테스트 파일: {test_file.name}\n")
+
+    result = processor.process_single_file(text_file=test_file, **kwargs)
+
+    if result:
+        md_path, html_path = result
+        print(f"\n테스트 완료:")
+        print(f"  마크다운: {md_path}")
+        if html_path:
+            print(f"  HTML: {html_path}")
+    else:
+        print("\n테스트 실패")
+
+
+def run(mode: Literal["default", "record"] = "default", test: bool = False):
+    """
+    텍스트 구조화 파이프라인 실행
+
+    Args:
+        mode: "default"이면 전사 텍스트, "record"이면 시간 스탬프 레코드 텍스트 처리
+        test: True이면 첫 번째 파일만 처리
+    """
+    if mode not in MODES:
+        raise ValueError(f"지원하지 않는 모드: {mode} (사용 가능: {list(MODES)})")
+
+    Config.create_directories()
+
+    if test:
+        _run_single_test(mode)
+    else:
+        _run_all(mode)
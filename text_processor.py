@@ -2,13 +2,20 @@
 Text processing module for structuring transcribed text using GPT.
 transcribed 폴더의 텍스트 파일을 구조화하는 모듈입니다.
 """
+import functools
 import json
+import os
+import random
+import re
+import tempfile
+import threading
 import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, wait
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import Callable, List, Optional, Tuple
 from datetime import datetime
 import tiktoken
-from openai import OpenAI
+from openai import APIConnectionError, APITimeoutError, InternalServerError, OpenAI, RateLimitError
 
 try:
     import markdown
@@ -17,11 +24,204 @@ except ImportError:
     MARKDOWN_AVAILABLE = False
     print("경고: markdown 라이브러리가 설치되지 않았습니다. HTML 변환을 사용하려면 'pip install markdown'을 실행하세요.")
 
+# tiktoken 기본 캐시(임시 폴더)는 재부팅 시 지워지므로 BPE 어휘 파일을 프로젝트 cache 폴더에 보관
+os.environ.setdefault("TIKTOKEN_CACHE_DIR", str(Path(__file__).parent / "cache" / "tiktoken"))
+
+
+# .env의 OPENAI_API_KEY 줄 (값 앞뒤 공백과 따옴표 제외)
+_ENV_API_KEY_PATTERN = re.compile(r'^[ \t]*OPENAI_API_KEY[ \t]*=[ \t]*["\']?([^"\'\s]+)', re.M)
+
+
+# 기본 HTML 래퍼 템플릿 ({title}, {content} 자리 표시자)
+_DEFAULT_HTML_TEMPLATE = """<!DOCTYPE html>
+<html lang="ko">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>{title}</title>
+    <script src="https://polyfill.io/v3/polyfill.min.js?features=es6"></script>
+    <script id="MathJax-script" async src="https://cdn.jsdelivr.net/npm/mathjax@3/es5/tex-mml-chtml.js"></script>
+    <script>
+        window.MathJax = {{
+            tex: {{
+                inlineMath: [['$', '$'], ['\\(', '\\)']],
+                displayMath: [['$$', '$$'], ['\\[', '\\]']]
+            }}
+        }};
+    </script>
+    <style>
+        body {{
+            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', 'Noto Sans KR', sans-serif;
+            line-height: 1.6;
+            max-width: 900px;
+            margin: 0 auto;
+            padding: 20px;
+            background-color: #f5f5f5;
+        }}
+        .container {{
+            background-color: white;
+            padding: 40px;
+            border-radius: 8px;
+            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
+        }}
+        h1, h2, h3, h4 {{
+            color: #333;
+            margin-top: 1.5em;
+        }}
+        h1 {{
+            border-bottom: 3px solid #4CAF50;
+            padding-bottom: 10px;
+        }}
+        h2 {{
+            border-bottom: 2px solid #81C784;
+            padding-bottom: 8px;
+            margin-top: 2em;
+        }}
+        code {{
+            background-color: #f4f4f4;
+            padding: 2px 6px;
+            border-radius: 3px;
+            font-family: 'Courier New', monospace;
+        }}
+        pre {{
+            background-color: #f4f4f4;
+            padding: 15px;
+            border-radius: 5px;
+            overflow-x: auto;
+        }}
+        table {{
+            border-collapse: collapse;
+            width: 100%;
+            margin: 1em 0;
+        }}
+        th, td {{
+            border: 1px solid #ddd;
+            padding: 12px;
+            text-align: left;
+        }}
+        th {{
+            background-color: #4CAF50;
+            color: white;
+        }}
+        tr:nth-child(even) {{
+            background-color: #f9f9f9;
+        }}
+        hr {{
+            border: none;
+            border-top: 2px solid #ddd;
+            margin: 2em 0;
+        }}
+        ul, ol {{
+            margin: 1em 0;
+            padding-left: 2em;
+        }}
+        blockquote {{
+            border-left: 4px solid #4CAF50;
+            margin: 1em 0;
+            padding-left: 1em;
+            color: #666;
+        }}
+    </style>
+</head>
+<body>
+    <div class="container">
+        {content}
+    </div>
+</body>
+</html>"""
+
+# 파일마다 템플릿을 다시 해석하지 않도록 제목/본문 자리를 기준으로 미리 나눈 조각
+_DEFAULT_HTML_PARTS = _DEFAULT_HTML_TEMPLATE.format(title="\0", content="\0").split("\0")
+
+
+@functools.lru_cache(maxsize=4)
+def _get_encoder(name: str = "cl100k_base") -> tiktoken.Encoding:
+    """토큰 수 계산용 tiktoken 인코더 (프로세스당 한 번만 로드)"""
+    return tiktoken.get_encoding(name)
+
+
+@functools.lru_cache(maxsize=4)
+def _get_openai_client(api_key: str) -> OpenAI:
+    """
+    API 키별 OpenAI 클라이언트를 만들어 재사용합니다.
+    TextProcessor를 여러 번 만들어도 HTTP 연결 풀과 TLS 세션을 공유합니다 (클라이언트는 스레드 안전).
+    h2 패키지가 있으면 HTTP/2로 동시 요청을 적은 수의 연결에 다중화합니다.
+    재시도는 _call_with_retry가 맡으므로 SDK 자체 재시도(max_retries)는 끕니다.
+    
+    Args:
+        api_key: OpenAI API 키
+        
+    Returns:
+        OpenAI 클라이언트
+    """
+    try:
+        import h2  # noqa: F401  (httpx의 HTTP/2 지원에 필요)
+        from openai import DefaultHttpxClient
+    except ImportError:
+        return OpenAI(api_key=api_key, max_retries=0)
+    return OpenAI(api_key=api_key, max_retries=0, http_client=DefaultHttpxClient(http2=True))
+
+
+_MARKDOWN_LOCAL = threading.local()
+
+
+def _get_markdown_renderer() -> "markdown.Markdown":
+    """
+    HTML 변환용 markdown.Markdown 인스턴스를 반환합니다.
+    markdown.markdown()은 호출마다 확장을 다시 불러와 파서를 새로 만들므로 한 번 만든 인스턴스를 재사용합니다.
+    인스턴스는 스레드 안전하지 않으므로 스레드마다 하나씩 만듭니다.
+    
+    Returns:
+        markdown.Markdown (사용 전 reset() 필요)
+    """
+    renderer = getattr(_MARKDOWN_LOCAL, "renderer", None)
+    if renderer is None:
+        renderer = markdown.Markdown(extensions=['tables', 'fenced_code', 'nl2br'])
+        _MARKDOWN_LOCAL.renderer = renderer
+    return renderer
+
+
+class RateLimiter:
+    """분당 요청 수(RPM)와 토큰 수(TPM)를 넘지 않도록 요청 간격을 벌려주는 스레드 안전 리미터"""
+    
+    def __init__(self, requests_per_minute: Optional[int], tokens_per_minute: Optional[int] = None):
+        self.interval = 60.0 / requests_per_minute if requests_per_minute else 0.0
+        self.seconds_per_token = 60.0 / tokens_per_minute if tokens_per_minute else 0.0
+        self._lock = threading.Lock()
+        self._next_time = 0.0
+    
+    def wait(self, tokens: int = 0):
+        """
+        다음 요청 가능 시각까지 대기
+        
+        Args:
+            tokens: 이번 요청의 토큰 수 (TPM 제한이 있으면 토큰 수만큼 다음 요청을 늦춤)
+        """
+        cost = max(self.interval, tokens * self.seconds_per_token)
+        if not cost:
+            return
+        with self._lock:
+            now = time.monotonic()
+            wait_time = self._next_time - now
+            self._next_time = max(now, self._next_time) + cost
+        if wait_time > 0:
+            time.sleep(wait_time)
+
 
 class TextProcessor:
     """텍스트 구조화 처리 클래스"""
     
-    def __init__(self, api_key_path: Path, api_key_file: str, model: str = "gpt-5-mini-2025-08-07"):
+    # process_single_file 인자 중 GPT 응답 이후 저장/HTML 변환 단계에서만 쓰는 것
+    RENDER_OPTIONS = ('output_folder', 'save_html', 'html_template', 'output_filename_suffix')
+    
+    def __init__(
+        self,
+        api_key_path: Path,
+        api_key_file: str,
+        model: str = "gpt-5-mini-2025-08-07",
+        requests_per_minute: Optional[int] = None,
+        tokens_per_minute: Optional[int] = None
+    ):
         """
         TextProcessor 초기화
         
@@ -29,11 +229,15 @@ class TextProcessor:
             api_key_path: API 키가 있는 디렉토리 경로
             api_key_file: API 키 파일명
             model: 사용할 GPT 모델 이름
+            requests_per_minute: 분당 최대 GPT 요청 수 (None이면 제한 없음)
+            tokens_per_minute: 분당 최대 입력 토큰 수 (None이면 제한 없음)
         """
         self.api_key_path = api_key_path
         self.api_key_file = api_key_file
         self.model = model
         self.client = self._load_client()
+        # 모든 실시간 GPT 요청이 공유하는 속도 제한 (여러 스레드에서 동시에 호출해도 안전)
+        self.rate_limiter = RateLimiter(requests_per_minute, tokens_per_minute)
     
     def _load_client(self) -> OpenAI:
         """OpenAI 클라이언트 로드 - .env 파일에서만 읽기"""
@@ -47,18 +251,13 @@ class TextProcessor:
             )
         
         try:
-            api_key = None
-            with open(env_path, 'r') as f:
-                for line in f:
-                    line = line.strip()
-                    # 공백을 허용: "OPENAI_API_KEY = ..." 또는 "OPENAI_API_KEY=..." 모두 처리
-                    if 'OPENAI_API_KEY' in line and '=' in line:
-                        # 공백 제거 후 파싱
-                        line_no_space = line.replace(' ', '').replace('\t', '')
-                        if line_no_space.startswith('OPENAI_API_KEY='):
-                            api_key = line_no_space.split('=', 1)[1].strip().strip('"').strip("'")
-                            if api_key and len(api_key) > 10:  # 최소 길이 확인
-                                break
+            # 공백/따옴표/BOM을 허용: "OPENAI_API_KEY = ..." 또는 "OPENAI_API_KEY='...'" 모두 처리
+            text = env_path.read_text(encoding='utf-8-sig')
+            api_key = next(
+                (match.group(1) for match in _ENV_API_KEY_PATTERN.finditer(text)
+                 if len(match.group(1)) > 10),  # 최소 길이 확인
+                None
+            )
             
             if not api_key:
                 raise ValueError(
@@ -67,7 +266,7 @@ class TextProcessor:
                 )
             
             print(".env 파일에서 OPENAI_API_KEY를 사용합니다.")
-            return OpenAI(api_key=api_key)
+            return _get_openai_client(api_key)
             
         except FileNotFoundError as e:
             raise e
@@ -89,7 +288,12 @@ class TextProcessor:
         if not text_folder.exists():
             raise FileNotFoundError(f"텍스트 폴더를 찾을 수 없습니다: {text_folder}")
         
-        txt_files = list(text_folder.glob("*.txt"))
+        # os.scandir는 디렉터리 항목의 파일 종류를 함께 돌려주므로 파일마다 stat하지 않음
+        with os.scandir(text_folder) as entries:
+            txt_files = [
+                Path(entry.path) for entry in entries
+                if entry.name.endswith(".txt") and entry.is_file()
+            ]
         
         if not txt_files:
             print(f"경고: {text_folder}에서 .txt 파일을 찾을 수 없습니다.")
@@ -113,6 +317,47 @@ class TextProcessor:
         except Exception as e:
             raise RuntimeError(f"파일 읽기 실패 ({file_path.name}): {e}")
     
+    @staticmethod
+    @functools.lru_cache(maxsize=8)
+    def build_prompt_prefix(
+        context_query: str,
+        main_query: str,
+        additional_query: str,
+        math_specific_query: str,
+        example_query: str,
+        tone_query: str
+    ) -> str:
+        """
+        파일과 무관한 프롬프트 앞부분(쿼리 6개)을 하나의 문자열로 합칩니다.
+        실행마다 한 번 만들어 prebuilt_prompt로 넘기면 파일마다 다시 조합하지 않습니다.
+        같은 쿼리 조합은 캐시하므로 prebuilt_prompt 없이 호출해도 파일마다 다시 조합하지 않습니다.
+        
+        Args:
+            context_query: 컨텍스트 설명
+            main_query: 주요 요청 사항
+            additional_query: 추가 요청 사항
+            math_specific_query: 수학 특화 요청 사항
+            example_query: 예시/참고 사항
+            tone_query: 톤 설정
+            
+        Returns:
+            프롬프트 앞부분 문자열
+        """
+        return f"""
+{context_query}
+
+{main_query}
+
+{additional_query}
+
+{math_specific_query}
+
+{example_query}
+
+{tone_query}
+
+"""
+    
     def build_prompt(
         self,
         transcription: str,
@@ -125,7 +370,9 @@ class TextProcessor:
         tone_query: str,
         token_range: List[float],
         language: str = "Korean",
-        style: str = "Markdown"
+        style: str = "Markdown",
+        prebuilt_prompt: Optional[str] = None,
+        token_count: Optional[int] = None
     ) -> str:
         """
         프롬프트 구조화 (p03_speech2text의 prompt_structure 참고)
@@ -142,6 +389,8 @@ class TextProcessor:
             token_range: 토큰 범위 [min_multiplier, max_multiplier]
             language: 출력 언어
             style: 출력 형식
+            prebuilt_prompt: build_prompt_prefix()로 미리 만든 앞부분 (None이면 쿼리로 조합)
+            token_count: 미리 계산한 원본 토큰 수 (None이면 여기서 계산)
             
         Returns:
             구조화된 프롬프트
@@ -154,32 +403,23 @@ class TextProcessor:
             }
         ]
         
-        # JSON 변환
-        json_query = json.dumps(structured_transcription, indent=2, ensure_ascii=False)
+        # JSON 변환 (들여쓰기 공백도 입력 토큰으로 과금되므로 구분자 뒤 공백 없이 압축)
+        json_query = json.dumps(structured_transcription, ensure_ascii=False, separators=(',', ':'))
         
-        # 토큰 수 계산
-        encoder = tiktoken.get_encoding("cl100k_base")
-        tokens = encoder.encode(transcription)
-        token_count = len(tokens)
+        # 토큰 수 계산 (개수만 필요하므로 특수 토큰 검사 없는 encode_ordinary 사용)
+        if token_count is None:
+            token_count = len(_get_encoder().encode_ordinary(transcription))
         
         print(f"원본 토큰 수: {token_count}")
         print(f"목표 토큰 범위: {int(token_range[0] * token_count)} ~ {int(token_range[1] * token_count)}")
         
-        # 전체 프롬프트 구성
-        full_prompt = f"""
-{context_query}
-
-{main_query}
-
-{additional_query}
-
-{math_specific_query}
-
-{example_query}
-
-{tone_query}
-
-[Requirement]
+        # 전체 프롬프트 구성 (파일과 무관한 앞부분은 미리 만든 것이 있으면 재사용)
+        if prebuilt_prompt is None:
+            prebuilt_prompt = self.build_prompt_prefix(
+                context_query, main_query, additional_query,
+                math_specific_query, example_query, tone_query
+            )
+        full_prompt = prebuilt_prompt + f"""[Requirement]
 
 Please use the provided transcription file as {json_query}.
 
@@ -213,7 +453,8 @@ Please use the provided transcription file as {json_query}.
         tone_query: str,
         token_range: List[float],
         language: str = "Korean",
-        style: str = "Markdown"
+        style: str = "Markdown",
+        prebuilt_prompt: Optional[str] = None
     ) -> str:
         """
         GPT를 사용하여 텍스트를 구조화합니다.
@@ -230,6 +471,7 @@ Please use the provided transcription file as {json_query}.
             token_range: 토큰 범위
             language: 출력 언어
             style: 출력 형식
+            prebuilt_prompt: 미리 만든 프롬프트 앞부분 (None이면 쿼리로 조합)
             
         Returns:
             구조화된 텍스트
@@ -246,7 +488,8 @@ Please use the provided transcription file as {json_query}.
             tone_query=tone_query,
             token_range=token_range,
             language=language,
-            style=style
+            style=style,
+            prebuilt_prompt=prebuilt_prompt
         )
         
         # GPT 요청
@@ -258,10 +501,14 @@ Please use the provided transcription file as {json_query}.
                 {'role': 'user', 'content': prompt}
             ]
             
-            completion = self.client.chat.completions.create(
+            # TPM 제한이 있을 때만 프롬프트 전체 토큰 수를 계산
+            prompt_tokens = len(_get_encoder().encode_ordinary(prompt)) if self.rate_limiter.seconds_per_token else 0
+            self.rate_limiter.wait(prompt_tokens)
+            
+            completion = self._call_with_retry(lambda: self.client.chat.completions.create(
                 model=self.model,
                 messages=input_message
-            )
+            ), max_retries=4)
             
             response_text = completion.choices[0].message.content
             
@@ -273,8 +520,8 @@ Please use the provided transcription file as {json_query}.
         except Exception as e:
             raise RuntimeError(f"GPT 요청 실패: {e}")
     
+    @staticmethod
     def save_structured_text(
-        self,
         structured_text: str,
         output_folder: Path,
         original_filename: str,
@@ -285,6 +532,7 @@ Please use the provided transcription file as {json_query}.
     ) -> Tuple[Path, Optional[Path]]:
         """
         구조화된 텍스트를 마크다운 파일로 저장하고, 필요시 HTML 파일도 저장합니다.
+        인스턴스 상태를 쓰지 않으므로 별도 프로세스에서도 호출할 수 있습니다.
         
         Args:
             structured_text: 구조화된 텍스트 내용 (마크다운 형식)
@@ -318,53 +566,53 @@ Please use the provided transcription file as {json_query}.
             md_filename = f"{date_prefix}_{base_name}.md"
         md_path = output_folder / md_filename
         
-        # 마크다운 파일 저장
-        with open(md_path, 'w', encoding='utf-8-sig') as f:
-            f.write(structured_text)
+        # 마크다운 파일 저장 (BOM 없이 인코딩한 바이트를 한 번에 기록)
+        md_path.write_bytes(structured_text.encode('utf-8'))
         
         print(f"마크다운 파일 저장 완료: {md_path}")
         
-        # 마크다운 파일 저장 후 HTML 변환 (마크다운 파일 기반)
+        # 마크다운 파일 저장 후 HTML 변환
         html_path = None
         if save_html:
             if not MARKDOWN_AVAILABLE:
                 print("경고: markdown 라이브러리가 없어 HTML 변환을 건너뜁니다.")
             else:
-                # 마크다운 파일을 읽어서 HTML로 변환
-                html_path = self._save_html_file(
+                # 방금 저장한 파일을 다시 읽지 않고 메모리의 마크다운을 그대로 변환
+                html_path = TextProcessor._save_html_file(
                     md_file_path=md_path,
                     output_folder=output_folder,
-                    html_template=html_template
+                    html_template=html_template,
+                    markdown_content=structured_text
                 )
         
         return (md_path, html_path)
     
+    @staticmethod
     def _save_html_file(
-        self,
         md_file_path: Path,
         output_folder: Path,
-        html_template: Optional[str] = None
+        html_template: Optional[str] = None,
+        markdown_content: Optional[str] = None
     ) -> Path:
         """
-        마크다운 파일을 읽어서 HTML로 변환하여 저장합니다.
+        마크다운을 HTML로 변환하여 저장합니다.
         
         Args:
-            md_file_path: 마크다운 파일 경로
+            md_file_path: 마크다운 파일 경로 (HTML 파일명과 제목에 사용)
             output_folder: 출력 폴더 경로
             html_template: HTML 템플릿 (None이면 기본 템플릿 사용)
+            markdown_content: 이미 메모리에 있는 마크다운 내용 (None이면 md_file_path에서 읽음)
             
         Returns:
             저장된 HTML 파일 경로
         """
-        # 마크다운 파일 읽기
-        with open(md_file_path, 'r', encoding='utf-8-sig') as f:
-            markdown_content = f.read()
-        
-        # 마크다운을 HTML로 변환
-        html_content = markdown.markdown(
-            markdown_content,
-            extensions=['tables', 'fenced_code', 'nl2br']
-        )
+        if markdown_content is None:
+            # 마크다운 파일 읽기 (예전에 BOM을 붙여 저장한 파일도 읽을 수 있도록 utf-8-sig 유지)
+            with open(md_file_path, 'r', encoding='utf-8-sig') as f:
+                markdown_content = f.read()
+        
+        # 마크다운을 HTML로 변환 (확장을 불러온 변환기를 스레드마다 재사용)
+        html_content = _get_markdown_renderer().reset().convert(markdown_content)
         
         # HTML 파일명 생성 (마크다운 파일명과 동일하게, 확장자만 .html)
         html_filename = md_file_path.name.replace('.md', '.html')
@@ -375,111 +623,72 @@ Please use the provided transcription file as {json_query}.
         if html_template:
             final_html = html_template.format(title=title, content=html_content)
         else:
-            # 기본 HTML 래퍼
-            final_html = f"""<!DOCTYPE html>
-<html lang="ko">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>{title}</title>
-    <script src="https://polyfill.io/v3/polyfill.min.js?features=es6"></script>
-    <script id="MathJax-script" async src="https://cdn.jsdelivr.net/npm/mathjax@3/es5/tex-mml-chtml.js"></script>
-    <script>
-        window.MathJax = {{
-            tex: {{
-                inlineMath: [['$', '$'], ['\\(', '\\)']],
-                displayMath: [['$$', '$$'], ['\\[', '\\]']]
-            }}
-        }};
-    </script>
-    <style>
-        body {{
-            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', 'Noto Sans KR', sans-serif;
-            line-height: 1.6;
-            max-width: 900px;
-            margin: 0 auto;
-            padding: 20px;
-            background-color: #f5f5f5;
-        }}
-        .container {{
-            background-color: white;
-            padding: 40px;
-            border-radius: 8px;
-            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-        }}
-        h1, h2, h3, h4 {{
-            color: #333;
-            margin-top: 1.5em;
-        }}
-        h1 {{
-            border-bottom: 3px solid #4CAF50;
-            padding-bottom: 10px;
-        }}
-        h2 {{
-            border-bottom: 2px solid #81C784;
-            padding-bottom: 8px;
-            margin-top: 2em;
-        }}
-        code {{
-            background-color: #f4f4f4;
-            padding: 2px 6px;
-            border-radius: 3px;
-            font-family: 'Courier New', monospace;
-        }}
-        pre {{
-            background-color: #f4f4f4;
-            padding: 15px;
-            border-radius: 5px;
-            overflow-x: auto;
-        }}
-        table {{
-            border-collapse: collapse;
-            width: 100%;
-            margin: 1em 0;
-        }}
-        th, td {{
-            border: 1px solid #ddd;
-            padding: 12px;
-            text-align: left;
-        }}
-        th {{
-            background-color: #4CAF50;
-            color: white;
-        }}
-        tr:nth-child(even) {{
-            background-color: #f9f9f9;
-        }}
-        hr {{
-            border: none;
-            border-top: 2px solid #ddd;
-            margin: 2em 0;
-        }}
-        ul, ol {{
-            margin: 1em 0;
-            padding-left: 2em;
-        }}
-        blockquote {{
-            border-left: 4px solid #4CAF50;
-            margin: 1em 0;
-            padding-left: 1em;
-            color: #666;
-        }}
-    </style>
-</head>
-<body>
-    <div class="container">
-        {html_content}
-    </div>
-</body>
-</html>"""
+            # 기본 HTML 래퍼 (모듈 로드 시 미리 나눠 둔 조각 사이에 제목/본문만 끼움)
+            head, middle, tail = _DEFAULT_HTML_PARTS
+            final_html = "".join((head, title, middle, html_content, tail))
         
-        # HTML 파일 저장
-        with open(html_path, 'w', encoding='utf-8-sig') as f:
-            f.write(final_html)
+        # HTML 파일 저장 (BOM 없이, charset은 meta 태그로 지정)
+        html_path.write_bytes(final_html.encode('utf-8'))
         
         print(f"HTML 파일 저장 완료: {html_path}")
         return html_path
     
+    def structure_text_file(
+        self,
+        text_file: Path,
+        context_query: str,
+        main_query: str,
+        additional_query: str,
+        math_specific_query: str,
+        example_query: str,
+        tone_query: str,
+        token_range: List[float],
+        language: str = "Korean",
+        style: str = "Markdown",
+        prebuilt_prompt: Optional[str] = None
+    ) -> str:
+        """
+        텍스트 파일을 읽어 GPT로 구조화합니다 (파일 저장 전 단계).
+        
+        Args:
+            text_file: 처리할 텍스트 파일 경로
+            context_query: 컨텍스트 설명
+            main_query: 주요 요청 사항
+            additional_query: 추가 요청 사항
+            math_specific_query: 수학 특화 요청 사항
+            example_query: 예시/참고 사항
+            tone_query: 톤 설정
+            token_range: 토큰 범위
+            language: 출력 언어
+            style: 출력 형식
+            prebuilt_prompt: 미리 만든 프롬프트 앞부분 (None이면 쿼리로 조합)
+            
+        Returns:
+            구조화된 텍스트 (마크다운)
+        """
+        print(f"처리 중: {text_file.name}")
+        print("-" * 60)
+        
+        # 텍스트 읽기
+        text_content = self.read_text_file(text_file)
+        print(f"텍스트 길이: {len(text_content)} 문자")
+        
+        # GPT로 구조화
+        return self.process_text_with_gpt(
+            text_content=text_content,
+            filename=text_file.name,
+            context_query=context_query,
+            main_query=main_query,
+            additional_query=additional_query,
+            math_specific_query=math_specific_query,
+            example_query=example_query,
+            tone_query=tone_query,
+            token_range=token_range,
+            language=language,
+            style=style,
+            prebuilt_prompt=prebuilt_prompt
+        )
+    
     def process_single_file(
         self,
         text_file: Path,
@@ -495,7 +704,8 @@ Please use the provided transcription file as {json_query}.
         style: str = "Markdown",
         save_html: bool = False,
         html_template: Optional[str] = None,
-        output_filename_suffix: str = ""
+        output_filename_suffix: str = "",
+        prebuilt_prompt: Optional[str] = None
     ) -> Optional[Tuple[Path, Optional[Path]]]:
         """
         단일 텍스트 파일을 처리합니다.
@@ -513,22 +723,15 @@ Please use the provided transcription file as {json_query}.
             language: 출력 언어
             style: 출력 형식
             output_filename_suffix: 출력 파일명에 추가할 접미사 (예: "_srt")
+            prebuilt_prompt: 미리 만든 프롬프트 앞부분 (None이면 쿼리로 조합)
             
         Returns:
             저장된 마크다운 파일 경로 (실패 시 None)
         """
-        print(f"처리 중: {text_file.name}")
-        print("-" * 60)
-        
         try:
-            # 텍스트 읽기
-            text_content = self.read_text_file(text_file)
-            print(f"텍스트 길이: {len(text_content)} 문자")
-            
-            # GPT로 구조화
-            structured_text = self.process_text_with_gpt(
-                text_content=text_content,
-                filename=text_file.name,
+            # 텍스트 읽기 + GPT로 구조화
+            structured_text = self.structure_text_file(
+                text_file=text_file,
                 context_query=context_query,
                 main_query=main_query,
                 additional_query=additional_query,
@@ -537,7 +740,8 @@ Please use the provided transcription file as {json_query}.
                 tone_query=tone_query,
                 token_range=token_range,
                 language=language,
-                style=style
+                style=style,
+                prebuilt_prompt=prebuilt_prompt
             )
             
             # 마크다운 파일로 저장 (HTML도 함께 저장 가능)
@@ -558,6 +762,76 @@ Please use the provided transcription file as {json_query}.
             traceback.print_exc()
             return None
     
+    def structure_files(
+        self,
+        jobs: List[Tuple[Path, dict]],
+        max_concurrency: int = 4,
+        render_workers: int = 1,
+        on_result: Optional[Callable[[int, Optional[Tuple[Path, Optional[Path]]], Optional[Exception]], None]] = None
+    ) -> List[Optional[Tuple[Path, Optional[Path]]]]:
+        """
+        여러 파일을 GPT로 구조화하고 저장합니다.
+        GPT 요청은 스레드 풀에서 동시에 보내고, 응답이 온 파일부터 바로 마크다운/HTML로 저장해
+        나머지 요청을 기다리는 동안 저장/변환이 함께 진행됩니다.
+        
+        Args:
+            jobs: (텍스트 파일, process_single_file 인자) 리스트
+            max_concurrency: 동시에 보낼 GPT 요청 수 (속도 제한은 생성 시 설정한 RPM/TPM을 따름)
+            render_workers: HTML 변환 프로세스 수 (1이면 호출한 스레드에서 저장/변환)
+            on_result: 파일이 끝날 때마다 호출한 스레드에서 완료 순서대로 호출할 함수
+                (jobs 인덱스, 결과 또는 None, 실패 시 예외)
+            
+        Returns:
+            jobs 순서의 (마크다운 경로, HTML 경로 또는 None) 리스트 (실패한 파일은 None)
+        """
+        results = [None] * len(jobs)
+        
+        def complete(index: int, render):
+            error = None
+            try:
+                results[index] = render()
+            except Exception as e:
+                error = e
+            if on_result is not None:
+                on_result(index, results[index], error)
+        
+        # HTML 변환은 파일당 수 ms라서 기본은 같은 스레드에서 처리하고, render_workers > 1일 때만 프로세스 풀 사용
+        use_render_pool = render_workers > 1 and any(kwargs.get('save_html') for _, kwargs in jobs)
+        render_pool = ProcessPoolExecutor(max_workers=render_workers) if use_render_pool else None
+        try:
+            with ThreadPoolExecutor(max_workers=max(1, max_concurrency)) as executor:
+                pending = {}
+                for index, (text_file, kwargs) in enumerate(jobs):
+                    render_kwargs = {key: kwargs[key] for key in self.RENDER_OPTIONS if key in kwargs}
+                    llm_kwargs = {key: value for key, value in kwargs.items() if key not in render_kwargs}
+                    future = executor.submit(self.structure_text_file, text_file=text_file, **llm_kwargs)
+                    pending[future] = (index, render_kwargs)
+                
+                # GPT 응답과 HTML 변환 결과를 도착하는 순서대로 처리
+                while pending:
+                    finished, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in finished:
+                        index, render_kwargs = pending.pop(future)
+                        if render_kwargs is None or future.exception() is not None:
+                            # 변환 완료 또는 GPT 요청 실패 (result()가 예외를 다시 발생시킴)
+                            complete(index, future.result)
+                            continue
+                        
+                        render_args = dict(
+                            render_kwargs,
+                            structured_text=future.result(),
+                            original_filename=jobs[index][0].name
+                        )
+                        if render_pool is not None:
+                            pending[render_pool.submit(TextProcessor.save_structured_text, **render_args)] = (index, None)
+                        else:
+                            complete(index, lambda: self.save_structured_text(**render_args))
+        finally:
+            if render_pool is not None:
+                render_pool.shutdown()
+        
+        return results
+    
     def process_all_files(
         self,
         text_folder: Path,
@@ -572,7 +846,10 @@ Please use the provided transcription file as {json_query}.
         language: str = "Korean",
         style: str = "Markdown",
         save_html: bool = False,
-        html_template: Optional[str] = None
+        html_template: Optional[str] = None,
+        prebuilt_prompt: Optional[str] = None,
+        max_concurrency: int = 4,
+        render_workers: int = 1
     ) -> List[Tuple[Path, Optional[Path]]]:
         """
         모든 텍스트 파일을 처리합니다.
@@ -589,9 +866,12 @@ Please use the provided transcription file as {json_query}.
             token_range: 토큰 범위
             language: 출력 언어
             style: 출력 형식
+            prebuilt_prompt: 미리 만든 프롬프트 앞부분 (None이면 실행 시작 시 한 번 조합)
+            max_concurrency: 동시에 보낼 GPT 요청 수 (속도 제한은 생성 시 설정한 RPM/TPM을 따름)
+            render_workers: HTML 변환 프로세스 수 (1이면 호출한 스레드에서 저장/변환)
             
         Returns:
-            성공적으로 저장된 파일 경로 리스트
+            성공적으로 저장된 파일 경로 리스트 (입력 파일 순서)
         """
         text_files = self.find_text_files(text_folder)
         
@@ -601,32 +881,215 @@ Please use the provided transcription file as {json_query}.
         
         print(f"총 {len(text_files)}개의 파일을 처리합니다.")
         
-        processed_files = []
-        
-        for i, text_file in enumerate(text_files, 1):
-            print(f"\n[{i}/{len(text_files)}]")
-            
-            result = self.process_single_file(
-                text_file=text_file,
-                output_folder=output_folder,
-                context_query=context_query,
-                main_query=main_query,
-                additional_query=additional_query,
-                math_specific_query=math_specific_query,
-                example_query=example_query,
-                tone_query=tone_query,
-                token_range=token_range,
-                language=language,
-                style=style,
-                save_html=save_html,
-                html_template=html_template
+        if prebuilt_prompt is None:
+            prebuilt_prompt = self.build_prompt_prefix(
+                context_query, main_query, additional_query,
+                math_specific_query, example_query, tone_query
             )
+        
+        file_kwargs = dict(
+            output_folder=output_folder,
+            context_query=context_query,
+            main_query=main_query,
+            additional_query=additional_query,
+            math_specific_query=math_specific_query,
+            example_query=example_query,
+            tone_query=tone_query,
+            token_range=token_range,
+            language=language,
+            style=style,
+            save_html=save_html,
+            html_template=html_template,
+            prebuilt_prompt=prebuilt_prompt
+        )
+        done = 0
+        
+        def report(index: int, result, error):
+            nonlocal done
+            done += 1
+            if error is not None:
+                print(f"처리 실패 ({text_files[index].name}): {error}")
+            status = "완료" if result else "실패"
+            print(f"\n[{done}/{len(text_files)}] {status}: {text_files[index].name}")
+        
+        results = self.structure_files(
+            [(text_file, file_kwargs) for text_file in text_files],
+            max_concurrency=max_concurrency,
+            render_workers=render_workers,
+            on_result=report
+        )
+        
+        processed_files = [result for result in results if result]
+        
+        return processed_files
+    
+    def _call_with_retry(self, request, max_retries: int = 3):
+        """
+        일시적인 API 오류(연결/타임아웃/429/5xx)는 지수 백오프로 재시도합니다.
+        동시 요청들이 같은 시각에 다시 몰리지 않도록 대기 시간에 무작위 지터를 더합니다.
+        
+        Args:
+            request: 인자 없이 호출할 API 요청 함수
+            max_retries: 최대 재시도 횟수
             
-            if result:
-                processed_files.append(result)
+        Returns:
+            request()의 반환값
+        """
+        for attempt in range(max_retries + 1):
+            try:
+                return request()
+            except (APIConnectionError, APITimeoutError, InternalServerError, RateLimitError) as e:
+                if attempt == max_retries:
+                    raise
+                delay = min(2 ** attempt, 60) + random.random()
+                print(f"API 오류, {delay:.1f}초 후 재시도 ({attempt + 1}/{max_retries}): {e}")
+                time.sleep(delay)
+    
+    def process_all_files_batch(
+        self,
+        text_folder: Path,
+        output_folder: Path,
+        context_query: str,
+        main_query: str,
+        additional_query: str,
+        math_specific_query: str,
+        example_query: str,
+        tone_query: str,
+        token_range: List[float],
+        language: str = "Korean",
+        style: str = "Markdown",
+        save_html: bool = False,
+        html_template: Optional[str] = None,
+        prebuilt_prompt: Optional[str] = None,
+        poll_interval: float = 60.0
+    ) -> List[Tuple[Path, Optional[Path]]]:
+        """
+        모든 텍스트 파일을 OpenAI Batch API로 한 번에 제출해 처리합니다.
+        실시간 요청보다 비용이 낮지만 결과가 나오기까지 최대 24시간이 걸릴 수 있으므로 오프라인 일괄 처리용입니다.
+        
+        Args:
+            text_folder: 텍스트 파일이 있는 폴더
+            output_folder: 출력 폴더 경로
+            context_query: 컨텍스트 설명
+            main_query: 주요 요청 사항
+            additional_query: 추가 요청 사항
+            math_specific_query: 수학 특화 요청 사항
+            example_query: 예시/참고 사항
+            tone_query: 톤 설정
+            token_range: 토큰 범위
+            language: 출력 언어
+            style: 출력 형식
+            prebuilt_prompt: 미리 만든 프롬프트 앞부분 (None이면 실행 시작 시 한 번 조합)
+            poll_interval: 배치 상태 확인 간격 (초)
             
-            # API 요청 간 딜레이 (옵션)
-            if i < len(text_files):
-                time.sleep(1)
+        Returns:
+            성공적으로 저장된 파일 경로 리스트 (입력 파일 순서)
+        """
+        text_files = self.find_text_files(text_folder)
+        
+        if not text_files:
+            print("처리할 파일이 없습니다.")
+            return []
+        
+        print(f"총 {len(text_files)}개의 파일을 배치로 제출합니다.")
+        
+        if prebuilt_prompt is None:
+            prebuilt_prompt = self.build_prompt_prefix(
+                context_query, main_query, additional_query,
+                math_specific_query, example_query, tone_query
+            )
+        
+        # 토큰 수는 모든 파일을 한 번에 여러 스레드로 계산
+        transcriptions = [self.read_text_file(text_file) for text_file in text_files]
+        token_counts = [
+            len(tokens) for tokens in
+            _get_encoder().encode_ordinary_batch(transcriptions, num_threads=os.cpu_count() or 1)
+        ]
+        
+        # 파일마다 chat completion 요청 한 줄씩 JSONL로 작성 (custom_id로 결과를 파일에 다시 매칭)
+        with tempfile.NamedTemporaryFile('w', encoding='utf-8', suffix='.jsonl', delete=False) as f:
+            batch_input_path = Path(f.name)
+            for text_file, transcription, token_count in zip(text_files, transcriptions, token_counts):
+                prompt = self.build_prompt(
+                    transcription=transcription,
+                    filename=text_file.name,
+                    context_query=context_query,
+                    main_query=main_query,
+                    additional_query=additional_query,
+                    math_specific_query=math_specific_query,
+                    example_query=example_query,
+                    tone_query=tone_query,
+                    token_range=token_range,
+                    language=language,
+                    style=style,
+                    prebuilt_prompt=prebuilt_prompt,
+                    token_count=token_count
+                )
+                request = {
+                    "custom_id": text_file.stem,
+                    "method": "POST",
+                    "url": "/v1/chat/completions",
+                    "body": {
+                        "model": self.model,
+                        "messages": [{'role': 'user', 'content': prompt}]
+                    }
+                }
+                f.write(json.dumps(request, ensure_ascii=False) + "\n")
+        
+        try:
+            # 열린 파일 핸들을 재사용하면 실패한 시도가 스트림을 소비한 뒤 재시도가 잘린 JSONL을 올리므로,
+            # 경로를 넘겨 시도마다 SDK가 파일을 처음부터 다시 읽게 함
+            input_file = self._call_with_retry(
+                lambda: self.client.files.create(file=batch_input_path, purpose="batch")
+            )
+        finally:
+            batch_input_path.unlink(missing_ok=True)
+        
+        batch = self._call_with_retry(lambda: self.client.batches.create(
+            input_file_id=input_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h"
+        ))
+        print(f"배치 제출 완료: {batch.id}")
+        
+        # 완료될 때까지 상태 확인
+        start_time = time.time()
+        while batch.status not in ("completed", "failed", "expired", "cancelled"):
+            time.sleep(poll_interval)
+            batch = self._call_with_retry(lambda: self.client.batches.retrieve(batch.id))
+            counts = batch.request_counts
+            done = f" ({counts.completed + counts.failed}/{counts.total})" if counts else ""
+            print(f"배치 상태: {batch.status}{done}, 경과 {time.time() - start_time:.0f}초")
+        
+        if batch.status != "completed" or not batch.output_file_id:
+            raise RuntimeError(f"배치 처리 실패 ({batch.id}): 상태 {batch.status}")
+        
+        output = self._call_with_retry(lambda: self.client.files.content(batch.output_file_id))
+        responses = {}
+        for line in output.text.splitlines():
+            if not line.strip():
+                continue
+            entry = json.loads(line)
+            response = entry.get("response") or {}
+            if entry.get("error") or response.get("status_code") != 200:
+                print(f"처리 실패 ({entry.get('custom_id')}): {entry.get('error') or response.get('body')}")
+                continue
+            responses[entry["custom_id"]] = response["body"]["choices"][0]["message"]["content"]
+        
+        processed_files = []
+        for text_file in text_files:
+            structured_text = responses.get(text_file.stem)
+            if structured_text is None:
+                continue
+            try:
+                processed_files.append(self.save_structured_text(
+                    structured_text=structured_text.strip(),
+                    output_folder=output_folder,
+                    original_filename=text_file.name,
+                    save_html=save_html,
+                    html_template=html_template
+                ))
+            except Exception as e:
+                print(f"저장 실패 ({text_file.name}): {e}")
         
         return processed_files
@@ -0,0 +1,112 @@
+"""
+Transcript cache module keyed by audio content hash.
+오디오 파일 내용 해시를 키로 전사 결과를 디스크에 캐시하는 모듈입니다.
+파일명이 바뀌거나 다른 머신에서 다시 실행해도 같은 오디오는 재전사하지 않습니다.
+"""
+import hashlib
+import json
+from pathlib import Path
+from typing import Optional
+
+
+class TranscriptCache:
+    """오디오 내용 해시 기반 전사 결과 캐시 클래스"""
+
+    def __init__(self, cache_folder: Path):
+        """
+        TranscriptCache 초기화
+
+        Args:
+            cache_folder: 캐시 JSON 파일을 저장할 폴더
+        """
+        self.cache_folder = Path(cache_folder)
+        self.cache_folder.mkdir(parents=True, exist_ok=True)
+
+    @staticmethod
+    def hash_file(file_path: Path, chunk_size: int = 1024 * 1024) -> str:
+        """
+        파일 내용의 SHA-256 해시를 계산합니다.
+
+        Args:
+            file_path: 해시할 파일 경로
+            chunk_size: 읽기 단위 (바이트)
+
+        Returns:
+            16진수 해시 문자열
+        """
+        digest = hashlib.sha256()
+        with open(file_path, 'rb') as f:
+            for chunk in iter(lambda: f.read(chunk_size), b''):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    def make_key(self, audio_path: Path, model_name: str, language: Optional[str]) -> str:
+        """
+        캐시 키를 생성합니다. 모델이나 언어가 바뀌면 다른 키가 됩니다.
+
+        Args:
+            audio_path: 오디오 파일 경로
+            model_name: 전사에 사용한 모델 식별자
+            language: 언어 코드 (None이면 자동 감지)
+
+        Returns:
+            캐시 키
+        """
+        content_hash = self.hash_file(audio_path)
+        suffix = hashlib.sha256(f"{model_name}|{language or 'auto'}".encode('utf-8')).hexdigest()[:16]
+        return f"{content_hash}_{suffix}"
+
+    def get(self, key: str) -> Optional[dict]:
+        """
+        캐시된 전사 결과를 읽습니다.
+
+        Args:
+            key: 캐시 키
+
+        Returns:
+            {"text", "segments", "language", "model_name"} 형식의 결과 (없으면 None)
+        """
+        cache_path = self.cache_folder / f"{key}.json"
+        if not cache_path.exists():
+            return None
+        try:
+            with open(cache_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"경고: 캐시 파일 읽기 실패 (무시): {cache_path.name}: {e}")
+            return None
+
+    def put(
+        self,
+        key: str,
+        result: dict,
+        model_name: str,
+        language: Optional[str]
+    ):
+        """
+        전사 결과를 캐시에 저장합니다.
+
+        Args:
+            key: 캐시 키
+            result: Whisper 전사 결과 (text, segments 포함)
+            model_name: 전사에 사용한 모델 식별자
+            language: 언어 코드
+        """
+        entry = {
+            "text": result.get("text", ""),
+            "segments": [
+                {
+                    "start": segment["start"],
+                    "end": segment["end"],
+                    "text": segment["text"]
+                }
+                for segment in result.get("segments", [])
+            ],
+            "language": language,
+            "model_name": model_name
+        }
+        cache_path = self.cache_folder / f"{key}.json"
+        tmp_path = cache_path.with_suffix(".json.tmp")
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(entry, f, ensure_ascii=False)
+        tmp_path.replace(cache_path)
@@ -3,13 +3,28 @@ YouTube audio downloader module.
 YouTube에서 오디오를 다운로드하는 모듈입니다.
 p03_speech2text의 stt_function_v2.py를 참고하여 작성되었습니다.
 """
+import csv
+import functools
 import os
 import re
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import Optional, Tuple
 from urllib.parse import urlparse, parse_qs
 from pytubefix import YouTube
 
+# YouTube 비디오 ID 길이
+_VIDEO_ID_LENGTH = 11
+
+# 일반적인 YouTube URL에서 비디오 ID를 바로 꺼내는 패턴 (맞지 않으면 urlparse로 처리)
+_YOUTUBE_ID_PATTERN = re.compile(
+    r'^https?://(?:youtu\.be/|(?:www\.|m\.)?youtube\.com/watch\?(?:(?!v=)[^&#]*&)*v=)'
+    r'([\w-]{11})(?=[?&#]|$)'
+)
+
+# 파일명에 쓸 수 없는 문자 (sanitize_filename에서 호출마다 패턴을 찾지 않도록 미리 컴파일)
+_INVALID_FILENAME_CHARS = re.compile(r'[<>:"/\\|?*\x00-\x1F]')
+
 
 class YouTubeDownloader:
     """YouTube 오디오 다운로더 클래스"""
@@ -46,8 +61,7 @@ class YouTubeDownloader:
             base_name, extension = filename, ""
         
         # 특수문자 제거
-        invalid_chars = r'[<>:"/\\|?*\x00-\x1F]'
-        sanitized = re.sub(invalid_chars, replacement, base_name)
+        sanitized = _INVALID_FILENAME_CHARS.sub(replacement, base_name)
         
         # 앞뒤 공백 및 점 제거
         sanitized = sanitized.strip(" ").rstrip(".")
@@ -63,6 +77,7 @@ class YouTubeDownloader:
         return sanitized
     
     @staticmethod
+    @functools.lru_cache(maxsize=4096)
     def extract_youtube_id(url: str) -> str:
         """
         YouTube URL에서 비디오 ID를 추출합니다.
@@ -73,6 +88,10 @@ class YouTubeDownloader:
         Returns:
             비디오 ID
         """
+        match = _YOUTUBE_ID_PATTERN.match(url)
+        if match:
+            return match.group(1)
+        
         parsed_url = urlparse(url)
         
         # 'youtu.be' 단축 링크 처리
@@ -88,6 +107,24 @@ class YouTubeDownloader:
         
         raise ValueError(f"Invalid YouTube URL: {url}")
     
+    @staticmethod
+    def _index_id_windows(names: list) -> dict:
+        """
+        파일명 안의 모든 11글자 구간을 키로 하는 색인을 만듭니다.
+        "video_id가 파일명에 포함되는지" 확인을 URL마다 전체 파일명을 훑지 않고 한 번의 조회로 처리합니다.
+        
+        Args:
+            names: 파일명 리스트
+            
+        Returns:
+            {11글자 구간: 그 구간을 포함하는 첫 파일명}
+        """
+        index = {}
+        for name in names:
+            for start in range(len(name) - _VIDEO_ID_LENGTH + 1):
+                index.setdefault(name[start:start + _VIDEO_ID_LENGTH], name)
+        return index
+    
     def download_audio(
         self,
         url: str,
@@ -112,7 +149,7 @@ class YouTubeDownloader:
                 yt = YouTube(url)
             
             # 비디오 정보
-            video_id = self.extract_youtube_id(url)
+            video_id = yt.video_id  # YouTube 객체가 이미 URL에서 파싱한 ID 재사용
             video_len = yt.length if yt.length else 0
             channel_id = yt.channel_id if hasattr(yt, 'channel_id') else "unknown"
             channel_url = yt.channel_url if hasattr(yt, 'channel_url') else "unknown"
@@ -131,21 +168,8 @@ class YouTubeDownloader:
             full_saved_path = str(self.download_path / filename)
             
             # wav로 변환 요청된 경우
-            if convert_to_wav and not filename.lower().endswith('.wav'):
-                from audio_extractor import AudioExtractor
-                wav_path = Path(full_saved_path).with_suffix('.wav')
-                extractor = AudioExtractor(audio_format="wav")
-                try:
-                    extractor.extract_audio(
-                        video_path=Path(full_saved_path),
-                        output_folder=self.download_path
-                    )
-                    # 원본 파일 삭제 (선택적)
-                    # Path(full_saved_path).unlink()
-                    filename = wav_path.name
-                    full_saved_path = str(wav_path)
-                except Exception as e:
-                    print(f"WAV 변환 실패 (원본 파일 유지): {e}")
+            if convert_to_wav:
+                full_saved_path, filename = self.convert_to_wav(full_saved_path, filename)
             
             print(f"다운로드 완료: {filename}")
             
@@ -157,12 +181,50 @@ class YouTubeDownloader:
             traceback.print_exc()
             return None
     
+    def convert_to_wav(
+        self,
+        full_saved_path: str,
+        filename: str,
+        threads: Optional[int] = 0
+    ) -> Tuple[str, str]:
+        """
+        다운로드한 오디오 파일을 wav로 변환합니다.
+        
+        Args:
+            full_saved_path: 다운로드한 파일의 전체 경로
+            filename: 다운로드한 파일명
+            threads: ffmpeg 스레드 수
+            
+        Returns:
+            (변환된 파일 전체 경로, 변환된 파일명). 변환 실패 시 원본 그대로 반환
+        """
+        if filename.lower().endswith('.wav'):
+            return (full_saved_path, filename)
+        
+        from audio_extractor import AudioExtractor
+        wav_path = Path(full_saved_path).with_suffix('.wav')
+        extractor = AudioExtractor(audio_format="wav")
+        try:
+            extractor.extract_audio(
+                video_path=Path(full_saved_path),
+                output_folder=self.download_path,
+                threads=threads
+            )
+            # 원본 파일 삭제 (선택적)
+            # Path(full_saved_path).unlink()
+            return (str(wav_path), wav_path.name)
+        except Exception as e:
+            print(f"WAV 변환 실패 (원본 파일 유지): {e}")
+            return (full_saved_path, filename)
+    
     def download_from_csv(
         self,
         csv_path: Path,
         url_column: str = "url",
         convert_to_wav: bool = False,
-        skip_existing: bool = True
+        skip_existing: bool = True,
+        download_workers: int = 1,
+        encode_workers: int = 1
     ) -> list:
         """
         CSV 파일에서 URL 목록을 읽어서 다운로드합니다.
@@ -172,31 +234,40 @@ class YouTubeDownloader:
             url_column: URL이 있는 컬럼명
             convert_to_wav: True이면 wav 형식으로 변환
             skip_existing: True이면 이미 다운로드된 파일 건너뛰기
+            download_workers: 동시 다운로드 수 (1이면 순차 처리)
+            encode_workers: 동시 wav 변환 수 (download_workers가 1보다 클 때 사용)
             
         Returns:
             다운로드 성공한 파일 정보 리스트
         """
-        import pandas as pd
-        
         if not csv_path.exists():
             raise FileNotFoundError(f"CSV 파일을 찾을 수 없습니다: {csv_path}")
         
-        # CSV 읽기
-        try:
-            df = pd.read_csv(csv_path, encoding='utf-8-sig')
-        except:
+        # CSV 읽기 (pandas 없이 필요한 컬럼만 한 번에 읽음)
+        for encoding in ('utf-8-sig', 'cp949'):
             try:
-                df = pd.read_csv(csv_path, encoding='cp949')
-            except:
-                raise ValueError(f"CSV 파일을 읽을 수 없습니다: {csv_path}")
+                with open(csv_path, newline='', encoding=encoding) as f:
+                    reader = csv.DictReader(f)
+                    columns = reader.fieldnames or []
+                    urls = [row[url_column] for row in reader if row.get(url_column)] if url_column in columns else None
+                break
+            except UnicodeDecodeError:
+                continue
+            except csv.Error as e:
+                raise ValueError(f"CSV 파일을 읽을 수 없습니다: {csv_path}: {e}")
+        else:
+            raise ValueError(f"CSV 파일을 읽을 수 없습니다: {csv_path}")
         
-        if url_column not in df.columns:
-            raise ValueError(f"CSV에 '{url_column}' 컬럼이 없습니다. 사용 가능한 컬럼: {df.columns.tolist()}")
+        if urls is None:
+            raise ValueError(f"CSV에 '{url_column}' 컬럼이 없습니다. 사용 가능한 컬럼: {columns}")
         
-        urls = df[url_column].dropna().tolist()
         print(f"총 {len(urls)}개의 URL을 처리합니다.")
         
         downloaded_files = []
+        urls_to_download = []
+        # 건너뛰기 확인용 파일명 목록은 URL마다 glob하지 않고 한 번만 읽음
+        existing_names = os.listdir(self.download_path) if skip_existing else []
+        existing_index = self._index_id_windows(existing_names)
         
         for i, url in enumerate(urls, 1):
             print(f"\n[{i}/{len(urls)}] {url}")
@@ -206,17 +277,86 @@ class YouTubeDownloader:
                 try:
                     video_id = self.extract_youtube_id(url)
                     # 간단한 체크: video_id로 시작하는 파일이 있는지 확인
-                    existing_files = list(self.download_path.glob(f"*{video_id}*"))
-                    if existing_files:
-                        print(f"이미 다운로드된 파일이 있습니다: {existing_files[0].name}")
+                    if len(video_id) == _VIDEO_ID_LENGTH:
+                        existing_name = existing_index.get(video_id)
+                    else:
+                        existing_name = next((name for name in existing_names if video_id in name), None)
+                    if existing_name:
+                        print(f"이미 다운로드된 파일이 있습니다: {existing_name}")
                         continue
                 except:
                     pass  # URL 파싱 실패 시 계속 진행
             
+            if download_workers > 1:
+                urls_to_download.append(url)
+                continue
+            
             # 다운로드
             result = self.download_audio(url, convert_to_wav=convert_to_wav)
             
             if result:
                 downloaded_files.append(result)
         
+        if urls_to_download:
+            downloaded_files.extend(
+                self._download_pipelined(
+                    urls_to_download,
+                    convert_to_wav=convert_to_wav,
+                    download_workers=download_workers,
+                    encode_workers=encode_workers
+                )
+            )
+        
+        return downloaded_files
+    
+    def _download_pipelined(
+        self,
+        urls: list,
+        convert_to_wav: bool,
+        download_workers: int,
+        encode_workers: int
+    ) -> list:
+        """
+        다운로드(네트워크)와 wav 변환(CPU)을 별도 스레드 풀에서 겹쳐 실행합니다.
+        다운로드가 끝난 파일부터 바로 변환 풀에 넘깁니다.
+        
+        Args:
+            urls: 다운로드할 URL 리스트
+            convert_to_wav: True이면 wav 형식으로 변환
+            download_workers: 다운로드 스레드 수
+            encode_workers: 변환 스레드 수
+            
+        Returns:
+            다운로드 성공한 파일 정보 리스트
+        """
+        encode_workers = max(1, encode_workers)
+        # 변환 워커가 여러 개면 ffmpeg 내부 스레드를 1개로 제한
+        encode_threads = 1 if encode_workers > 1 else 0
+        
+        downloaded_files = []
+        with ThreadPoolExecutor(max_workers=download_workers) as download_pool, \
+             ThreadPoolExecutor(max_workers=encode_workers) as encode_pool:
+            download_futures = [
+                download_pool.submit(self.download_audio, url, False)
+                for url in urls
+            ]
+            
+            encode_futures = {}
+            for future in as_completed(download_futures):
+                result = future.result()
+                if not result:
+                    continue
+                if not convert_to_wav:
+                    downloaded_files.append(result)
+                    continue
+                full_saved_path, filename = result[0], result[1]
+                encode_future = encode_pool.submit(
+                    self.convert_to_wav, full_saved_path, filename, encode_threads
+                )
+                encode_futures[encode_future] = result
+            
+            for future in as_completed(encode_futures):
+                full_saved_path, filename = future.result()
+                downloaded_files.append((full_saved_path, filename) + encode_futures[future][2:])
+        
         return downloaded_files